@@ -1,11 +1,12 @@
 """
 Module for `Attenuator` and related classes.
 """
+import dataclasses
 import enum
 import functools
 import logging
 import time
-from typing import Generator
+from typing import Generator, Optional, Sequence
 
 import numpy as np
 import prettytable
@@ -34,6 +35,11 @@ from .utils import get_status_float, get_status_value
 from .valve import VCN, VVC
 from .variety import set_metadata
 
+try:
+    import xraydb
+except ImportError:
+    xraydb = None
+
 logger = logging.getLogger(__name__)
 MAX_FILTERS = 12
 
@@ -606,6 +612,256 @@ class AttenuatorCalculatorFilter(BaseInterface, Device):
         self.index = index
 
 
+def material_transmission(
+    material: str,
+    thickness: float,
+    energy: float,
+    density: Optional[float] = None,
+) -> float:
+    """
+    Normalized transmission of one filter, as used by the calculator IOC.
+
+    Parameters
+    ----------
+    material : str
+        The material formula (e.g., Si, C).
+
+    thickness : float
+        The filter thickness in microns.
+
+    energy : float
+        The photon energy in eV.
+
+    density : float, optional
+        The material density in g/cm^3. Defaults to the tabulated density.
+    """
+    if xraydb is None:
+        raise RuntimeError(
+            'xraydb is required to calculate filter transmissions'
+        )
+    mu = xraydb.material_mu(material, energy, density=density)
+    # mu is in 1/cm and the thickness is in microns
+    return float(np.exp(-mu * thickness * 1e-4))
+
+
+@dataclasses.dataclass(frozen=True)
+class AttenuatorSolution:
+    """
+    One filter configuration from :class:`AttenuatorSolver`.
+
+    Attributes
+    ----------
+    config : tuple of int
+        The chosen option for each axis. For independent filters this is 1
+        if the filter is inserted and 0 if it is removed.
+
+    transmission : float
+        The normalized transmission of this configuration.
+
+    energy : float
+        The photon energy used for the calculation, after bucketing.
+    """
+    config: tuple[int, ...]
+    transmission: float
+    energy: float
+
+
+class AttenuatorSolver:
+    """
+    In-process version of the calculator IOC's best configuration search.
+
+    Every combination of filter options is evaluated at once for a given
+    photon energy, and the sorted table of combined transmissions is cached
+    per energy bucket. Finding the floor or ceiling configuration for a
+    desired transmission is then a binary search, and results are cached per
+    (energy bucket, transmission, mode).
+
+    This only predicts what the IOC will choose, and never moves anything.
+    The IOC stays the authority for the actual configuration.
+
+    Parameters
+    ----------
+    options : sequence of sequence of float
+        For each axis, the transmissions of each of its options.
+        Option 0 is usually the "out" position with a transmission of 1.
+        An independent filter is ``[1.0, t]``, and a ladder blade is
+        ``[1.0, t1, t2, ...]``. Give a single option to hold an axis fixed.
+        Either this or ``filter_transmissions`` is required.
+
+    filter_transmissions : callable, optional
+        Alternatively, a function of energy that returns ``options``. This
+        is called once per energy bucket.
+
+    energy_resolution : float, optional
+        The width of the energy buckets in eV. Energies are rounded to the
+        nearest bucket before evaluating filter transmissions.
+
+    max_tables : int, optional
+        The number of energy buckets to keep tables for.
+    """
+    # Number of individual results to remember before starting over
+    max_results = 100_000
+
+    def __init__(
+        self,
+        options: Optional[Sequence[Sequence[float]]] = None,
+        *,
+        filter_transmissions=None,
+        energy_resolution: float = 1.0,
+        max_tables: int = 16,
+    ):
+        if (options is None) == (filter_transmissions is None):
+            raise ValueError(
+                'Exactly one of options or filter_transmissions is required'
+            )
+        if options is not None:
+            options = [list(opts) for opts in options]
+            self._filter_transmissions = lambda energy: options
+        else:
+            self._filter_transmissions = filter_transmissions
+        self.energy_resolution = energy_resolution
+        self._table = functools.lru_cache(maxsize=max_tables)(
+            self._build_table
+        )
+        self._results = {}
+
+    def bucket(self, energy: float) -> float:
+        """Round a photon energy to its energy bucket."""
+        if not self.energy_resolution:
+            return float(energy)
+        return float(
+            np.round(energy / self.energy_resolution) * self.energy_resolution
+        )
+
+    def _build_table(self, energy: float):
+        """Evaluate and sort every filter combination at one energy."""
+        options = [
+            np.asarray(opts, dtype=float)
+            for opts in self._filter_transmissions(energy)
+        ]
+        shape = tuple(len(opts) for opts in options)
+        # Sum the logs so a thick stack underflows to -inf, not to NaN
+        with np.errstate(divide='ignore'):
+            log_trans = np.zeros(1)
+            for opts in options:
+                log_trans = np.add.outer(log_trans, np.log(opts)).ravel()
+        order = np.argsort(log_trans, kind='stable')
+        return shape, order, np.exp(log_trans[order])
+
+    def transmissions(self, energy: float) -> np.ndarray:
+        """
+        The sorted transmissions of every configuration at this energy.
+        """
+        return self._table(self.bucket(energy))[2]
+
+    @staticmethod
+    def _search(trans: np.ndarray, desired, use_floor: bool) -> np.ndarray:
+        """Find the best indices into one sorted transmission table."""
+        if use_floor:
+            # Largest transmission at or below the desired one, or the
+            # lowest available transmission if none are low enough
+            idx = np.searchsorted(trans, desired, side='right') - 1
+            return np.clip(idx, 0, None)
+        # Smallest transmission at or above the desired one, or the
+        # highest available transmission if none are high enough
+        idx = np.searchsorted(trans, desired, side='left')
+        return np.clip(idx, None, len(trans) - 1)
+
+    def solve(
+        self,
+        transmission: float,
+        energy: float,
+        use_floor: bool = True,
+    ) -> AttenuatorSolution:
+        """
+        Find the best configuration for a desired transmission.
+
+        Parameters
+        ----------
+        transmission : float
+            The desired transmission, in the range [0, 1].
+
+        energy : float
+            The photon energy in eV.
+
+        use_floor : bool, optional
+            Select floor or ceiling transmission estimation.  Defaults to
+            floor.
+        """
+        energy = self.bucket(energy)
+        key = (energy, float(transmission), bool(use_floor))
+        try:
+            return self._results[key]
+        except KeyError:
+            pass
+        shape, order, trans = self._table(energy)
+        idx = self._search(trans, transmission, use_floor)
+        config = np.unravel_index(order[idx], shape)
+        solution = AttenuatorSolution(
+            config=tuple(int(opt) for opt in config),
+            transmission=float(trans[idx]),
+            energy=energy,
+        )
+        if len(self._results) >= self.max_results:
+            self._results.clear()
+        self._results[key] = solution
+        return solution
+
+    def solve_many(
+        self,
+        transmissions,
+        energies,
+        use_floor: bool = True,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Pre-compute the configurations for a whole scan at once.
+
+        Parameters
+        ----------
+        transmissions : array-like
+            The desired transmissions.
+
+        energies : float or array-like
+            The photon energies in eV, broadcast against ``transmissions``.
+
+        use_floor : bool, optional
+            Select floor or ceiling transmission estimation.  Defaults to
+            floor.
+
+        Returns
+        -------
+        configs : np.ndarray
+            Array of shape (n_points, n_axes) with the option for each axis.
+
+        actual : np.ndarray
+            The transmission for each configuration.
+        """
+        transmissions, energies = np.broadcast_arrays(
+            np.asarray(transmissions, dtype=float),
+            np.asarray(energies, dtype=float),
+        )
+        transmissions = transmissions.ravel()
+        buckets = np.array([self.bucket(energy) for energy in energies.ravel()])
+        flat = np.zeros(len(transmissions), dtype=int)
+        actual = np.zeros(len(transmissions))
+        shape = None
+        for energy in np.unique(buckets):
+            points = np.nonzero(buckets == energy)[0]
+            shape, order, trans = self._table(float(energy))
+            idx = self._search(trans, transmissions[points], use_floor)
+            flat[points] = order[idx]
+            actual[points] = trans[idx]
+        if shape is None:
+            return np.zeros((0, 0), dtype=int), actual
+        configs = np.stack(np.unravel_index(flat, shape), axis=-1)
+        return configs, actual
+
+    def clear(self) -> None:
+        """Forget all of the cached tables and results."""
+        self._table.cache_clear()
+        self._results.clear()
+
+
 class AttenuatorCalculatorBase(BaseInterface, Device):
     """Base class for new-style caproto IOC attenuator calculator devices."""
 
@@ -735,6 +991,8 @@ class AttenuatorCalculatorBase(BaseInterface, Device):
             index: getattr(filter_parent, attr)
             for index, attr in self._filter_index_to_attr.items()
         }
+        self._local_solver = None
+        self._solver_choices = None
 
     def get_active_config(self, **kwargs):
         """Get the active filter configuration."""
@@ -780,6 +1038,137 @@ class AttenuatorCalculatorBase(BaseInterface, Device):
         self.run_calculation.put(1, wait=True)
         return self.get_best_config(use_monitor=False)
 
+    def _filter_choices(self) -> list[list[tuple[int, Optional[Device]]]]:
+        """
+        The available (config value, filter) choices for each axis.
+
+        Inactive filters are never chosen, and stuck filters or blades stay
+        where they are.  A filter of ``None`` means nothing is inserted.
+        """
+        active_config = None
+        choices = []
+        for position, filt in enumerate(self.filters_by_index.values()):
+            if isinstance(filt, AttenuatorCalculatorSXR_Blade):
+                subs = {
+                    index: getattr(filt, attr)
+                    for index, attr in filt._filter_index_to_attr.items()
+                }
+                if filt.is_stuck.get():
+                    inserted = filt.inserted_filter_index.get()
+                    # State 1 is out, state n is filter n - 1
+                    current = inserted - 1 if inserted > 1 else 0
+                    sub = subs.get(current)
+                    choices.append([(current, sub)])
+                    continue
+                axis = [(0, None)]
+                axis.extend(
+                    (index, sub)
+                    for index, sub in subs.items()
+                    if sub.active.get() and not sub.is_stuck.get()
+                )
+            elif filt.is_stuck.get():
+                if active_config is None:
+                    active_config = self.get_active_config()
+                if active_config[position]:
+                    axis = [(1, filt)]
+                else:
+                    axis = [(0, None)]
+            elif filt.active.get():
+                axis = [(0, None), (1, filt)]
+            else:
+                axis = [(0, None)]
+            choices.append(axis)
+        return choices
+
+    def local_solver(
+        self,
+        refresh: bool = False,
+        energy_resolution: float = 1.0,
+    ) -> AttenuatorSolver:
+        """
+        Get an in-process solver for this attenuator's filters.
+
+        The filter materials, thicknesses, and active and stuck settings
+        are read once, and the solver is kept for later calls.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Read the filter settings again and start a new solver.
+
+        energy_resolution : float, optional
+            The width of the solver's energy buckets in eV, used when
+            starting a new solver.
+        """
+        if self._local_solver is not None and not refresh:
+            return self._local_solver
+
+        choices = self._filter_choices()
+        settings = [
+            [
+                (filt.material.get(), filt.thickness.get())
+                if filt is not None else None
+                for _, filt in axis
+            ]
+            for axis in choices
+        ]
+
+        def filter_transmissions(energy):
+            return [
+                [
+                    material_transmission(*setting, energy)
+                    if setting is not None else 1.0
+                    for setting in axis
+                ]
+                for axis in settings
+            ]
+
+        self._solver_choices = choices
+        self._local_solver = AttenuatorSolver(
+            filter_transmissions=filter_transmissions,
+            energy_resolution=energy_resolution,
+        )
+        return self._local_solver
+
+    def predict(self, transmission, *, energy=None, use_floor=True):
+        """
+        Predict the blade configuration for a desired transmission locally.
+
+        This does the same floor or ceiling search as :meth:`calculate`, but
+        in-process and without writing anything to the IOC.  The filter
+        settings are cached by :meth:`local_solver`.
+
+        Parameters
+        ----------
+        transmission : float
+            The desired transmission, in the range [0, 1].
+
+        energy : float, optional
+            The photon energy to use for the calculation. Defaults to the
+            reported beamline photon energy.
+
+        use_floor : bool, optional
+            Select floor or ceiling transmission estimation.  Defaults to
+            floor.
+
+        Returns
+        -------
+        config : list of int
+            The predicted configuration for each filter or blade.
+
+        transmission : float
+            The predicted transmission of that configuration.
+        """
+        solver = self.local_solver()
+        if energy is None:
+            energy = self.energy_actual.get()
+        solution = solver.solve(transmission, energy, use_floor=use_floor)
+        config = [
+            axis[option][0]
+            for axis, option in zip(self._solver_choices, solution.config)
+        ]
+        return config, solution.transmission
+
 
 class AttenuatorCalculator_AT2L0(AttenuatorCalculatorBase):
     """
@@ -1049,20 +1438,23 @@ class AttenuatorSXR_Ladder(FltMvInterface, PVPositionerPC,
         self.calculator.run_calculation.put(1, wait=True)
         return super()._setup_move(position)
 
-    def get_lightpath_state(self, use_cache=True) -> LightpathState:
+    def get_lightpath_state(
+        self,
+        use_cache: bool = True,
+        refresh: bool = False,
+    ) -> LightpathState:
         """
         Grab slightly different PV values for use in same inout calc fn
         The state is nested one device deeper than LightpathInOutCptMixin
         expects.
         """
-        if (not use_cache) or (self._cached_state is None):
+        if self._needs_lightpath_update(use_cache, refresh):
             lightpath_kwargs = {}
-            lp_sigs = self.lightpath_summary._signals.keys()
-            for sig in lp_sigs:
+            for sig, value in self._get_lightpath_values(refresh):
                 # want to get name of blade_0x from dev_blade_0x_state_state
                 cpt_name = sig.name.removeprefix(self.name + '_')
                 cpt_name = cpt_name.removesuffix('_state_state')
-                lightpath_kwargs[cpt_name] = sig.get()
+                lightpath_kwargs[cpt_name] = value
 
             self._cached_state = self.calc_lightpath_state(**lightpath_kwargs)
 
@@ -1220,20 +1612,23 @@ class AttenuatorSXR_LadderTwoBladeLBD(FltMvInterface, PVPositionerPC,
         self.calculator.run_calculation.put(1, wait=True)
         return super()._setup_move(position)
 
-    def get_lightpath_state(self, use_cache=True) -> LightpathState:
+    def get_lightpath_state(
+        self,
+        use_cache: bool = True,
+        refresh: bool = False,
+    ) -> LightpathState:
         """
         Grab slightly different PV values for use in same inout calc fn
         The state is nested one device deeper than LightpathInOutCptMixin
         expects.
         """
-        if (not use_cache) or (self._cached_state is None):
+        if self._needs_lightpath_update(use_cache, refresh):
             lightpath_kwargs = {}
-            lp_sigs = self.lightpath_summary._signals.keys()
-            for sig in lp_sigs:
+            for sig, value in self._get_lightpath_values(refresh):
                 # want to get name of blade_0x from dev_blade_0x_state_state
                 cpt_name = sig.name.removeprefix(self.name + '_')
                 cpt_name = cpt_name.removesuffix('_state_state')
-                lightpath_kwargs[cpt_name] = sig.get()
+                lightpath_kwargs[cpt_name] = value
 
             self._cached_state = self.calc_lightpath_state(**lightpath_kwargs)
 
@@ -1597,20 +1992,23 @@ class AT2L0(FltMvInterface, PVPositionerPC, LightpathMixin):
         limits = limits or (0.0, 1.0)
         super().__init__(*args, limits=limits, **kwargs)
 
-    def get_lightpath_state(self, use_cache: bool = True) -> LightpathState:
+    def get_lightpath_state(
+        self,
+        use_cache: bool = True,
+        refresh: bool = False,
+    ) -> LightpathState:
         """
         Grab slightly different PV values for use in same inout calc fn
         The state is nested one device deeper than LightpathInOutCptMixin
         expects.
         """
-        if (not use_cache) or (self._cached_state is None):
+        if self._needs_lightpath_update(use_cache, refresh):
             lightpath_kwargs = {}
-            lp_sigs = self.lightpath_summary._signals.keys()
-            for sig in lp_sigs:
+            for sig, value in self._get_lightpath_values(refresh):
                 # want to get name of blade_0x from dev_blade_0x_state_state
                 cpt_name = sig.name.removeprefix(self.name + '_')
                 cpt_name = cpt_name.removesuffix('_state_state')
-                lightpath_kwargs[cpt_name] = sig.get()
+                lightpath_kwargs[cpt_name] = value
 
             self._cached_state = self.calc_lightpath_state(**lightpath_kwargs)
 
@@ -13,7 +13,7 @@ from ophyd.signal import EpicsSignal, EpicsSignalRO, Signal
 from ophyd.status import MoveStatus
 
 from .beam_stats import BeamEnergyRequest
-from .device import GroupDevice
+from .device import ComponentAlias, GroupDevice
 from .device import UnrelatedComponent as UCpt
 from .epics_motor import IMS, EpicsMotorInterface
 from .interface import BaseInterface, FltMvInterface, LightpathMixin
@@ -993,6 +993,19 @@ class CCM(BaseInterface, GroupDevice, LightpathMixin, CCMConstantsMixin):
     y = UCpt(CCMY, add_prefix=[], kind='normal',
              doc='Combined motion of the CCM Y motors.')
 
+    # Aliases: defined by the scientists
+    x1 = ComponentAlias('x.down')
+    x2 = ComponentAlias('x.up')
+    y1 = ComponentAlias('y.down')
+    y2 = ComponentAlias('y.up_north')
+    y3 = ComponentAlias('y.up_south')
+    th2coarse = ComponentAlias('theta2coarse')
+    th2fine = ComponentAlias('theta2fine')
+    alio2E = ComponentAlias('energy.alio_to_energy')
+    E2alio = ComponentAlias('energy.energy_to_alio')
+    home = ComponentAlias('alio.home')
+    kill = ComponentAlias('alio.kill')
+
     lightpath_cpts = ['x.up.user_readback']
     tab_whitelist = ['x1', 'x2', 'y1', 'y2', 'y3', 'E', 'E_Vernier',
                      'energy_with_acr_status', 'th2fine', 'alio2E', 'E2alio',
@@ -1018,22 +1031,11 @@ class CCM(BaseInterface, GroupDevice, LightpathMixin, CCMConstantsMixin):
         self.acr_status_pv_index = kwargs.get('acr_status_suffix', 2)
         super().__init__(prefix, **kwargs)
 
-        # Aliases: defined by the scientists
-        self.x1 = self.x.down
-        self.x2 = self.x.up
-        self.y1 = self.y.down
-        self.y2 = self.y.up_north
-        self.y3 = self.y.up_south
+        # These aliases rename their readbacks, so set them up here
         self.E = self.energy.energy
         self.E.readback.name = f'{self.name}E'
         self.E_Vernier = self.energy_with_vernier.energy
         self.E_Vernier.readback.name = f'{self.name}E_Vernier'
-        self.th2coarse = self.theta2coarse
-        self.th2fine = self.theta2fine
-        self.alio2E = self.energy.alio_to_energy
-        self.E2alio = self.energy.energy_to_alio
-        self.home = self.alio.home
-        self.kill = self.alio.kill
 
         self._inserted = False
         self._removed = False
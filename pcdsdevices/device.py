@@ -1,10 +1,11 @@
 import collections
 import copy
+import functools
 from collections.abc import Iterator
 from typing import Any, Optional
 
 from ophyd.areadetector.plugins import PluginBase
-from ophyd.device import Component, Device
+from ophyd.device import Component, Device, do_not_wait_for_lazy_connection
 from ophyd.ophydobj import Kind, OphydObject
 from ophyd.pseudopos import PseudoSingle
 from ophyd.signal import AttributeSignal, DerivedSignal
@@ -271,6 +272,77 @@ def to_interface(device_class):
     )
 
 
+def defer_components(device_class, kinds=(Kind.omitted, Kind.config),
+                     include_devices=False):
+    """
+    Make a `Device` class create some of its components on first access.
+
+    Signal components of the given kinds are swapped for lazy copies, so
+    new instances skip creating (and connecting) them until they are used.
+    Components with subscription decorators are left alone, as ``ophyd``
+    creates those eagerly anyway. The class is modified in place, and
+    subclasses created afterwards inherit the lazy components.
+
+    Like the eagerly created components they replace, deferred components
+    do not wait for their connection when they are first used.
+
+    Parameters
+    ----------
+    device_class : `Device`
+        The ``ophyd`` device class to modify.
+
+    kinds : tuple of `Kind`, optional
+        The component kinds to defer. Defaults to omitted and config. Pass
+        None to defer components of any kind.
+
+    include_devices : bool, optional
+        Also defer sub-device components.
+
+    Returns
+    -------
+    device_class : `Device`
+        The same class, to allow use as a decorator.
+    """
+    for attr, cpt in list(device_class._sig_attrs.items()):
+        if (cpt.lazy or cpt._subscriptions
+                or isinstance(cpt, (ObjectComponent, InterfaceComponent))
+                or (kinds is not None and cpt.kind not in kinds)):
+            continue
+        is_device = isinstance(cpt.cls, type) and issubclass(cpt.cls, Device)
+        if not (cpt.is_signal or (include_devices and is_device)):
+            continue
+        lazy_cpt = copy.copy(cpt)
+        lazy_cpt.lazy = True
+        # Tell these apart from components that were declared lazy
+        lazy_cpt._deferred = True
+        setattr(device_class, attr, lazy_cpt)
+        device_class._sig_attrs[attr] = lazy_cpt
+    instantiate = device_class._instantiate_component
+    if not getattr(instantiate, '_handles_deferred', False):
+        device_class._instantiate_component = _instantiate_deferred(instantiate)
+    return device_class
+
+
+def _instantiate_deferred(instantiate):
+    """
+    Wrap ``Device._instantiate_component`` for classes with deferred components.
+
+    Deferred components are created without waiting for their connection,
+    as the eagerly created components they replace did not wait either.
+    Components that were declared lazy keep the ``lazy_wait_for_connection``
+    behavior.
+    """
+    @functools.wraps(instantiate)
+    def _instantiate_component(self, attr):
+        if getattr(self._sig_attrs.get(attr), '_deferred', False):
+            with do_not_wait_for_lazy_connection(self):
+                return instantiate(self, attr)
+        return instantiate(self, attr)
+
+    _instantiate_component._handles_deferred = True
+    return _instantiate_component
+
+
 class UpdateComponent(Component):
     """
     A component that copies and updates a parent component in a subclass.
@@ -367,6 +439,47 @@ class UpdateComponent(Component):
         return self.copy_cpt.create_component(instance)
 
 
+class ComponentAlias:
+    """
+    A shortcut to a component of a device or of one of its children.
+
+    This is a class attribute that looks up its target when it is used,
+    rather than an instance attribute assigned in ``__init__``. Assigning
+    ``self.ty = self.target.motor`` would create ``target`` and
+    ``target.motor`` up front, even if they are deferred and never used.
+
+    Parameters
+    ----------
+    dotted_name : str
+        The path to the target from the device, e.g. ``'target.motor'``.
+
+    Examples
+    --------
+
+    A simple usage example::
+
+        from pcdsdevices.device import ComponentAlias
+
+        class MyDevice(GroupDevice):
+            target = Cpt(IPMTarget, ':TARGET')
+            ty = ComponentAlias('target.motor')
+    """
+    def __init__(self, dotted_name: str):
+        self.dotted_name = dotted_name
+        self.__doc__ = f'Alias for ``{dotted_name}``.'
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        obj = instance
+        for part in self.dotted_name.split('.'):
+            obj = getattr(obj, part)
+        return obj
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.dotted_name!r})'
+
+
 class GroupDevice(Device):
     """
     A device that is a group of components that will act independently.
@@ -377,6 +490,10 @@ class GroupDevice(Device):
       they were instantited completely separately.
     - The parent device will be stashed in the ``biological_parent``
       attribute, in case it's needed (by something other than the RE)
+    - Components are created on first access. Until then they are left
+      out of ``walk_signals`` and connection checks, as other lazy
+      components are. Use `ComponentAlias` for shortcuts to nested
+      components so that they are not created in ``__init__``.
     - If a component is staged in a bluesky plan, it will not stage
       the ``GroupDevice``, and therefore will not stage the entire
       device tree.
@@ -415,13 +532,6 @@ class GroupDevice(Device):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Remove references to parent (in this case, self)
-        for cpt_name in self.component_names:
-            cpt = getattr(self, cpt_name)
-            # The following types break without parents
-            if not isinstance(cpt, tuple(self.needs_parent)):
-                cpt._parent = None
-                cpt.biological_parent = self
         if self.stage_group is None:
             self.stage_group = []
         else:
@@ -449,6 +559,17 @@ class GroupDevice(Device):
                         f"referenced {subcls_cpt}, which is not a Component! "
                         "Only Component types are allowed!"
                     )
+        # Independent children are only built when they are used
+        defer_components(cls, kinds=None, include_devices=True)
+
+    def _instantiate_component(self, attr):
+        cpt = super()._instantiate_component(attr)
+        # Remove references to parent (in this case, self)
+        # The following types break without parents
+        if not isinstance(cpt, tuple(self.needs_parent)):
+            cpt._parent = None
+            cpt.biological_parent = self
+        return cpt
 
     def stage_group_instances(self) -> Iterator[OphydObject]:
         """Yields an iterator of subdevices that should be staged."""
@@ -1,13 +1,15 @@
 """
 Module for LCLS's special motor records.
 """
+import contextlib
 import functools
 import logging
 import shutil
 import subprocess
+import threading
 import time
 from enum import Enum
-from typing import Callable, ClassVar, Optional
+from typing import Any, Callable, ClassVar, Optional
 
 import numpy as np
 from ophyd.device import Component as Cpt
@@ -27,6 +29,7 @@ from pcdsdevices.pv_positioner import (PVPositionerComparator,
                                        PVPositionerIsClose)
 
 from .device import UpdateComponent as UpCpt
+from .device import defer_components
 from .doc_stubs import basic_positioner_init
 from .eps import EPS
 from .interface import FltMvInterface
@@ -201,13 +204,23 @@ class EpicsMotorInterface(FltMvInterface, EpicsMotor):
 
     msta_raw = Cpt(EpicsSignalRO, '.MSTA', kind='omitted')
 
+    # Motor-health signals read from monitors in move validation and status
+    _health_attrs: ClassVar[tuple[str, ...]] = (
+        'disabled', 'low_limit_switch', 'high_limit_switch', 'msta_raw',
+    )
+
     _alarm_filter_installed: ClassVar[bool] = False
     _moved_in_session: bool
     _egu: str
+    _health: dict[str, tuple[Any, float]]
+    _health_staleness: dict[str, float]
 
     def __init__(self, *args, **kwargs):
         self._moved_in_session = False
         self._egu = ''
+        self._health = {}
+        self._health_staleness = {}
+        self._health_subscribed = False
         super().__init__(*args, **kwargs)
         self._install_motion_error_filter()
         self.motor_egu.subscribe(self._cache_egu)
@@ -291,7 +304,7 @@ Limit Switch: {switch_limits}
         Returns the msta fields as a dictionary.
         """
         # the MSTA field is a float for some reason...
-        val = int(self.msta_raw.get())
+        val = int(self._health_value('msta_raw'))
         d = dict()
         for bit in MstaEnum:
             d[bit.name] = (val >> bit.value) & 0x1
@@ -381,7 +394,7 @@ Limit Switch: {switch_limits}
                                          self.high_limit))
 
         # Find the value for the disabled attribute
-        if self.disabled.get() == 1:
+        if self._health_value('disabled') == 1:
             raise MotorDisabledError("Motor is not enabled. Motion requests "
                                      "ignored")
 
@@ -394,8 +407,8 @@ Limit Switch: {switch_limits}
         limit_switch_indicator : str
             Indicate which limit switch is activated.
         """
-        low = self.low_limit_switch.get()
-        high = self.high_limit_switch.get()
+        low = self._health_value('low_limit_switch')
+        high = self._health_value('high_limit_switch')
         if low and high:
             return "Low [x] High [x]"
         elif low:
@@ -405,6 +418,54 @@ Limit Switch: {switch_limits}
         else:
             return "Low [] High []"
 
+    def _subscribe_health(self) -> None:
+        """Start monitoring the motor-health signals."""
+        self._health_subscribed = True
+        for attr in self._health_attrs:
+            signal = getattr(self, attr)
+            signal.subscribe(self._health_changed, run=False)
+            signal.subscribe(self._health_meta_changed,
+                             event_type=signal.SUB_META, run=False)
+
+    def _health_changed(self, value=None, obj=None, **kwargs) -> None:
+        """Store a monitor update in the motor-health snapshot."""
+        self._health[obj.attr_name] = (value, time.monotonic())
+
+    def _health_meta_changed(self, obj=None, connected=True, **kwargs) -> None:
+        """Drop a motor-health value when its signal disconnects."""
+        if not connected:
+            self._health.pop(obj.attr_name, None)
+
+    def _health_value(self, attr: str) -> Any:
+        """
+        Get a motor-health value from the monitored snapshot.
+
+        The first use starts the monitors and seeds the snapshot with a get,
+        as does the first use after a disconnect. Each entry is only ever
+        replaced whole, so readers need no lock.
+        """
+        if not self._health_subscribed:
+            self._subscribe_health()
+        entry = self._health.get(attr)
+        if entry is None:
+            value = getattr(self, attr).get()
+            # Keep any monitor update that arrived during the get
+            entry = self._health.setdefault(attr, (value, time.monotonic()))
+        value, updated = entry
+        self._health_staleness[attr] = time.monotonic() - updated
+        return value
+
+    @property
+    def health_staleness(self) -> dict[str, float]:
+        """
+        Seconds since each motor-health value was updated, when last used.
+
+        The keys are the signal attribute names, e.g. ``'disabled'``. While
+        the monitor is connected, a large value only means that the signal
+        has not changed in that time.
+        """
+        return dict(self._health_staleness)
+
     def get_low_limit(self):
         """Get the low limit."""
         return self.low_limit_travel.get()
@@ -615,6 +676,8 @@ class PCDSMotorBase(EpicsMotorInterface):
     # paused and ready to resume on Go 'Paused', and to resume a move 'Go'.
     motor_spg = Cpt(EpicsSignal, '.SPG', kind='omitted')
 
+    _health_attrs = EpicsMotorInterface._health_attrs + ('motor_spg',)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.stage_sigs[self.motor_spg] = 2
@@ -665,11 +728,12 @@ class PCDSMotorBase(EpicsMotorInterface):
 
         super().check_value(value)
 
-        if self.motor_spg.get() in [0, 'Stop']:
+        spg = self._health_value('motor_spg')
+        if spg in [0, 'Stop']:
             raise MotorDisabledError("Motor is stopped.  Motion requests "
                                      "ignored until motor is set to 'Go'")
 
-        if self.motor_spg.get() in [1, 'Pause']:
+        if spg in [1, 'Pause']:
             raise MotorDisabledError("Motor is paused.  If a move is set, "
                                      "motion will resume when motor is set "
                                      "to 'Go'")
@@ -763,13 +827,24 @@ class IMS(PCDSMotorBase):
         'get_configuration_values',
         'get_current_values',
         'find_configuration',
-        'diff_configuration'
+        'diff_configuration',
+        'pmgr_report',
     ]
 
     # The singleton parameter manager object.
     _pm = None
     # If we fail to create _pm, set bool to only try once
     _pm_init_error = False
+    # Seconds before the parameter manager database is refreshed again
+    pmgr_update_ttl = 10.0
+    # Shared parameter manager session state
+    _pm_lock = threading.RLock()
+    _pm_update_db = None
+    _pm_last_update = None
+    _pm_sessions = 0
+    _pm_defer_config = False
+    _pm_pending = {}
+    _pm_failures = {}
 
     def stage(self):
         """
@@ -846,7 +921,7 @@ class IMS(PCDSMotorBase):
         Returns the msta fields as a dictionary.
         """
         # the MSTA field is a float for some reason...
-        val = int(self.msta_raw.get())
+        val = int(self._health_value('msta_raw'))
         d = dict()
         for bit in ImsMstaEnum:
             if bit.name == 'errno':
@@ -917,16 +992,19 @@ class IMS(PCDSMotorBase):
         self._stageidentity = self._extra.get('stageidentity')
         if self._stageidentity is None:
             logger.warning(f"Stage Identity has not been set for this object: {self._id}. Configure manually.")
+            IMS._pm_failures[self.name] = (self._pvbase, 'stage identity not set')
             return
         elif self._stageidentity == "NEW":
             logger.warning(f"This is a new stage, parameter manager configuration does not exist yet. Please manually configure {self._id}")
+            IMS._pm_failures[self.name] = (self._pvbase, 'new stage')
             return
+        elif IMS._pm_defer_config:
+            with IMS._pm_lock:
+                IMS._pm_pending[self.name] = (self._pvbase,
+                                              self._stageidentity)
         else:
-            try:
-                IMS._setup_and_check_pmgr()
-                self._pm.set_config(self._pvbase, self._stageidentity)
-            except Exception:
-                return
+            IMS._set_pmgr_config(self.name, self._pvbase,
+                                 self._stageidentity)
 
     def configure(self, cfgname=None):
         """
@@ -988,6 +1066,7 @@ class IMS(PCDSMotorBase):
         pv = self.prefix
         self._setup_and_check_pmgr()
 
+        # Always fresh, unless a pmgr_session is sharing refreshes
         self._pm.update_db()
         o = self._pm._search(self._pm.pm.objs, 'rec_base', pv)
         return self._pm.pm.getActualConfig(o['id'])
@@ -1071,13 +1150,213 @@ class IMS(PCDSMotorBase):
             IMS._pm_init_error = True
             return
         try:
-            IMS._pm = pmgrAPI.pmgrAPI("ims_motor", hutch)
+            IMS._install_pmgr(pmgrAPI.pmgrAPI("ims_motor", hutch))
         except Exception:
             logger.error('Failed to create IMS pmgr object!')
             logger.debug('', exc_info=True)
             IMS._pm_init_error = True
             return
 
+    @staticmethod
+    def _install_pmgr(pm):
+        """
+        Use ``pm`` as the shared parameter manager.
+
+        Inside a :meth:`pmgr_session`, its ``update_db`` is routed through
+        :meth:`update_pmgr_db` so that the pmgr calls made for each motor
+        share one database refresh.
+        """
+        with IMS._pm_lock:
+            IMS._pm_update_db = pm.update_db
+            IMS._pm_last_update = None
+            IMS._pm = pm
+            if IMS._pm_sessions:
+                pm.update_db = IMS.update_pmgr_db
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _shared_pmgr_updates():
+        """
+        Route the parameter manager's refreshes through the TTL while open.
+
+        The original ``update_db`` is put back when the last of these
+        contexts exits, so that pmgr use outside of a session always sees
+        a fresh database.
+        """
+        with IMS._pm_lock:
+            IMS._pm_sessions += 1
+            if IMS._pm_sessions == 1 and IMS._pm is not None:
+                IMS._pm_last_update = None
+                IMS._pm.update_db = IMS.update_pmgr_db
+        try:
+            yield
+        finally:
+            with IMS._pm_lock:
+                IMS._pm_sessions -= 1
+                if not IMS._pm_sessions and IMS._pm is not None:
+                    IMS._pm.update_db = IMS._pm_update_db
+
+    @staticmethod
+    def update_pmgr_db(force=False):
+        """
+        Refresh the parameter manager database.
+
+        The refresh is skipped if the last one happened less than
+        :attr:`pmgr_update_ttl` seconds ago. Inside a :meth:`pmgr_session`,
+        the parameter manager's own refreshes also go through here.
+
+        Parameters
+        ----------
+        force : bool, optional
+            Refresh even if the last refresh is recent.
+        """
+        IMS._setup_and_check_pmgr()
+        with IMS._pm_lock:
+            now = time.monotonic()
+            last = IMS._pm_last_update
+            if (force or last is None
+                    or now - last >= IMS.pmgr_update_ttl):
+                IMS._pm_update_db()
+                IMS._pm_last_update = time.monotonic()
+
+    @staticmethod
+    def _set_pmgr_config(name, pvbase, stageidentity):
+        """Apply one motor's stage configuration, recording any failure."""
+        try:
+            IMS._setup_and_check_pmgr()
+            IMS._pm.set_config(pvbase, stageidentity)
+        except Exception as ex:
+            logger.debug('Failed to set pmgr config for %s', name,
+                         exc_info=True)
+            IMS._pm_failures[name] = (pvbase, str(ex) or type(ex).__name__)
+            return False
+        IMS._pm_failures.pop(name, None)
+        return True
+
+    @staticmethod
+    @contextlib.contextmanager
+    def pmgr_session(background=False, batch_size=20):
+        """
+        Defer parameter manager configuration while loading many motors.
+
+        IMS motors created from happi inside this context queue their
+        stage configuration instead of applying it one by one. The queue is
+        applied with :meth:`apply_pmgr_configs` when the context exits.
+
+        Until the queue has been applied, the parameter manager refreshes
+        its database at most once every :attr:`pmgr_update_ttl` seconds.
+
+        Parameters
+        ----------
+        background : bool, optional
+            Apply the queued configurations in a background thread, so that
+            the session can be used before they are all done.
+
+        batch_size : int, optional
+            Number of configurations to apply between releases of the
+            pmgr lock.
+        """
+        with IMS._shared_pmgr_updates():
+            IMS._pm_defer_config = True
+            try:
+                yield
+            finally:
+                IMS._pm_defer_config = False
+                IMS.apply_pmgr_configs(background=background,
+                                       batch_size=batch_size)
+
+    @staticmethod
+    def apply_pmgr_configs(background=False, batch_size=20):
+        """
+        Apply the stage configurations queued by :meth:`pmgr_session`.
+
+        The pmgr database is refreshed once, then the configurations are
+        applied in batches. Failures are collected for :meth:`pmgr_report`.
+
+        Parameters
+        ----------
+        background : bool, optional
+            Apply the configurations in a daemon thread.
+
+        batch_size : int, optional
+            Number of configurations to apply between releases of the
+            pmgr lock.
+
+        Returns
+        -------
+        thread : threading.Thread or None
+            The background thread, if ``background`` is True.
+        """
+        with IMS._pm_lock:
+            pending = list(IMS._pm_pending.items())
+            IMS._pm_pending.clear()
+        if not pending:
+            return None
+        if background:
+            thread = threading.Thread(
+                target=IMS._apply_pmgr_configs,
+                args=(pending, batch_size),
+                name='ims_pmgr_configs',
+                daemon=True,
+            )
+            thread.start()
+            return thread
+        IMS._apply_pmgr_configs(pending, batch_size)
+        return None
+
+    @staticmethod
+    def _apply_pmgr_configs(pending, batch_size):
+        with IMS._shared_pmgr_updates():
+            IMS._apply_pmgr_batches(pending, batch_size)
+
+    @staticmethod
+    def _apply_pmgr_batches(pending, batch_size):
+        start = time.monotonic()
+        try:
+            IMS.update_pmgr_db(force=True)
+        except Exception as ex:
+            logger.error('Failed to load pmgr configurations: %s', ex)
+            logger.debug('', exc_info=True)
+            for name, (pvbase, _) in pending:
+                IMS._pm_failures[name] = (pvbase,
+                                          str(ex) or type(ex).__name__)
+            return
+        batch_size = max(int(batch_size or len(pending)), 1)
+        failed = 0
+        for index in range(0, len(pending), batch_size):
+            with IMS._pm_lock:
+                for name, (pvbase, stageidentity) in (
+                        pending[index:index + batch_size]):
+                    if not IMS._set_pmgr_config(name, pvbase, stageidentity):
+                        failed += 1
+        logger.info('Applied pmgr configurations to %d IMS motors in %.1f s '
+                    '(%d failed)', len(pending) - failed,
+                    time.monotonic() - start, failed)
+
+    @staticmethod
+    def pmgr_report(display=True):
+        """
+        Report the IMS motors whose stage configuration was not applied.
+
+        Parameters
+        ----------
+        display : bool, optional
+            Print a table. If False, return the failures instead.
+
+        Returns
+        -------
+        failures : dict
+            Maps motor names to ``(pvbase, reason)``, if ``display`` is False.
+        """
+        failures = dict(IMS._pm_failures)
+        if not display:
+            return failures
+        table = PrettyTable()
+        table.field_names = ["Motor", "PV", "Reason"]
+        for name, (pvbase, reason) in sorted(failures.items()):
+            table.add_row([name, pvbase, reason])
+        print(table)
+
     @staticmethod
     def _setup_pmgr_if_needed():
         if IMS._pm is None and not IMS._pm_init_error:
@@ -1138,7 +1417,7 @@ class Newport(PCDSMotorBase):
         Returns the msta fields as a dictionary.
         """
         # the MSTA field is a float for some reason...
-        val = int(self.msta_raw.get())
+        val = int(self._health_value('msta_raw'))
         d = dict()
         for bit in NewportMstaEnum:
             if bit.name == 'errno':
@@ -1794,29 +2073,35 @@ class PI_M824(PVPositionerIsClose):
     atol = 0.001
 
 
+# Available motor types, in order of precedence
+_motor_types = {'MMS': IMS,
+                'CLZ': IMS,
+                'CLF': IMS,
+                'MMN': Newport,
+                'MZM': PMC100,
+                'MMC': MMC100,
+                'MMB': BeckhoffAxis,
+                'PIC': PCDSMotorBase,
+                'MCS': SmarAct,
+                'MCS2': SmarAct,
+                'HEX': PI_M824}
+_motor_type_rank = {abbrev: rank for rank, abbrev in enumerate(_motor_types)}
+
+
+@functools.lru_cache(maxsize=4096)
 def _GetMotorClass(basepv):
     """
     Function to determine the appropriate motor class based on the PV.
     """
-    # Available motor types
-    motor_types = (('MMS', IMS),
-                   ('CLZ', IMS),
-                   ('CLF', IMS),
-                   ('MMN', Newport),
-                   ('MZM', PMC100),
-                   ('MMC', MMC100),
-                   ('MMB', BeckhoffAxis),
-                   ('PIC', PCDSMotorBase),
-                   ('MCS', SmarAct),
-                   ('MCS2', SmarAct),
-                   ('HEX', PI_M824))
-
-    # Search for component type in prefix
-    for cpt_abbrev, _type in motor_types:
-        if f':{cpt_abbrev}:' in basepv:
-            logger.debug("Found %r in basepv %r, loading %r",
-                         cpt_abbrev, basepv, _type)
-            return _type
+    # Component types are found between colons in the prefix
+    found = [part for part in basepv.split(':')[1:-1]
+             if part in _motor_types]
+    if found:
+        cpt_abbrev = min(found, key=_motor_type_rank.__getitem__)
+        _type = _motor_types[cpt_abbrev]
+        logger.debug("Found %r in basepv %r, loading %r",
+                     cpt_abbrev, basepv, _type)
+        return _type
     # Default to ophyd.EpicsMotor
     logger.warning("Unable to find type of motor based on component. "
                    "Using 'ophyd.EpicsMotor'")
@@ -1869,3 +2154,55 @@ def Motor(prefix, **kwargs):
     cls = _GetMotorClass(prefix)
 
     return cls(prefix, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _deferred_motor_class(cls):
+    """
+    A subclass of ``cls`` that creates its omitted and config signals on
+    first access.
+    """
+    return defer_components(
+        type(cls.__name__, (cls,), {'__module__': cls.__module__,
+                                    '__doc__': cls.__doc__})
+    )
+
+
+def Motors(prefixes, defer=True, **kwargs):
+    """
+    Load many motors at once, picking each class as :func:`Motor` does.
+
+    The classes for all of the prefixes are resolved up front, then the
+    motors are created class by class.
+
+    Parameters
+    ----------
+    prefixes : dict
+        Maps each motor name to its prefix.
+
+    defer : bool, optional
+        Use subclasses that create their omitted and config signals on
+        first access, so large numbers of motors can be loaded quickly.
+        As for eagerly created signals, the first access does not wait for
+        the signal to connect. Defaults to True.
+
+    kwargs
+        Passed to every class constructor.
+
+    Returns
+    -------
+    motors : dict
+        Maps each motor name to its motor, in the order given.
+    """
+    by_class = {}
+    for name, prefix in prefixes.items():
+        cls = _GetMotorClass(prefix)
+        if defer and issubclass(cls, EpicsMotorInterface):
+            cls = _deferred_motor_class(cls)
+        by_class.setdefault(cls, []).append((name, prefix))
+
+    created = {}
+    for cls, entries in by_class.items():
+        for name, prefix in entries:
+            created[name] = cls(prefix, name=name, **kwargs)
+    return {name: created[name] for name in prefixes}
@@ -10,7 +10,7 @@ from ophyd.device import Component as Cpt
 from ophyd.status import DeviceStatus
 from prettytable import PrettyTable
 
-from .device import GroupDevice
+from .device import ComponentAlias, GroupDevice
 from .epics_motor import IMS, BeckhoffAxis
 from .interface import BaseInterface
 from .pseudopos import (PseudoPositioner, PseudoSingleInterface,
@@ -372,6 +372,10 @@ class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
     e_eta = FCpt(PseudoSingleInterface, kind='normal', name='gon_kappa_e_eta')
     e_chi = FCpt(PseudoSingleInterface, kind='normal', name='gon_kappa_e_chi')
     e_phi = FCpt(PseudoSingleInterface, kind='normal', name='gon_kappa_e_phi')
+    # Sample adjustment motors
+    x = ComponentAlias('sample_stage.x')
+    y = ComponentAlias('sample_stage.y')
+    z = ComponentAlias('sample_stage.z')
 
     # Only stage the motors involved in the coordinate transform
     stage_group = [eta, kappa, phi]
@@ -392,9 +396,6 @@ class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
         self.phi_max_step = phi_max_step
         self.kappa_ang = kappa_ang
         super().__init__('', name=name, **kwargs)
-        self.x = self.sample_stage.x
-        self.y = self.sample_stage.y
-        self.z = self.sample_stage.z
 
     def wait(self, timeout=None):
         """Block until the action completes."""
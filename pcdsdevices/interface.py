@@ -1,22 +1,25 @@
 """
 Module for defining bell-and-whistles movement features.
 """
+import dataclasses
 import functools
 import logging
 import numbers
 import os
 import re
 import shutil
-import signal
 import subprocess
 import time
 import typing
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import as_completed
 from contextlib import contextmanager
 from pathlib import Path
-from threading import Event
-from types import MethodType, SimpleNamespace
+from threading import Event, Lock, RLock
+from types import MappingProxyType, MethodType, SimpleNamespace
 from typing import Optional
-from weakref import WeakSet
+from weakref import WeakKeyDictionary, WeakSet
 
 import ophyd
 import yaml
@@ -26,7 +29,8 @@ from ophyd import Component as Cpt
 from ophyd.device import Device
 from ophyd.ophydobj import Kind, OphydObject
 from ophyd.positioner import PositionerBase
-from ophyd.signal import AttributeSignal, Signal
+from ophyd.signal import AttributeSignal, EpicsSignalBase, Signal
+from prettytable import PrettyTable
 
 from . import utils
 from .signal import NotImplementedSignal, SummarySignal
@@ -36,6 +40,9 @@ try:
 except ImportError:
     fcntl = None
 
+# Use the libyaml loader for presets when available
+PresetLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 try:
     from elog.utils import get_primary_elog
     has_elog = True
@@ -45,6 +52,19 @@ except ImportError:
 logger = logging.getLogger(__name__)
 engineering_mode = True
 
+# Overall deadline for gathering all signal values for one status printout
+status_info_timeout = 1.0
+# Maximum number of concurrent signal gets used for status printouts
+status_info_max_workers = 16
+_status_info_executor = None
+_status_info_executor_lock = Lock()
+# Opt-in cache of signal values for status printouts
+status_snapshot = None
+# Opt-in batched evaluation of lightpath states
+lightpath_engine = None
+# Every LightpathMixin device that has its lightpath summary set up
+_lightpath_devices = WeakSet()
+
 OphydObject_whitelist = []
 BlueskyInterface_whitelist = []
 Device_whitelist = ["stop"]
@@ -373,7 +393,11 @@ class BaseInterface:
         def subdevice_filter(info):
             return bool(info['kind'] & Kind.normal)
 
-        return ophydobj_info(self, subdevice_filter=subdevice_filter)
+        pending = []
+        info = ophydobj_info(self, subdevice_filter=subdevice_filter,
+                             pending=pending)
+        fill_status_values(pending)
+        return info
 
     def post_elog_status(self):
         """
@@ -432,16 +456,230 @@ def get_kind(obj):
         return Kind.omitted
 
 
-def get_value(signal):
+def get_value(signal, timeout=0.1):
     try:
         # Minimize waiting, we aren't collecting data we're showing info
         if signal.connected:
-            return signal.get(timeout=0.1, connection_timeout=0.1)
+            return signal.get(timeout=timeout, connection_timeout=timeout)
     except Exception:
         pass
     return None
 
 
+def _get_status_info_executor():
+    """Return the shared thread pool used to gather status values."""
+    global _status_info_executor
+
+    with _status_info_executor_lock:
+        if _status_info_executor is None:
+            _status_info_executor = ThreadPoolExecutor(
+                max_workers=status_info_max_workers,
+                thread_name_prefix='status_info',
+            )
+        return _status_info_executor
+
+
+def fill_status_values(pending, timeout=None):
+    """
+    Concurrently fill in the deferred values of a status info dictionary.
+
+    All of the gets share one overall deadline. Any value that has not
+    been retrieved by the deadline is left as `None`, just like a signal
+    that failed to connect.
+
+    Parameters
+    ----------
+    pending : list of (callable, dict, str)
+        Deferred getters, the status info dictionaries they belong to, and
+        the key to store the result under. These are created by passing a
+        ``pending`` list into `ophydobj_info`.
+
+    timeout : float, optional
+        The overall deadline in seconds. Defaults to the module-level
+        ``status_info_timeout``.
+    """
+    if not pending:
+        return
+    if timeout is None:
+        timeout = status_info_timeout
+    if len(pending) == 1:
+        func, info, key = pending[0]
+        info[key] = func()
+        return
+
+    deadline = time.monotonic() + timeout
+    executor = _get_status_info_executor()
+    futures = {
+        executor.submit(func): (info, key)
+        for func, info, key in pending
+    }
+    try:
+        for future in as_completed(
+            futures, timeout=max(deadline - time.monotonic(), 0)
+        ):
+            info, key = futures[future]
+            info[key] = future.result()
+    except FutureTimeoutError:
+        logger.debug('Timed out gathering status values, %d of %d missing',
+                     sum(not fut.done() for fut in futures), len(futures))
+        for future in futures:
+            future.cancel()
+
+
+def signal_is_monitored(signal):
+    """
+    Return `True` if the signal's readback is kept current by a monitor.
+
+    This is the case for EPICS signals that already have a value
+    subscription, e.g. from a typhos screen, lightpath, or an
+    `AggregateSignal`.
+    """
+    if not isinstance(signal, EpicsSignalBase):
+        return False
+    try:
+        return signal._monitors.get(signal._read_pvname) is not None
+    except AttributeError:
+        return False
+
+
+@dataclasses.dataclass
+class _SnapshotEntry:
+    """One cached value held by a `StatusSnapshot`."""
+    #: The cached value
+    value: typing.Any
+    #: The timestamp of the value as reported by the signal
+    timestamp: Optional[float]
+    #: The time.monotonic() time at which we obtained the value
+    retrieved: float
+    #: True if the value came from a running monitor
+    from_monitor: bool
+
+
+class StatusSnapshot:
+    """
+    Cache of signal values for use in status printouts.
+
+    Signals that already have a monitor running are read directly from
+    their monitored readback without any network traffic. Any other signal
+    is read through a channel access get at most once per ``max_age``
+    seconds, with the last result shared between all status requests.
+
+    Enable this for all `BaseInterface` devices with
+    `set_status_snapshot`.
+
+    Parameters
+    ----------
+    max_age : float, optional
+        The staleness bound in seconds. Values obtained from a get are
+        reused until they are older than this. Values from a running monitor
+        on a connected signal are always current.
+    """
+
+    max_age: float
+    hits: int
+    misses: int
+
+    def __init__(self, max_age: float = 1.0):
+        self.max_age = max_age
+        self._lock = Lock()
+        self._entries = WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def get_value(self, signal, timeout=0.1):
+        """
+        Get a value for a status printout, preferring cached values.
+
+        Parameters
+        ----------
+        signal : Signal
+            The signal to get a value for.
+
+        timeout : float, optional
+            Timeout to use if we need to fall back to a network get.
+        """
+        try:
+            connected = signal.connected
+        except Exception:
+            connected = False
+        if not connected:
+            with self._lock:
+                self._entries.pop(signal, None)
+            return None
+
+        now = time.monotonic()
+        if signal_is_monitored(signal):
+            value = signal._fix_type(signal._readback)
+            self._store(signal, value, now, from_monitor=True)
+            with self._lock:
+                self.hits += 1
+            return value
+
+        with self._lock:
+            entry = self._entries.get(signal)
+            if entry is not None and now - entry.retrieved <= self.max_age:
+                self.hits += 1
+                return entry.value
+            self.misses += 1
+
+        value = get_value(signal, timeout=timeout)
+        if value is not None:
+            self._store(signal, value, now, from_monitor=False)
+        return value
+
+    def _store(self, signal, value, now, from_monitor):
+        try:
+            timestamp = signal.timestamp
+        except Exception:
+            timestamp = None
+        with self._lock:
+            self._entries[signal] = _SnapshotEntry(
+                value=value,
+                timestamp=timestamp,
+                retrieved=now,
+                from_monitor=from_monitor,
+            )
+
+    def age(self, signal) -> Optional[float]:
+        """
+        Seconds since the cached value for ``signal`` was obtained.
+
+        Returns `None` if there is no cached value.
+        """
+        with self._lock:
+            entry = self._entries.get(signal)
+        if entry is None:
+            return None
+        return time.monotonic() - entry.retrieved
+
+    def clear(self):
+        """Drop all cached values."""
+        with self._lock:
+            self._entries.clear()
+
+
+def get_position(device):
+    try:
+        position = device.position
+    except Exception:
+        # Something went wrong! We have a position but it didn't work
+        return 'ERROR'
+    try:
+        if not isinstance(position, numbers.Integral):
+            # Give a floating point value, if possible, when not integral
+            position = float(position)
+    except Exception:
+        ...
+    return position
+
+
+def get_preset_state(device):
+    try:
+        return device.presets.state()
+    except Exception:
+        return 'ERROR'
+
+
 def get_units(signal):
     attrs = ('derived_units', 'units', 'egu')
     for attr in attrs:
@@ -453,19 +691,27 @@ def get_units(signal):
             ...
 
 
-def ophydobj_info(obj, subdevice_filter=None, devices=None):
+def ophydobj_info(obj, subdevice_filter=None, devices=None, pending=None):
+    """
+    Build the nested status information dictionary for any ophyd object.
+
+    If a ``pending`` list is provided, values that require gets are not
+    retrieved here. Instead, the deferred getters are appended to
+    ``pending`` so that all values can be gathered at once by
+    `fill_status_values`.
+    """
     if isinstance(obj, Signal):
-        return signal_info(obj)
+        return signal_info(obj, pending=pending)
     elif isinstance(obj, Device):
         return device_info(obj, subdevice_filter=subdevice_filter,
-                           devices=devices)
+                           devices=devices, pending=pending)
     elif isinstance(obj, PositionerBase):
         return positionerbase_info(obj)
     else:
         return {}
 
 
-def device_info(device, subdevice_filter=None, devices=None):
+def device_info(device, subdevice_filter=None, devices=None, pending=None):
     if devices is None:
         devices = set()
     name = get_name(device, default='device')
@@ -479,27 +725,24 @@ def device_info(device, subdevice_filter=None, devices=None):
     except AttributeError:
         has_presets = False
     if has_presets:
-        try:
-            info['preset'] = device.presets.state()
-        except Exception:
-            info['preset'] = 'ERROR'
+        if pending is None:
+            info['preset'] = get_preset_state(device)
+        else:
+            info['preset'] = None
+            pending.append(
+                (functools.partial(get_preset_state, device), info, 'preset')
+            )
 
-    try:
+    if hasattr(type(device), 'position'):
         # Extra key for positioners
         # This has ordered dict priority over everything but the preset state
-        info['position'] = device.position
-    except AttributeError:
-        pass
-    except Exception:
-        # Something else went wrong! We have a position but it didn't work
-        info['position'] = 'ERROR'
-    else:
-        try:
-            if not isinstance(info['position'], numbers.Integral):
-                # Give a floating point value, if possible, when not integral
-                info['position'] = float(info['position'])
-        except Exception:
-            ...
+        if pending is None:
+            info['position'] = get_position(device)
+        else:
+            info['position'] = None
+            pending.append(
+                (functools.partial(get_position, device), info, 'position')
+            )
 
     try:
         # Best-effort try at getting the units
@@ -512,8 +755,16 @@ def device_info(device, subdevice_filter=None, devices=None):
         for cpt_name, cpt_desc in device._sig_attrs.items():
             # Skip lazy signals outright in all cases
             # Usually these are lazy because they take too long to getattr
+            # Components deferred only to speed up startup are still shown,
+            # but are not created just to be filtered out
             if cpt_desc.lazy:
-                continue
+                if not getattr(cpt_desc, '_deferred', False):
+                    continue
+                if cpt_name not in device._signals and not (
+                    callable(subdevice_filter)
+                    and subdevice_filter(dict(kind=cpt_desc.kind))
+                ):
+                    continue
             # Skip attribute signals
             # Indeterminate get times, no real connected bool, etc.
             if issubclass(cpt_desc.cls, AttributeSignal):
@@ -529,30 +780,47 @@ def device_info(device, subdevice_filter=None, devices=None):
                 logger.debug(f'Getattr {name}.{cpt_name} failed.',
                              exc_info=True)
                 continue
+            n_pending = len(pending) if pending is not None else 0
             cpt_info = ophydobj_info(cpt, subdevice_filter=subdevice_filter,
-                                     devices=devices)
+                                     devices=devices, pending=pending)
             if 'position' in info:
                 # Drop some potential duplicate keys for positioners
                 try:
                     if cpt.name == cpt.parent.name:
-                        continue
+                        cpt_info = None
                 except AttributeError:
                     pass
                 if cpt_name in ('readback', 'user_readback'):
-                    continue
+                    cpt_info = None
 
-            if not callable(subdevice_filter) or subdevice_filter(cpt_info):
+            if cpt_info is not None and (
+                not callable(subdevice_filter) or subdevice_filter(cpt_info)
+            ):
                 info[cpt_name] = cpt_info
+            elif pending is not None:
+                # Don't bother getting values that will not be shown
+                del pending[n_pending:]
     return info
 
 
-def signal_info(signal):
+def signal_info(signal, pending=None):
     name = get_name(signal, default='signal')
     kind = get_kind(signal)
-    value = get_value(signal)
     units = get_units(signal)
-    return dict(name=name, kind=kind, is_device=False, value=value,
+    info = dict(name=name, kind=kind, is_device=False, value=None,
                 units=units)
+    if status_snapshot is None:
+        getter = get_value
+    else:
+        getter = status_snapshot.get_value
+    if pending is None:
+        info['value'] = getter(signal)
+    else:
+        pending.append(
+            (functools.partial(getter, signal, timeout=status_info_timeout),
+             info, 'value')
+        )
+    return info
 
 
 def positionerbase_info(positioner):
@@ -562,6 +830,41 @@ def positionerbase_info(positioner):
                 position=positioner.position)
 
 
+def set_status_snapshot(max_age=1.0):
+    """
+    Enable or disable the shared `StatusSnapshot` for status printouts.
+
+    Parameters
+    ----------
+    max_age : float or None, optional
+        The staleness bound in seconds for values that are not monitored.
+        Pass `None` to disable the snapshot and always use fresh gets.
+
+    Returns
+    -------
+    snapshot : StatusSnapshot or None
+        The new snapshot, if enabled.
+    """
+    global status_snapshot
+    if max_age is None:
+        status_snapshot = None
+    else:
+        status_snapshot = StatusSnapshot(max_age=max_age)
+    return status_snapshot
+
+
+def get_status_snapshot():
+    """
+    Get the `StatusSnapshot` set by :meth:`set_status_snapshot`.
+
+    Returns
+    -------
+    snapshot : StatusSnapshot or None
+        The active snapshot, or `None` if disabled.
+    """
+    return status_snapshot
+
+
 def set_engineering_mode(expert):
     """
     Switches between expert and user modes for :class:`BaseInterface` features.
@@ -758,7 +1061,7 @@ class FltMvInterface(MvInterface):
         return super().__dir__()
 
     def __getattribute__(self, name: str):
-        if (any((name.startswith(prefix)) for prefix in ['mv_', 'wm_', 'umv_'])
+        if (name.startswith(('mv_', 'wm_', 'umv_'))
                 and self.presets.sync_needed()):
             self.presets.sync()
 
@@ -915,6 +1218,165 @@ class FltMvInterface(MvInterface):
         self.set_current_position(position)
 
 
+class PresetFileCache:
+    """
+    Parsed preset files, shared between all :class:`Presets` instances.
+
+    Each file is keyed on its modification time and size, so a file is only
+    parsed again after it has changed on disk.
+
+    Attributes
+    ----------
+    loads : int
+        The number of times a file has been parsed.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._files = {}
+        self._listings = None
+        self.loads = 0
+
+    @staticmethod
+    def scan(directory) -> dict[str, tuple[int, int]]:
+        """
+        List the keys of all of the preset files in a directory in one pass.
+
+        Parameters
+        ----------
+        directory : str or Path
+            The preset directory.
+
+        Returns
+        -------
+        listing : dict
+            Mapping of file name to (modification time in ns, size).
+        """
+        listing = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.yml') and entry.is_file():
+                        stat = entry.stat()
+                        listing[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            logger.debug('No preset directory %s', directory)
+        return listing
+
+    @contextmanager
+    def scanned(self, directories):
+        """
+        Use a single directory listing for all of the lookups in this block.
+
+        Parameters
+        ----------
+        directories : iterable of str or Path
+            The preset directories to list.
+        """
+        self._listings = {
+            Path(directory): self.scan(directory)
+            for directory in directories
+        }
+        try:
+            yield
+        finally:
+            self._listings = None
+
+    def key(self, path: Path) -> Optional[tuple[int, int]]:
+        """
+        Get the (modification time in ns, size) of a preset file.
+
+        Returns None if the file does not exist.
+        """
+        listings = self._listings
+        if listings is not None and path.parent in listings:
+            return listings[path.parent].get(path.name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def load(self, path: Path, timeout: float = 1.0):
+        """
+        Get the parsed contents of a preset file.
+
+        The file is only parsed if it has changed since it was last parsed.
+        It is read under a shared file lock, so a reader never sees a
+        partial write from :meth:`Presets._write`, but readers do not block
+        each other. The lock is only held while reading, not while parsing.
+
+        Parameters
+        ----------
+        path : Path
+            The preset file.
+
+        timeout : float, optional
+            How long to wait for a writer to finish.
+
+        Returns
+        -------
+        key, data : tuple
+            The (modification time in ns, size) of the file as it was read,
+            and its parsed contents.
+
+        Raises
+        ------
+        BlockingIOError
+            If the file is still locked for writing after the timeout.
+        """
+        with open(path, 'r') as fd:
+            if fcntl is not None:
+                _flock_with_timeout(
+                    fd, time.monotonic() + timeout, fcntl.LOCK_SH
+                )
+            stat = os.fstat(fd.fileno())
+            key = (stat.st_mtime_ns, stat.st_size)
+            with self._lock:
+                cached = self._files.get(path)
+            if cached is not None and cached[0] == key:
+                return cached
+            text = fd.read()
+        logger.debug('parse presets file %s', path)
+        data = yaml.load(text, Loader=PresetLoader) or {}
+        with self._lock:
+            self._files[path] = (key, data)
+            self.loads += 1
+        return key, data
+
+    def clear(self):
+        """Forget all of the parsed files."""
+        with self._lock:
+            self._files.clear()
+
+
+def _flock_with_timeout(fd, deadline: float, operation=None) -> None:
+    """
+    Take a lock on a file, polling until a deadline.
+
+    The lock is exclusive unless another ``operation`` such as
+    ``fcntl.LOCK_SH`` is given.
+
+    Raises
+    ------
+    BlockingIOError
+        If the lock is still held elsewhere at the deadline.
+    """
+    if operation is None:
+        operation = fcntl.LOCK_EX
+    delay = 0.001
+    while True:
+        try:
+            fcntl.flock(fd, operation | fcntl.LOCK_NB)
+            return
+        except BlockingIOError:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.02)
+
+
 def setup_preset_paths(defer_loading: bool = False, **paths):
     """
     Prepare the :class:`Presets` class.
@@ -934,8 +1396,9 @@ def setup_preset_paths(defer_loading: bool = False, **paths):
     Presets._paths = {}
     for k, v in paths.items():
         Presets._paths[k] = Path(v)
-    for preset in Presets._registry:
-        preset.sync(defer_loading=defer_loading)
+    with Presets._file_cache.scanned(Presets._paths.values()):
+        for preset in Presets._registry:
+            preset.sync(defer_loading=defer_loading)
 
 
 class Presets:
@@ -964,11 +1427,15 @@ class Presets:
 
     _registry = WeakSet()
     _paths = {}
+    _file_cache = PresetFileCache()
+    # How long to wait for other writers before giving up
+    _lock_timeout = 1.0
 
     def __init__(self, device):
         self._device = device
         self._methods = []
         self._fd = None
+        self._lock = RLock()
         self._registry.add(self)
         self.name = device.name + '_presets'
         self._mtimes = {}
@@ -985,7 +1452,7 @@ class Presets:
         logger.debug('read presets for %s', self._device.name)
         with self._file_open_rlock(preset_type) as f:
             f.seek(0)
-            return yaml.full_load(f) or {}
+            return yaml.load(f, Loader=PresetLoader) or {}
 
     def _write(self, preset_type, data):
         """
@@ -998,55 +1465,56 @@ class Presets:
             f.truncate()
 
     @contextmanager
-    def _file_open_rlock(self, preset_type, timeout=1.0):
+    def _file_open_rlock(self, preset_type, timeout=None):
         """
         File locking context manager for this object.
 
         Works like threading.Rlock in that you can acquire it multiple times
-        safely.
+        safely from the same thread. Other threads wait for their turn.
+
+        The file lock is polled without blocking, backing off between
+        attempts, rather than interrupting a blocking call with a signal.
+        This lets presets be updated from any thread.
 
         Parameters
         ----------
-        fd : file
-            The file descriptor to lock on.
+        preset_type : str
+            The preset type whose file we should lock.
+
+        timeout : float, optional
+            How long to wait for the lock before giving up. Defaults to
+            ``_lock_timeout``.
 
         Raises
         ------
         BlockingIOError
             If we cannot acquire the file lock.
         """
-
-        if self._fd is None:
+        if timeout is None:
+            timeout = self._lock_timeout
+        deadline = time.monotonic() + timeout
+        if not self._lock.acquire(timeout=timeout):
+            raise BlockingIOError(
+                f'Timed out waiting for {self.name} in another thread'
+            )
+        try:
+            if self._fd is not None:
+                logger.debug('using already open file descriptor')
+                yield self._fd
+                return
             path = self._path(preset_type)
             with open(path, 'r+') as fd:
-                # Set up file lock timeout with a raising handler
-                # We will need this handler due to PEP 475
-                def interrupt(signum, frame):
-                    raise InterruptedError()
-
-                old_handler = signal.signal(signal.SIGALRM, interrupt)
-                try:
-                    signal.setitimer(signal.ITIMER_REAL, timeout)
-                    fcntl.flock(fd, fcntl.LOCK_EX)
-                except InterruptedError:
-                    # Ignore interrupted and proceed to cleanup
-                    pass
-                finally:
-                    # Clean up file lock timeout
-                    signal.setitimer(signal.ITIMER_REAL, 0)
-                    signal.signal(signal.SIGALRM, old_handler)
-                # Error now if we still can't get the lock.
-                # Getting lock twice is safe.
-                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                _flock_with_timeout(fd, deadline)
                 logger.debug('acquired lock for %s', path)
                 self._fd = fd
-                yield fd
-                fcntl.flock(fd, fcntl.LOCK_UN)
-                logger.debug('released lock for %s', path)
-            self._fd = None
-        else:
-            logger.debug('using already open file descriptor')
-            yield self._fd
+                try:
+                    yield fd
+                finally:
+                    self._fd = None
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                    logger.debug('released lock for %s', path)
+        finally:
+            self._lock.release()
 
     def _update(self, preset_type, name, value=None, comment=None,
                 active=True):
@@ -1101,24 +1569,41 @@ class Presets:
     def sync(self, defer_loading: bool = False):
         """Synchronize the presets with the database."""
         logger.debug('call %s presets.sync()', self._device.name)
-        self._remove_methods()
-        self._cache = {}
-        self._mtimes = {}
+        with self._lock:
+            self._sync(defer_loading=defer_loading)
+
+    def _sync(self, defer_loading: bool = False):
+        """Synchronize the presets, with the instance lock held."""
+        # Other threads can use the presets while we sync, so build
+        # everything up first and then swap it in.
+        cache = {}
+        mtimes = {}
         # only consult files if requested
         if not defer_loading:
             logger.debug('filling %s cache', self.name)
             for preset_type in self._paths.keys():
                 path = self._path(preset_type)
-                if path.exists():
-                    self._mtimes[preset_type] = os.path.getmtime(path)
+                key = self._file_cache.key(path)
+                if key is not None:
+                    mtimes[preset_type] = key
                     try:
-                        self._cache[preset_type] = self._read(preset_type)
+                        key, data = self._file_cache.load(
+                            path, timeout=self._lock_timeout
+                        )
                     except BlockingIOError:
                         self._log_flock_error()
+                        continue
+                    mtimes[preset_type] = key
+                    cache[preset_type] = data
                 else:
                     logger.debug('No %s preset file for %s',
                                  preset_type, self._device.name)
+        self._cache = cache
+        self._mtimes = mtimes
+        old_methods = self._methods
+        self._methods = []
         self._create_methods()
+        self._remove_methods(old_methods)
 
     def _log_flock_error(self):
         logger.error(('Unable to acquire file lock for %s. '
@@ -1143,6 +1628,7 @@ class Presets:
         """
 
         logger.debug('call %s presets._create_methods()', self._device.name)
+        positions = SimpleNamespace()
         for preset_type in self._paths.keys():
             add, add_here = self._make_add(preset_type)
             self._register_method(self, 'add_' + preset_type, add)
@@ -1155,8 +1641,9 @@ class Presets:
                     self._register_method(self._device, 'mv_' + name, mv)
                     self._register_method(self._device, 'umv_' + name, umv)
                     self._register_method(self._device, 'wm_' + name, wm)
-                    setattr(self._positions, name,
+                    setattr(positions, name,
                             PresetPosition(self, preset_type, name))
+        self._positions = positions
 
     def _register_method(self, obj, method_name, method):
         """
@@ -1304,18 +1791,29 @@ class Presets:
         wm_pre.__doc__ = wm_pre.__doc__.format(name)
         return wm_pre
 
-    def _remove_methods(self):
-        """Remove all methods created in the last call to _create_methods."""
+    def _remove_methods(self, methods=None):
+        """
+        Remove methods created by an earlier call to _create_methods.
+
+        By default, this removes all of the current methods. If a list of
+        older ``methods`` is given, only the ones that have not been created
+        again since are removed.
+        """
         logger.debug('call %s presets._remove_methods()', self._device.name)
-        for obj, method_name in self._methods:
+        if methods is None:
+            methods = self._methods
+            self._methods = []
+            self._positions = SimpleNamespace()
+        current = {(id(obj), method_name) for obj, method_name in self._methods}
+        for obj, method_name in methods:
+            if (id(obj), method_name) in current:
+                continue
             try:
                 delattr(obj, method_name)
             except AttributeError:
                 pass
             if hasattr(obj, '_tab'):
                 obj._tab.remove(method_name)
-        self._methods = []
-        self._positions = SimpleNamespace()
 
     @property
     def has_presets(self):
@@ -1350,9 +1848,9 @@ class Presets:
         """True if this preset has fallen out of sync with backing files"""
         curr_mtimes = {}
         for preset_type in self._paths.keys():
-            preset_path = self._path(preset_type)
-            if preset_path.exists():
-                curr_mtimes[preset_type] = os.path.getmtime(preset_path)
+            key = self._file_cache.key(self._path(preset_type))
+            if key is not None:
+                curr_mtimes[preset_type] = key
 
         return not curr_mtimes == self._mtimes
 
@@ -1755,6 +2253,8 @@ class LightpathMixin(Device):
         self._retry_lightpath = True
         self._summary_initialized = False
         self._cached_state = None
+        # Set when a LightpathEngine has queued an update not yet evaluated
+        self._lightpath_pending = False
         self._md = None
 
         super().__init__(*args, **kwargs)
@@ -1769,6 +2269,7 @@ class LightpathMixin(Device):
             for sig in self.lightpath_cpts:
                 self.lightpath_summary.add_signal_by_attr_name(sig)
 
+            _lightpath_devices.add(self)
             self.lightpath_summary.subscribe(self._calc_cache_lightpath_state,
                                              run=False)
 
@@ -1806,29 +2307,70 @@ class LightpathMixin(Device):
             'a ``calc_lightpath_state`` method.'
         )
 
-    def get_lightpath_state(self, use_cache: bool = True) -> LightpathState:
+    def get_lightpath_state(
+        self,
+        use_cache: bool = True,
+        refresh: bool = False,
+    ) -> LightpathState:
         """
         Return the current LightpathState
 
+        The state is calculated from the values cached by
+        ``lightpath_summary``, which its subscriptions keep up to date.
+
+        Parameters
+        ----------
+        use_cache : bool, optional
+            Return the last calculated state, if there is one.
+        refresh : bool, optional
+            Read every lightpath signal rather than use the cached values.
+            This implies ``use_cache=False``.
+
         Returns
         -------
         LightpathState
             a dataclass containing the Lightpath state
         """
-        if (not use_cache) or (self._cached_state is None):
+        if self._needs_lightpath_update(use_cache, refresh):
             self.log.debug('calculating new LightpathState')
-            kwargs = {sig.name.removeprefix(self.name + '_'): sig.get()
-                      for sig in self.lightpath_summary._signals}
+            kwargs = {sig.name.removeprefix(self.name + '_'): value
+                      for sig, value in self._get_lightpath_values(refresh)}
             self._cached_state = self.calc_lightpath_state(**kwargs)
 
         return self._cached_state
 
+    def _needs_lightpath_update(self, use_cache: bool, refresh: bool) -> bool:
+        """
+        Check if ``get_lightpath_state`` must calculate a new state.
+
+        A state that a `LightpathEngine` has not evaluated since the last
+        update is out of date, so it is calculated here rather than left
+        until the next batch.  This clears the pending flag.
+        """
+        if self._lightpath_pending:
+            self._lightpath_pending = False
+            return True
+        return refresh or (not use_cache) or (self._cached_state is None)
+
+    def _get_lightpath_values(self, refresh: bool = False):
+        """The (signal, value) pairs of ``lightpath_summary``."""
+        return self.lightpath_summary.get_cached_values(
+            refresh=refresh).items()
+
     def _calc_cache_lightpath_state(self, *args, **kwargs) -> None:
         """
         Calculate the lightpath state and cache it.
         Intended for use as a callback subscribed to lightpath_summary
+
+        If a `LightpathEngine` is active, this is left to its next batch,
+        unless ``get_lightpath_state`` is called before then.
         """
-        self.get_lightpath_state(use_cache=False)
+        engine = lightpath_engine
+        if engine is not None:
+            self._lightpath_pending = True
+            engine.mark_changed(self)
+        else:
+            self.get_lightpath_state(use_cache=False)
 
     @property
     def md(self):
@@ -1914,15 +2456,20 @@ class LightpathInOutCptMixin(LightpathMixin):
         for sig in self.lightpath_cpts:
             self.lightpath_summary.add_signal_by_attr_name(sig + '.state')
 
+        _lightpath_devices.add(self)
         self.lightpath_summary.subscribe(self._calc_cache_lightpath_state)
 
-    def get_lightpath_state(self, use_cache: bool = True) -> LightpathState:
-        if (not use_cache) or (self._cached_state is None):
+    def get_lightpath_state(
+        self,
+        use_cache: bool = True,
+        refresh: bool = False,
+    ) -> LightpathState:
+        if self._needs_lightpath_update(use_cache, refresh):
             kwargs = {}
-            for sig in self.lightpath_summary._signals:
+            for sig, value in self._get_lightpath_values(refresh):
                 parent = sig.parent or sig.biological_parent
                 sig_name = parent.name.removeprefix(self.name + '_')
-                kwargs[sig_name] = sig.get()
+                kwargs[sig_name] = value
 
             state = self.calc_lightpath_state(**kwargs)
             self._cached_state = state
@@ -1967,3 +2514,299 @@ class LightpathInOutCptMixin(LightpathMixin):
             removed=self._removed,
             output={self.output_branches[0]: self._transmission}
         )
+
+
+@dataclasses.dataclass
+class LightpathTiming:
+    """
+    Statistics on the ``calc_lightpath_state`` calls of one device.
+
+    Attributes
+    ----------
+    calls : int
+        The number of evaluations.
+    total : float
+        The total evaluation time in seconds.
+    last : float
+        The duration of the latest evaluation in seconds.
+    longest : float
+        The duration of the slowest evaluation in seconds.
+    errors : int
+        The number of evaluations that raised.
+    """
+    calls: int = 0
+    total: float = 0.0
+    last: float = 0.0
+    longest: float = 0.0
+    errors: int = 0
+
+    @property
+    def mean(self) -> float:
+        """The average evaluation time in seconds."""
+        return self.total / self.calls if self.calls else 0.0
+
+    def record(self, elapsed: float) -> None:
+        self.calls += 1
+        self.total += elapsed
+        self.last = elapsed
+        self.longest = max(self.longest, elapsed)
+
+
+@dataclasses.dataclass(frozen=True)
+class LightpathSnapshot:
+    """
+    The lightpath states of every evaluated device at one point in time.
+
+    States of devices that did not change are shared with the previous
+    snapshot, so comparing two snapshots is mostly identity checks.
+
+    Attributes
+    ----------
+    version : int
+        Increases by one for each published snapshot.
+    timestamp : float
+        The ``time.time()`` at which the snapshot was published.
+    states : mapping of str to LightpathState
+        The latest state of each device, by device name.
+    changed : frozenset of str
+        The devices whose state differs from the previous snapshot.
+    """
+    version: int
+    timestamp: float
+    states: typing.Mapping[str, LightpathState]
+    changed: frozenset = frozenset()
+
+    def diff(self, other: Optional['LightpathSnapshot']) -> set[str]:
+        """
+        Find the devices whose state differs from another snapshot.
+
+        Parameters
+        ----------
+        other : LightpathSnapshot or None
+            The snapshot to compare with. None compares with an empty one.
+
+        Returns
+        -------
+        names : set of str
+            The names of devices that were added, removed or changed.
+        """
+        if other is None:
+            return set(self.states)
+        names = set(self.states).symmetric_difference(other.states)
+        for name, state in self.states.items():
+            old_state = other.states.get(name)
+            if old_state is not None and old_state is not state \
+                    and old_state != state:
+                names.add(name)
+        return names
+
+
+class LightpathEngine:
+    """
+    Batched evaluation of the lightpath states of all devices.
+
+    Without an engine, every `LightpathMixin` device recalculates its
+    `LightpathState` from its own summary signal callback, on every update.
+    While an engine is active, those callbacks only mark the device as
+    changed. Changed devices are evaluated together once per ``period``,
+    each one once no matter how many of its signals updated, and the
+    results are published as one `LightpathSnapshot`. Calling
+    ``get_lightpath_state`` on a changed device before its batch runs
+    evaluates it right away, so readers never see an outdated state.
+
+    Enable this for all `LightpathMixin` devices with
+    `set_lightpath_engine`.
+
+    Parameters
+    ----------
+    period : float, optional
+        Seconds to collect updates for before evaluating a batch.
+    """
+
+    period: float
+    batches: int
+    snapshot: LightpathSnapshot
+
+    def __init__(self, period: float = 0.1):
+        self.period = period
+        self._lock = RLock()
+        self._changed = {}
+        self._batch_queued = False
+        self._states = {}
+        self._timing = {}
+        self._callbacks = {}
+        self._next_cid = 0
+        self.batches = 0
+        self.snapshot = LightpathSnapshot(version=0, timestamp=time.time(),
+                                          states=MappingProxyType({}))
+
+    @property
+    def devices(self) -> list:
+        """Every `LightpathMixin` device with its lightpath set up."""
+        return [device for device in list(_lightpath_devices)
+                if not device._destroyed]
+
+    def mark_changed(self, device) -> None:
+        """
+        Queue a device for evaluation in the next batch.
+
+        Parameters
+        ----------
+        device : LightpathMixin
+            The device whose lightpath inputs changed.
+        """
+        with self._lock:
+            self._changed[device.name] = device
+            if self._batch_queued:
+                return
+            self._batch_queued = True
+        utils.schedule_task(self._run_batch, delay=self.period or None)
+
+    def mark_all_changed(self) -> None:
+        """Queue every registered device for evaluation."""
+        for device in self.devices:
+            self.mark_changed(device)
+
+    def _run_batch(self) -> None:
+        with self._lock:
+            self._batch_queued = False
+        self.flush()
+
+    def flush(self) -> LightpathSnapshot:
+        """
+        Evaluate the changed devices now rather than on the next batch.
+
+        Returns
+        -------
+        snapshot : LightpathSnapshot
+            The latest snapshot, which is new if any state changed.
+        """
+        with self._lock:
+            changed, self._changed = self._changed, {}
+            if not changed:
+                return self.snapshot
+            self.batches += 1
+            updated = set()
+            for name, device in changed.items():
+                if device._destroyed:
+                    if self._states.pop(name, None) is not None:
+                        updated.add(name)
+                    continue
+                timing = self._timing.setdefault(name, LightpathTiming())
+                start = time.perf_counter()
+                try:
+                    state = device.get_lightpath_state(use_cache=False)
+                except Exception:
+                    timing.errors += 1
+                    logger.exception('Error evaluating the lightpath state '
+                                     'of %s.', name)
+                    continue
+                finally:
+                    timing.record(time.perf_counter() - start)
+                if self._states.get(name) != state:
+                    self._states[name] = state
+                    updated.add(name)
+            if not updated:
+                return self.snapshot
+            snapshot = LightpathSnapshot(
+                version=self.snapshot.version + 1,
+                timestamp=time.time(),
+                states=MappingProxyType(dict(self._states)),
+                changed=frozenset(updated),
+            )
+            self.snapshot = snapshot
+            callbacks = list(self._callbacks.values())
+        for callback in callbacks:
+            try:
+                callback(snapshot=snapshot)
+            except Exception:
+                logger.exception('Error in lightpath snapshot callback.')
+        return snapshot
+
+    def subscribe(self, callback) -> int:
+        """
+        Call ``callback(snapshot=snapshot)`` for each new snapshot.
+
+        Parameters
+        ----------
+        callback : callable
+            The function to call.
+
+        Returns
+        -------
+        cid : int
+            The id to pass to `unsubscribe`.
+        """
+        with self._lock:
+            self._next_cid += 1
+            self._callbacks[self._next_cid] = callback
+            return self._next_cid
+
+    def unsubscribe(self, cid: int) -> None:
+        """Remove a callback added with `subscribe`."""
+        with self._lock:
+            self._callbacks.pop(cid, None)
+
+    @property
+    def timing(self) -> dict[str, LightpathTiming]:
+        """Per-device evaluation statistics, by device name."""
+        with self._lock:
+            return {name: dataclasses.replace(timing)
+                    for name, timing in self._timing.items()}
+
+    def timing_table(self) -> PrettyTable:
+        """
+        Tabulate the per-device evaluation statistics.
+
+        Returns
+        -------
+        table : PrettyTable
+            One row per evaluated device, slowest on average first.
+        """
+        table = PrettyTable()
+        table.field_names = ['Device', 'Calls', 'Mean (ms)', 'Max (ms)',
+                             'Errors']
+        timing = sorted(self.timing.items(), key=lambda item: -item[1].mean)
+        for name, stats in timing:
+            table.add_row([name, stats.calls, f'{stats.mean * 1e3:.3f}',
+                           f'{stats.longest * 1e3:.3f}', stats.errors])
+        return table
+
+
+def set_lightpath_engine(period=0.1):
+    """
+    Enable or disable the shared `LightpathEngine`.
+
+    Enabling the engine queues every registered device for a first
+    evaluation.
+
+    Parameters
+    ----------
+    period : float or None, optional
+        Seconds to collect updates for before evaluating a batch. Pass
+        `None` to disable the engine and evaluate on every update again.
+
+    Returns
+    -------
+    engine : LightpathEngine or None
+        The new engine, if enabled.
+    """
+    global lightpath_engine
+    if period is None:
+        lightpath_engine = None
+    else:
+        lightpath_engine = LightpathEngine(period=period)
+        lightpath_engine.mark_all_changed()
+    return lightpath_engine
+
+
+def get_lightpath_engine():
+    """
+    Get the `LightpathEngine` set by :meth:`set_lightpath_engine`.
+
+    Returns
+    -------
+    engine : LightpathEngine or None
+        The active engine, or `None` if disabled.
+    """
+    return lightpath_engine
@@ -11,7 +11,7 @@ from ophyd.device import Device
 from ophyd.device import FormattedComponent as FCpt
 from ophyd.signal import EpicsSignal, EpicsSignalRO
 
-from .device import GroupDevice
+from .device import ComponentAlias, GroupDevice
 from .device import UpdateComponent as UpCpt
 from .digitizers import Wave8V2
 from .doc_stubs import IPM_base, basic_positioner_init, insert_remove
@@ -44,6 +44,8 @@ class IPMTarget(InOutRecordPositioner):
     t3_composition = Cpt(EpicsSignalRO, ':TARGET3.DESC', kind='omitted')
     t4_composition = Cpt(EpicsSignalRO, ':TARGET4.DESC', kind='omitted')
 
+    y_motor = ComponentAlias('motor')
+
     # Assume that having any target in gives transmission 0.8
     _transmission = {st: 0.8 for st in in_states}
 
@@ -70,10 +72,6 @@ class IPMTarget(InOutRecordPositioner):
         else:
             return None
 
-    def __init__(self, prefix, *, name, **kwargs):
-        super().__init__(prefix, name=name, **kwargs)
-        self.y_motor = self.motor
-
 
 class IPMDiode(BaseInterface, GroupDevice):
     """
@@ -89,10 +87,7 @@ class IPMDiode(BaseInterface, GroupDevice):
 
     x_motor = Cpt(IMS, ':X_MOTOR', kind='normal')
     state = Cpt(InOutRecordPositioner, '', kind='normal')
-
-    def __init__(self, prefix, *, name, **kwargs):
-        super().__init__(prefix, name=name, **kwargs)
-        self.y_motor = self.state.motor
+    y_motor = ComponentAlias('state.motor')
 
     @property
     def inserted(self):
@@ -143,11 +138,9 @@ class IPMMotion(BaseInterface, GroupDevice, LightpathMixin):
 
     lightpath_cpts = ['target.state', 'diode.state.state']
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.ty = self.target.motor
-        self.dx = self.diode.x_motor
-        self.dy = self.diode.y_motor
+    ty = ComponentAlias('target.motor')
+    dx = ComponentAlias('diode.x_motor')
+    dy = ComponentAlias('diode.y_motor')
 
     def format_status_info(self, status_info):
         """
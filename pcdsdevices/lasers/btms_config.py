@@ -338,15 +338,7 @@ class DestinationPosition(str, enum.Enum):
         The first ``DestinationPosition`` in the returned tuple will be the
         next closest destination.
         """
-        idx1 = ALL_DESTINATIONS.index(self)
-        idx2 = ALL_DESTINATIONS.index(target)
-
-        if idx1 < idx2:
-            # Direction: right (self ... target)
-            return ALL_DESTINATIONS[idx1 + 1:idx2 + 1]
-
-        # Direction: left (target ... self)
-        return ALL_DESTINATIONS[idx2:idx1][::-1]
+        return DESTINATION_PATHS[(self, target)]
 
     @property
     def is_top(self) -> bool:
@@ -366,6 +358,65 @@ ALL_DESTINATIONS = tuple(DestinationPosition)
 AnyPosition = Union[SourcePosition, DestinationPosition]
 
 
+def _get_path(
+    start: DestinationPosition, target: DestinationPosition
+) -> tuple[DestinationPosition, ...]:
+    """Crossed destinations from ``start`` to ``target``; see ``path_to``."""
+    idx1 = ALL_DESTINATIONS.index(start)
+    idx2 = ALL_DESTINATIONS.index(target)
+
+    if idx1 < idx2:
+        # Direction: right (start ... target)
+        return ALL_DESTINATIONS[idx1 + 1:idx2 + 1]
+
+    # Direction: left (target ... start)
+    return ALL_DESTINATIONS[idx2:idx1][::-1]
+
+
+def _get_crossed_sources(
+    moving_source: SourcePosition, dest: DestinationPosition
+) -> frozenset[SourcePosition]:
+    """
+    Sources whose beam to ``dest`` would be crossed by ``moving_source``
+    passing by ``dest``.
+    """
+    if dest.is_top:
+        # Beams to the top ports go up past the sources above them
+        return frozenset(
+            active_source for active_source in SourcePosition
+            if moving_source.is_above(active_source)
+        )
+    # Beams to the bottom ports go down past the sources below them
+    return frozenset(
+        active_source for active_source in SourcePosition
+        if active_source.is_above(moving_source)
+    )
+
+
+#: Destinations crossed moving from one destination to another, keyed on
+#: (start, target).  See ``DestinationPosition.path_to``.
+DESTINATION_PATHS: dict[
+    tuple[DestinationPosition, DestinationPosition],
+    tuple[DestinationPosition, ...],
+] = {
+    (start, target): _get_path(start, target)
+    for start in DestinationPosition
+    for target in DestinationPosition
+}
+
+#: The conflict matrix: for a source moving past a destination, keyed on
+#: (moving source, destination), the sources whose active beam to that
+#: destination it would cross.
+BEAM_CROSSINGS: dict[
+    tuple[SourcePosition, DestinationPosition],
+    frozenset[SourcePosition],
+] = {
+    (source, dest): _get_crossed_sources(source, dest)
+    for source in SourcePosition
+    for dest in DestinationPosition
+}
+
+
 PORT_SPACING_MM = 215.9  # 8.5 in
 
 # NOTE: This is the primary location where valid ports are listed.
@@ -619,7 +670,7 @@ class BtmsState:
                 )
             )
 
-        for dest in closest_destination.path_to(target_destination):
+        for dest in DESTINATION_PATHS[(closest_destination, target_destination)]:
             active_source = dest_to_source.get(dest, None)
             if active_source is None:
                 # No source is near this destination
@@ -631,17 +682,9 @@ class BtmsState:
             # If we're here:
             # * ``moving_source`` will move past ``dest``
             # * ``dest`` is in use with beam on
-            # * We need to determine if ``moving_source`` will move through the
-            #   beam or not
-            dest_is_bottom = not dest.is_top
-            if dest.is_top and moving_source.is_above(active_source):
-                crosses_beam = True
-            elif dest_is_bottom and active_source.is_above(moving_source):
-                crosses_beam = True
-            else:
-                crosses_beam = False
-
-            if crosses_beam:
+            # * The precomputed conflict matrix tells us if ``moving_source``
+            #   will move through the beam or not
+            if active_source in BEAM_CROSSINGS[(moving_source, dest)]:
                 errors.append(
                     PathCrossedError(
                         f"Moving source {moving_source} to {target_destination} "
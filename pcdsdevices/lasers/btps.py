@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import cast
+import copy
+import threading
+from typing import Any, Optional, cast
 
 from ophyd.device import Component as Cpt
 from ophyd.device import Device
@@ -19,6 +21,14 @@ from .btms_config import (BtmsSourceState, BtmsState, DestinationPosition,
                           valid_sources)
 
 
+class _SignalValues(dict):
+    """Signal values that are read with ``get`` on first lookup."""
+
+    def __missing__(self, sig: Any) -> Any:
+        value = self[sig] = sig.get()
+        return value
+
+
 class BtpsVGC(VGC):
     """
     VGC subclass with 'valve_position' component added.
@@ -583,7 +593,7 @@ class BtpsSourceStatus(BaseInterface, Device):
         config.rotary.nominal.put(rotary)
         config.goniometer.nominal.put(goniometer)
 
-    def check_move(self, dest: DestinationPosition) -> None:
+    def check_move(self, dest: DestinationPosition, use_cache: bool = True) -> None:
         """
         Check for conflicts moving this source to ``dest``.
 
@@ -591,16 +601,23 @@ class BtpsSourceStatus(BaseInterface, Device):
         ----------
         dest : DestinationPosition
             The target destination for the source to move to.
+        use_cache : bool, optional
+            Check against the BTMS state kept up to date from subscriptions
+            instead of reading every BTPS PV again.
 
         Raises
         ------
         MoveError
             Raises specific ``MoveError`` subclass based on the reason.
         """
-        state = self.parent.to_btms_state()
-        state.check_move(self.source_pos, None, dest)
-
-    def check_move_all(self, dest: DestinationPosition) -> list[MoveError]:
+        conflicts = self.check_move_all(dest, use_cache=use_cache)
+        # If there are any conflicts, just raise the first one for now.
+        if conflicts:
+            raise conflicts[0]
+
+    def check_move_all(
+        self, dest: DestinationPosition, use_cache: bool = True
+    ) -> list[MoveError]:
         """
         Check for conflicts moving this source to ``dest``.
 
@@ -608,14 +625,21 @@ class BtpsSourceStatus(BaseInterface, Device):
         ----------
         dest : DestinationPosition
             The target destination for the source to move to.
+        use_cache : bool, optional
+            Check against the BTMS state kept up to date from subscriptions
+            instead of reading every BTPS PV again.
 
         Returns
         -------
         list of MoveError
             All conflicts along the motion trajectory.
         """
-        state = self.parent.to_btms_state()
-        return state.check_move_all(self.source_pos, None, dest)
+        if not use_cache:
+            state = self.parent.to_btms_state(use_cache=False)
+            return state.check_move_all(self.source_pos, None, dest)
+        with self.parent._btms_lock:
+            state = self.parent._get_cached_btms_state()
+            return state.check_move_all(self.source_pos, None, dest)
 
 
 class BtpsState(BaseInterface, Device):
@@ -625,6 +649,10 @@ class BtpsState(BaseInterface, Device):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._btms_lock = threading.RLock()
+        self._btms_state = None
+        self._btms_values = {}
+        self._btms_dependencies = None
         try:
             self.sources = {
                 source: getattr(self, source.name)
@@ -651,6 +679,11 @@ class BtpsState(BaseInterface, Device):
 
     sources: dict[SourcePosition, BtpsSourceStatus]
     destinations: dict[btms.DestinationPosition, DestinationConfig]
+    # Signal -> (kind, position) of the BTMS state entry that depends on it
+    _btms_dependencies: Optional[dict[Any, tuple[str, Any]]]
+    # Last known value of each signal in ``_btms_dependencies``
+    _btms_values: dict[Any, Any]
+    _btms_state: Optional[BtmsState]
 
     config = Cpt(
         GlobalConfig,
@@ -787,49 +820,143 @@ class BtpsState(BaseInterface, Device):
         """
         return self.sources[source].set_with_movestatus(dest)
 
-    def to_btms_state(self) -> BtmsState:
+    def _get_btms_dependencies(self) -> dict[Any, tuple[str, Any]]:
+        """All signals that make up the BTMS state and what they affect."""
+        deps = {}
+        for source_pos, source in self.sources.items():
+            deps[source.current_destination] = ("source", source_pos)
+            deps[source.lss.opened_status] = ("source", source_pos)
+        for dest_pos, dest in self.destinations.items():
+            deps[dest.exit_valve_ready] = ("exit_valve", dest_pos)
+            deps[dest.yields_control] = ("yields_control", dest_pos)
+            for source_pos in self.sources:
+                source_to_dest = dest.sources[source_pos]
+                deps[source_to_dest.entry_valve_ready] = ("source", source_pos)
+        deps[self.config.maintenance_mode] = ("maintenance_mode", None)
+        return deps
+
+    def _update_btms_source(
+        self, state: BtmsState, values: dict[Any, Any], source_pos: SourcePosition
+    ) -> None:
+        """Update ``state`` for one source given signal ``values``."""
+        source = self.sources[source_pos]
+        try:
+            dest_pos = DestinationPosition.from_index(
+                values[source.current_destination]
+            )
+        except ValueError:
+            dest_pos = None
+
+        if dest_pos is not None:
+            dest = self.destinations[dest_pos]
+            source_to_dest = dest.sources[source_pos]
+            beam_status = bool(
+                values[source.lss.opened_status]
+                and bool(values[source_to_dest.entry_valve_ready])
+                and bool(values[dest.exit_valve_ready])
+            )
+        else:
+            beam_status = values[source.lss.opened_status]
+
+        state.sources[source_pos] = BtmsSourceState(
+            source=source_pos,
+            destination=dest_pos,
+            beam_status=bool(beam_status),
+        )
+
+    def _update_btms_state(
+        self, state: BtmsState, values: dict[Any, Any], signal: Any
+    ) -> None:
+        """Update the part of ``state`` that depends on ``signal``."""
+        kind, pos = self._btms_dependencies[signal]
+        if kind == "source":
+            self._update_btms_source(state, values, pos)
+        elif kind == "exit_valve":
+            for source_pos, source in list(state.sources.items()):
+                if source.destination == pos:
+                    self._update_btms_source(state, values, source_pos)
+        elif kind == "yields_control":
+            state.destinations[pos].yields_control = bool(values[signal])
+        elif kind == "maintenance_mode":
+            state.maintenance_mode = bool(values[signal])
+
+    def _btms_value_changed(self, *args, value=None, obj=None, **kwargs) -> None:
+        """Subscription callback: update the cached BTMS state in place."""
+        with self._btms_lock:
+            self._btms_values[obj] = value
+            if self._btms_state is not None:
+                self._update_btms_state(self._btms_state, self._btms_values, obj)
+
+    def _btms_meta_changed(
+        self, *args, connected: bool = True, obj=None, **kwargs
+    ) -> None:
+        """Subscription callback: drop the cached BTMS state on disconnect."""
+        if connected:
+            return
+        with self._btms_lock:
+            # Stale values must not be used for move checks.  The next
+            # request reads every signal again, which fails while the
+            # signal is still disconnected.
+            self._btms_values.pop(obj, None)
+            self._btms_state = None
+
+    def _build_btms_state(self, values: dict[Any, Any]) -> BtmsState:
+        """Build the full BTMS state from signal ``values``."""
+        state = btms.BtmsState()
+        for source_pos in self.sources:
+            self._update_btms_source(state, values, source_pos)
+        for dest_pos, dest in self.destinations.items():
+            state.destinations[dest_pos].yields_control = bool(
+                values[dest.yields_control]
+            )
+        state.maintenance_mode = bool(values[self.config.maintenance_mode])
+        return state
+
+    def _get_cached_btms_state(self) -> BtmsState:
+        """
+        The BTMS state kept up to date from subscriptions.
+
+        The first call subscribes to all of the relevant signals and reads
+        them once.  If any of them disconnects, the cached state is dropped
+        and rebuilt from fresh reads on the next call.  Must be called with
+        ``_btms_lock`` held.
+        """
+        if self._btms_state is not None:
+            return self._btms_state
+        if self._btms_dependencies is None:
+            # Subscribe first so that we can't miss a change.  Callbacks
+            # wait on the lock until the initial read below is done.
+            self._btms_dependencies = self._get_btms_dependencies()
+            for sig in self._btms_dependencies:
+                sig.subscribe(self._btms_value_changed, run=False)
+                sig.subscribe(
+                    self._btms_meta_changed, event_type=sig.SUB_META, run=False
+                )
+        self._btms_values.update(
+            (sig, sig.get()) for sig in self._btms_dependencies
+        )
+        self._btms_state = self._build_btms_state(self._btms_values)
+        return self._btms_state
+
+    def to_btms_state(self, use_cache: bool = False) -> BtmsState:
         """
         Determine the state for BTMS, indicating active source/destination pairs.
 
+        Parameters
+        ----------
+        use_cache : bool, optional
+            Return a copy of the state kept up to date from subscriptions
+            instead of reading every BTPS PV again.
+
         Returns
         -------
         BtmsState
         """
-        state = btms.BtmsState()
-        for source in self.sources.values():
-            try:
-                dest_pos = DestinationPosition.from_index(
-                    source.current_destination.get()
-                )
-            except ValueError:
-                dest_pos = None
-
-            if dest_pos is not None:
-                dest = self.destinations[dest_pos]
-                source_to_dest = dest.sources[source.source_pos]
-                beam_status = bool(
-                    source.lss.opened_status.get()
-                    and bool(source_to_dest.entry_valve_ready.get())
-                    and bool(dest.exit_valve_ready.get())
-                )
-            else:
-                source_to_dest = None
-                beam_status = source.lss.opened_status.get()
-
-            state.sources[source.source_pos] = BtmsSourceState(
-                source=source.source_pos,
-                destination=dest_pos,
-                beam_status=bool(beam_status),
-            )
-
-        for dest in self.destinations.values():
-            dest_state = state.destinations[dest.destination_pos]
-            dest_state.yields_control = bool(
-                dest.yields_control.get()
-            )
-
-        state.maintenance_mode = bool(self.config.maintenance_mode.get())
-        return state
+        if use_cache:
+            with self._btms_lock:
+                return copy.deepcopy(self._get_cached_btms_state())
+        # Only read the valves on each source's active destination path
+        return self._build_btms_state(_SignalValues())
 
     def status_info(self) -> dict[str, BtmsState]:
         return {"state": self.to_btms_state()}
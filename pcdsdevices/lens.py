@@ -1,6 +1,7 @@
 """
 Module for Beryllium Lens positioners.
 """
+import functools
 import logging
 import time
 from collections import defaultdict
@@ -21,6 +22,90 @@ from .sim import FastMotor
 
 logger = logging.getLogger(__name__)
 
+ALIGN_PRESETS = ('align_position_one', 'align_position_two')
+
+
+class _AlignmentLine:
+    """
+    Straight beam path through the two points saved by ``LensStackBase.align``.
+
+    Parameters
+    ----------
+    point_one, point_two : sequence of float
+        The aligned ``(x, y, z)`` positions at either end of the z travel.
+    """
+
+    def __init__(self, point_one, point_two):
+        x1, y1, z1 = (float(pos) for pos in point_one)
+        x2, y2, z2 = (float(pos) for pos in point_two)
+        self.point_one = (x1, y1, z1)
+        self.point_two = (x2, y2, z2)
+        self.x_slope = (x1 - x2) / (z1 - z2)
+        self.y_slope = (y1 - y2) / (z1 - z2)
+
+    def __call__(self, z):
+        """Return the aligned ``(x, y)`` for a z position or array of them."""
+        x1, y1, z1 = self.point_one
+        dz = np.asarray(z, dtype=float) - z1
+        x = self.x_slope * dz + x1
+        y = self.y_slope * dz + y1
+        if x.ndim == 0:
+            return float(x), float(y)
+        return x, y
+
+
+class _BeamOptics:
+    """
+    Gaussian beam parameters for one lens set at one energy.
+
+    This holds the same model as ``calcs.calc_beam_fwhm`` and
+    ``calcs.calc_distance_for_size``, but only computes the focal length once
+    so that the conversions are closed-form and work on whole arrays.
+    """
+
+    def __init__(self, energy, lens_set, material, fwhm_unfocused):
+        if not isinstance(lens_set, int):
+            lens_set = list(lens_set)
+        self.focal_length = calcs.calc_focal_length(energy, lens_set,
+                                                    material, None)
+        lam = calcs.photon_to_wavelength(energy) * 1e-9
+        w_unfocused = calcs.gaussian_fwhm_to_sigma(fwhm_unfocused) * 2.0
+        self.waist = lam / np.pi * self.focal_length / w_unfocused
+        self.rayleigh_range = np.pi * self.waist ** 2 / lam
+
+    def fwhm(self, distance):
+        """Beam FWHM in meters at ``distance`` meters from the lenses."""
+        distance = np.asarray(distance, dtype=float)
+        size = self.waist * np.sqrt(
+            1.0 + (distance - self.focal_length) ** 2.0
+            / self.rayleigh_range ** 2
+        )
+        return calcs.gaussian_sigma_to_fwhm(size) / 2.0
+
+    def distance(self, size_fwhm):
+        """
+        Distances in meters with beam FWHM ``size_fwhm``.
+
+        Returns the upstream and downstream solutions, in that order.
+        """
+        size = calcs.gaussian_fwhm_to_sigma(
+            np.asarray(size_fwhm, dtype=float)) * 2.0
+        offset = np.sqrt((size / self.waist) ** 2 - 1) * self.rayleigh_range
+        return self.focal_length - offset, self.focal_length + offset
+
+
+@functools.lru_cache(maxsize=64)
+def _get_beam_optics(energy, lens_set, material, fwhm_unfocused):
+    """Shared, memoized :class:`_BeamOptics` lookup."""
+    return _BeamOptics(energy, lens_set, material, fwhm_unfocused)
+
+
+def _as_scalar(value):
+    """Unwrap zero-dimensional arrays so scalar callers get a float back."""
+    if np.ndim(value) == 0:
+        return float(value)
+    return value
+
 
 class XFLS(InOutRecordPositioner, LightpathInOutMixin):
     """
@@ -128,7 +213,7 @@ class LensStackBase(BaseInterface, PseudoPositioner):
     beam_size = Cpt(PseudoSingleInterface)
 
     tab_whitelist = ['tweak', 'align', 'calib_z', 'beam_size', 'create_lens',
-                     'read_lens']
+                     'read_lens', 'z_to_beam_size', 'beam_size_to_z']
     tab_component_names = True
 
     def __init__(self, x_prefix, y_prefix, z_prefix, lens_set,
@@ -147,6 +232,8 @@ class LensStackBase(BaseInterface, PseudoPositioner):
         if lens_set is not None:
             lens_set = list(lens_set)
         self.lens_set = lens_set
+        # (preset namespaces, _AlignmentLine) from the last preset lookup
+        self._alignment = None
 
         super().__init__(x_prefix, *args, **kwargs)
 
@@ -187,22 +274,11 @@ class LensStackBase(BaseInterface, PseudoPositioner):
             If pseudo motor is not setup for use.
         """
         if not np.isclose(pseudo_pos.beam_size, self.beam_size.position):
-            beam_size = pseudo_pos.beam_size
-            dist = calcs.calc_distance_for_size(beam_size, self.lens_set,
-                                                self._E)[0]
-            z_pos = (dist - self.z_offset) * self.z_dir * 1000
+            z_pos = self.beam_size_to_z(pseudo_pos.beam_size)
         else:
             z_pos = pseudo_pos.calib_z
         try:
-            pos = [self.x.presets.positions.align_position_one.pos,
-                   self.y.presets.positions.align_position_one.pos,
-                   self.z.presets.positions.align_position_one.pos,
-                   self.x.presets.positions.align_position_two.pos,
-                   self.y.presets.positions.align_position_two.pos,
-                   self.z.presets.positions.align_position_two.pos]
-            x_pos = ((pos[0]-pos[3])/(pos[2]-pos[5]))*(z_pos-pos[2])+pos[0]
-            y_pos = ((pos[1]-pos[4])/(pos[2]-pos[5]))*(z_pos-pos[2])+pos[1]
-            return self.RealPosition(x=x_pos, y=y_pos, z=z_pos)
+            line = self.get_alignment_line()
         except AttributeError:
             self.log.debug('', exc_info=True)
             self.log.error("Please setup the pseudo motor for use by using "
@@ -210,6 +286,8 @@ class LensStackBase(BaseInterface, PseudoPositioner):
                            " check if the preset pathways have been setup.")
             return self.RealPosition(x=self.x.position, y=self.y.position,
                                      z=z_pos)
+        x_pos, y_pos = line(z_pos)
+        return self.RealPosition(x=x_pos, y=y_pos, z=z_pos)
 
     @real_position_argument
     def inverse(self, real_pos):
@@ -227,12 +305,91 @@ class LensStackBase(BaseInterface, PseudoPositioner):
         -------
             PseudoPosition
         """
-        dist_m = real_pos.z / 1000 * self.z_dir + self.z_offset
-        logger.info('dist_m %s', dist_m)
-        beamsize = calcs.calc_beam_fwhm(self._E, self.lens_set,
-                                        distance=dist_m)
+        beamsize = self.z_to_beam_size(real_pos.z)
         return self.PseudoPosition(calib_z=real_pos.z, beam_size=beamsize)
 
+    def get_alignment_line(self):
+        """
+        Get the beam line saved by :meth:`align`.
+
+        The preset files are checked on every call, but the six preset
+        positions are only read again after one of the x, y or z preset
+        files has changed, whichever session changed it.
+
+        Returns
+        -------
+        line : callable
+            Maps a z position, or an array of them, to the aligned (x, y).
+
+        Raises
+        ------
+        AttributeError
+            If the alignment presets have not been set up.
+        """
+        presets = (self.x.presets, self.y.presets, self.z.presets)
+        for preset in presets:
+            if preset.sync_needed():
+                preset.sync()
+        # The file keys of the presets the line was read from
+        mtimes = [dict(preset._mtimes) for preset in presets]
+        cached = self._alignment
+        if cached is not None and cached[0] == mtimes:
+            return cached[1]
+        points = [
+            [getattr(preset.positions, name).pos for preset in presets]
+            for name in ALIGN_PRESETS
+        ]
+        line = _AlignmentLine(*points)
+        self._alignment = (mtimes, line)
+        return line
+
+    def _get_optics(self, material=None):
+        """The memoized beam optics for the current energy and lens set."""
+        lens_set = self.lens_set
+        if not isinstance(lens_set, int):
+            lens_set = tuple(lens_set)
+        return _get_beam_optics(self._E, lens_set,
+                                material or calcs.MATERIAL,
+                                calcs.FWHM_UNFOCUSED)
+
+    def z_to_beam_size(self, z):
+        """
+        Convert z motor positions to beam FWHM sizes.
+
+        Parameters
+        ----------
+        z : float or array-like
+            Position(s) of the z motor.
+
+        Returns
+        -------
+        beam_size : float or np.ndarray
+            Beam FWHM in meters at each z.
+        """
+        dist_m = np.asarray(z, dtype=float) / 1000 * self.z_dir + self.z_offset
+        logger.debug('dist_m %s', dist_m)
+        return _as_scalar(self._get_optics().fwhm(dist_m))
+
+    def beam_size_to_z(self, beam_size):
+        """
+        Convert beam FWHM sizes to z motor positions.
+
+        The upstream solution is used, as with
+        ``calcs.calc_distance_for_size(...)[0]``.
+
+        Parameters
+        ----------
+        beam_size : float or array-like
+            Beam FWHM in meters.
+
+        Returns
+        -------
+        z : float or np.ndarray
+            Position(s) of the z motor.
+        """
+        dist = self._get_optics(material='Be').distance(beam_size)[0]
+        return _as_scalar((dist - self.z_offset) * self.z_dir * 1000)
+
     def align(self, z_position=None, edge_offset=20):
         """
         Generate equations for aligning the beam based on user input.
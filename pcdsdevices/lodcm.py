@@ -10,7 +10,7 @@ no readback into the device's alignment. This is intended for a future update.
 """
 import functools
 import logging
-from typing import Union
+from typing import Optional, Union
 
 import numpy as np
 from lightpath import LightpathState
@@ -24,7 +24,7 @@ from pcdscalc import common, diffraction
 from pcdsdevices.epics_motor import OffsetIMSWithPreset, OffsetMotor
 from pcdsdevices.sim import FastMotor
 
-from .device import GroupDevice
+from .device import ComponentAlias, GroupDevice
 from .doc_stubs import insert_remove
 from .epics_motor import IMS
 from .inout import InOutRecordPositioner
@@ -106,7 +106,132 @@ class Y2(InOutRecordPositioner):
     out_states = []
 
 
-class CrystalTower1(BaseInterface, GroupDevice):
+@functools.lru_cache(maxsize=None)
+def get_d_space(material: str, reflection: tuple) -> float:
+    """
+    Memoized :func:`pcdscalc.diffraction.d_space`, in meters.
+
+    Parameters
+    ----------
+    material : str
+        Chemical formula. E.g.: `Si`
+    reflection : tuple
+        Reflection of material. E.g.: `(1, 1, 1)`
+    """
+    return diffraction.d_space(material, reflection)
+
+
+def calc_lom_geometry(energy, material, reflection):
+    """
+    Calculate the lom geometry for one or many energies.
+
+    This matches :func:`pcdscalc.diffraction.get_lom_geometry`, but works on
+    arrays and only calculates the d-spacing once per material and
+    reflection.
+
+    Parameters
+    ----------
+    energy : float or np.ndarray
+        Photon energy in keV.
+    material : str
+        Chemical formula. E.g.: `Si`
+    reflection : tuple
+        Reflection of material. E.g.: `(1, 1, 1)`
+
+    Returns
+    -------
+    th, z : tuple
+        `theta` in degrees and `z` in mm, as floats or arrays.
+    """
+    d_space = get_d_space(material, tuple(reflection))
+    wavelength = common.energy_to_wavelength(np.asarray(energy) * 1e3)
+    th = np.arcsin(wavelength / 2 / d_space)
+    return np.rad2deg(th), 300 / np.tan(2 * th)
+
+
+def calc_lom_energy(theta, material, reflection):
+    """
+    Calculate the photon energy in keV from one or many crystal angles.
+
+    Parameters
+    ----------
+    theta : float or np.ndarray
+        Crystal angle in degrees.
+    material : str
+        Chemical formula. E.g.: `Si`
+    reflection : tuple
+        Reflection of material. E.g.: `(1, 1, 1)`
+    """
+    length = (2 * np.sin(np.deg2rad(theta))
+              * get_d_space(material, tuple(reflection)))
+    return common.wavelength_to_energy(length) / 1000
+
+
+class CrystalStateMixin:
+    """
+    Keep a crystal tower's material and reflection up to date from monitors.
+
+    The material and reflection are worked out with live gets the first time
+    they are requested with ``use_cache=True``, and after that only when
+    one of the signals in ``_crystal_state_attrs`` changes.
+    """
+    # State positioners and reflection signals that decide the crystal
+    _crystal_state_attrs = ()
+    _crystal_state = None
+    _crystal_generation = 0
+    _crystal_subscribed = False
+
+    def _crystal_state_changed(self, *args, **kwargs):
+        """Subscription callback: forget the cached crystal state."""
+        self._crystal_generation += 1
+        self._crystal_state = None
+
+    def get_crystal_state(
+        self, use_cache: bool = True
+    ) -> tuple[Optional[str], Optional[tuple]]:
+        """
+        Get the crystal material and reflection.
+
+        Parameters
+        ----------
+        use_cache : bool, optional
+            Use the values kept up to date from subscriptions. Otherwise,
+            work them out again from live values.
+
+        Returns
+        -------
+        material, reflection : tuple
+            The material ('C' or 'Si') and reflection, each None if they
+            cannot be determined.
+        """
+        if use_cache:
+            state = self._crystal_state
+            if state is not None:
+                return state
+            if not self._crystal_subscribed:
+                # Subscribe first so that we can't miss a change
+                self._crystal_subscribed = True
+                for attr in self._crystal_state_attrs:
+                    getattr(self, attr).subscribe(
+                        self._crystal_state_changed, run=False
+                    )
+        generation = self._crystal_generation
+        material = reflection = None
+        if self.is_diamond():
+            material = 'C'
+            reflection = self.diamond_reflection.get()
+        elif self.is_silicon():
+            material = 'Si'
+            reflection = self.silicon_reflection.get()
+        if reflection is not None:
+            reflection = tuple(reflection)
+        state = (material, reflection)
+        if use_cache and generation == self._crystal_generation:
+            self._crystal_state = state
+        return state
+
+
+class CrystalTower1(BaseInterface, GroupDevice, CrystalStateMixin):
     """
     LODCM Crystal Tower 1.
 
@@ -157,6 +282,8 @@ class CrystalTower1(BaseInterface, GroupDevice):
                              doc='Tower 1 Diamond crystal reflection')
     silicon_reflection = Cpt(EpicsSignalRO, ':T1Si:REF', kind='normal',
                              doc='Tower 1 Silicon crystal reflection')
+    _crystal_state_attrs = ('h1n_state', 'y1_state', 'chi1_state',
+                            'diamond_reflection', 'silicon_reflection')
 
     # motor offsets
     # the folowing are declared in Energy classes
@@ -229,12 +356,18 @@ class CrystalTower1(BaseInterface, GroupDevice):
                 self.y1_state.position == 'Si' and
                 self.chi1_state.position == 'Si')
 
-    def get_reflection(self):
+    def get_reflection(self, use_cache: bool = False):
         """
         Get crystal's reflection.
 
         Tries to get the reflection depending on the material in use.
 
+        Parameters
+        ----------
+        use_cache : bool, optional
+            Use the reflection kept up to date from subscriptions instead of
+            live values.
+
         Returns
         -------
         reflection : tuple
@@ -244,20 +377,21 @@ class CrystalTower1(BaseInterface, GroupDevice):
         ValueError
             When cannot determine the reflection.
         """
-        reflection = None
-        if self.is_diamond():
-            reflection = self.diamond_reflection.get()
-        elif self.is_silicon():
-            reflection = self.silicon_reflection.get()
-
+        _, reflection = self.get_crystal_state(use_cache=use_cache)
         if reflection is not None:
-            return tuple(reflection)
+            return reflection
         raise ValueError('Unable to determine the crystal reflection')
 
-    def get_material(self):
+    def get_material(self, use_cache: bool = False):
         """
         Get the current material.
 
+        Parameters
+        ----------
+        use_cache : bool, optional
+            Use the material kept up to date from subscriptions instead of
+            live values.
+
         Returns
         -------
         material : str
@@ -269,13 +403,18 @@ class CrystalTower1(BaseInterface, GroupDevice):
             When the material could not be determined or is something else
              other than `Si` or `C`.
         """
-        if self.is_diamond():
-            return 'C'
+        if use_cache:
+            material, _ = self.get_crystal_state()
+        elif self.is_diamond():
+            material = 'C'
         elif self.is_silicon():
-            return 'Si'
+            material = 'Si'
         else:
+            material = None
+        if material is None:
             raise ValueError(
                 "Unable to determine crystal material for Tower 1")
+        return material
 
     def format_status_info(self, status_info):
         """Override status info handler to render the crystal tower 1."""
@@ -368,7 +507,7 @@ hp [{hp_units}]  {hp_user} ({hp_dial})
 """
 
 
-class CrystalTower2(BaseInterface, GroupDevice):
+class CrystalTower2(BaseInterface, GroupDevice, CrystalStateMixin):
     """
     LODCM Crystal Tower 2.
 
@@ -418,6 +557,8 @@ class CrystalTower2(BaseInterface, GroupDevice):
                              doc='Tower 2 Diamond crystal reflection')
     silicon_reflection = Cpt(EpicsSignalRO, ':T2Si:REF', kind='normal',
                              doc='Tower 2 Silicon crystal reflection')
+    _crystal_state_attrs = ('h2n_state', 'y2_state', 'chi2_state',
+                            'diamond_reflection', 'silicon_reflection')
 
     # motor offsets
     # the following ones are declared in the Energy classes
@@ -481,12 +622,18 @@ class CrystalTower2(BaseInterface, GroupDevice):
                 self.y2_state.position == 'Si' and
                 self.chi2_state.position == 'Si')
 
-    def get_reflection(self):
+    def get_reflection(self, use_cache: bool = False):
         """
         Get crystal's reflection.
 
         Tries to get the reflection depending on the material in use.
 
+        Parameters
+        ----------
+        use_cache : bool, optional
+            Use the reflection kept up to date from subscriptions instead of
+            live values.
+
         Returns
         -------
         reflection : tuple
@@ -496,20 +643,21 @@ class CrystalTower2(BaseInterface, GroupDevice):
         ValueError
             When cannot determine the reflection.
         """
-        reflection = None
-        if self.is_diamond():
-            reflection = self.diamond_reflection.get()
-        elif self.is_silicon():
-            reflection = self.silicon_reflection.get()
-
+        _, reflection = self.get_crystal_state(use_cache=use_cache)
         if reflection is not None:
-            return tuple(reflection)
+            return reflection
         raise ValueError('Unable to determine the crystal reflection')
 
-    def get_material(self):
+    def get_material(self, use_cache: bool = False):
         """
         Get the current material.
 
+        Parameters
+        ----------
+        use_cache : bool, optional
+            Use the material kept up to date from subscriptions instead of
+            live values.
+
         Returns
         -------
         material : str
@@ -521,13 +669,18 @@ class CrystalTower2(BaseInterface, GroupDevice):
             When the material could not be determined or is something else
              other than `Si` or `C`.
         """
-        if self.is_diamond():
-            return 'C'
+        if use_cache:
+            material, _ = self.get_crystal_state()
+        elif self.is_diamond():
+            material = 'C'
         elif self.is_silicon():
-            return 'Si'
+            material = 'Si'
         else:
+            material = None
+        if material is None:
             raise ValueError(
                 "Unable to determine crystal material for Tower 2")
+        return material
 
     def format_status_info(self, status_info):
         """Override status info handler to render the crystal tower 2."""
@@ -801,8 +954,8 @@ class LODCMEnergySi(FltMvInterface, PseudoPositioner, GroupDevice):
             When the reflection of first tower does not match the one of
             second tower.
         """
-        ref_1 = self.tower1.get_reflection()
-        ref_2 = self.tower2.get_reflection()
+        ref_1 = self.tower1.get_reflection(use_cache=True)
+        ref_2 = self.tower2.get_reflection(use_cache=True)
         if ref_1 != ref_2:
             logger.warning('Crystals do not match: c1: %s, c2: %s',
                            ref_1, ref_2)
@@ -829,9 +982,7 @@ class LODCMEnergySi(FltMvInterface, PseudoPositioner, GroupDevice):
         """
         reflection = reflection or self.get_reflection()
         th = self.th1Si.wm()
-        length = (2 * np.sin(np.deg2rad(th)) *
-                  diffraction.d_space(material, reflection))
-        return common.wavelength_to_energy(length) / 1000
+        return calc_lom_energy(th, material, reflection)
 
     def calc_geometry(self, energy, material='Si', reflection=None):
         """
@@ -850,8 +1001,7 @@ class LODCMEnergySi(FltMvInterface, PseudoPositioner, GroupDevice):
             Returns `theta` in degrees and `zm` TODO: what is this?
         """
         reflection = reflection or self.get_reflection()
-        th, z = diffraction.get_lom_geometry(energy*1e3, material, reflection)
-        return (th, z)
+        return calc_lom_geometry(energy, material, reflection)
 
     @pseudo_position_argument
     def forward(self, pseudo_pos):
@@ -881,6 +1031,30 @@ class LODCMEnergySi(FltMvInterface, PseudoPositioner, GroupDevice):
                                  z2Si=z,
                                  dr=2*th)
 
+    def forward_many(self, energies):
+        """
+        Calculate the real motor positions for many energies at once.
+
+        This is meant for scan planning, and only looks up the reflection
+        once for all of the energies.
+
+        Parameters
+        ----------
+        energies : array-like
+            Photon energies in keV.
+
+        Returns
+        -------
+        real_pos : RealPosition
+            The real positions, with an array for each axis.
+        """
+        th, z = self.calc_geometry(energy=np.asarray(energies, dtype=float))
+        return self.RealPosition(th1Si=th,
+                                 th2Si=th,
+                                 z1Si=-z,
+                                 z2Si=z,
+                                 dr=2*th)
+
     @real_position_argument
     def inverse(self, real_pos):
         """
@@ -905,7 +1079,7 @@ class LODCMEnergySi(FltMvInterface, PseudoPositioner, GroupDevice):
             return self.PseudoPosition(energy=np.NaN)
         real_pos = self.RealPosition(*real_pos)
         length = (2 * np.sin(np.deg2rad(real_pos.th1Si))
-                    * diffraction.d_space('Si', reflection))
+                    * get_d_space('Si', reflection))
         if length == 0:
             # don't bother transforming this
             # TODO maybe catch error in common.wave.. when send 0
@@ -1030,8 +1204,8 @@ class LODCMEnergyC(FltMvInterface, PseudoPositioner, GroupDevice):
             When the reflection of first tower does not match the one of
             second tower.
         """
-        ref_1 = self.tower1.get_reflection()
-        ref_2 = self.tower2.get_reflection()
+        ref_1 = self.tower1.get_reflection(use_cache=True)
+        ref_2 = self.tower2.get_reflection(use_cache=True)
         if ref_1 != ref_2:
             logger.warning('Crystals do not match: c1: %s, c2: %s',
                            ref_1, ref_2)
@@ -1058,9 +1232,7 @@ class LODCMEnergyC(FltMvInterface, PseudoPositioner, GroupDevice):
         """
         reflection = reflection or self.get_reflection()
         th = self.th1C.wm()
-        length = (2 * np.sin(np.deg2rad(th)) *
-                  diffraction.d_space(material, reflection))
-        return common.wavelength_to_energy(length) / 1000
+        return calc_lom_energy(th, material, reflection)
 
     def calc_geometry(self, energy, material='C', reflection=None):
         """
@@ -1079,8 +1251,7 @@ class LODCMEnergyC(FltMvInterface, PseudoPositioner, GroupDevice):
             Returns `theta` in degrees and `zm` TODO: what is this?
         """
         reflection = reflection or self.get_reflection()
-        th, z = diffraction.get_lom_geometry(energy*1e3, material, reflection)
-        return (th, z)
+        return calc_lom_geometry(energy, material, reflection)
 
     @pseudo_position_argument
     def forward(self, pseudo_pos):
@@ -1109,6 +1280,30 @@ class LODCMEnergyC(FltMvInterface, PseudoPositioner, GroupDevice):
                                  z2C=z,
                                  dr=2*th)
 
+    def forward_many(self, energies):
+        """
+        Calculate the real motor positions for many energies at once.
+
+        This is meant for scan planning, and only looks up the reflection
+        once for all of the energies.
+
+        Parameters
+        ----------
+        energies : array-like
+            Photon energies in keV.
+
+        Returns
+        -------
+        real_pos : RealPosition
+            The real positions, with an array for each axis.
+        """
+        th, z = self.calc_geometry(energy=np.asarray(energies, dtype=float))
+        return self.RealPosition(th1C=th,
+                                 th2C=th,
+                                 z1C=-z,
+                                 z2C=z,
+                                 dr=2*th)
+
     @real_position_argument
     def inverse(self, real_pos):
         """
@@ -1133,7 +1328,7 @@ class LODCMEnergyC(FltMvInterface, PseudoPositioner, GroupDevice):
             return self.PseudoPosition(energy=np.NaN)
         real_pos = self.RealPosition(*real_pos)
         length = (2 * np.sin(np.deg2rad(real_pos.th1C))
-                    * diffraction.d_space('C', reflection))
+                    * get_d_space('C', reflection))
         if length == 0:
             # don't bother transforming this
             # TODO maybe catch error in common.wave.. when send 0
@@ -1248,7 +1443,7 @@ class LODCMEnergyC1(FltMvInterface, PseudoPositioner, GroupDevice):
             When the reflection of first tower does not match the one of
             second tower.
         """
-        ref_1 = self.tower1.get_reflection()
+        ref_1 = self.tower1.get_reflection(use_cache=True)
         return ref_1
 
     def get_energy(self, material='C', reflection=None):
@@ -1271,9 +1466,7 @@ class LODCMEnergyC1(FltMvInterface, PseudoPositioner, GroupDevice):
         """
         reflection = reflection or self.get_reflection()
         th = self.th1C.wm()
-        length = (2 * np.sin(np.deg2rad(th)) *
-                  diffraction.d_space(material, reflection))
-        return common.wavelength_to_energy(length) / 1000
+        return calc_lom_energy(th, material, reflection)
 
     def calc_geometry(self, energy, material='C', reflection=None):
         """
@@ -1292,8 +1485,7 @@ class LODCMEnergyC1(FltMvInterface, PseudoPositioner, GroupDevice):
             Returns `theta` in degrees and `zm` TODO: what is this?
         """
         reflection = reflection or self.get_reflection()
-        th, z = diffraction.get_lom_geometry(energy*1e3, material, reflection)
-        return (th, z)
+        return calc_lom_geometry(energy, material, reflection)
 
     @pseudo_position_argument
     def forward(self, pseudo_pos):
@@ -1320,6 +1512,28 @@ class LODCMEnergyC1(FltMvInterface, PseudoPositioner, GroupDevice):
                                  z1C=-z,
                                  dr=2*th)
 
+    def forward_many(self, energies):
+        """
+        Calculate the real motor positions for many energies at once.
+
+        This is meant for scan planning, and only looks up the reflection
+        once for all of the energies.
+
+        Parameters
+        ----------
+        energies : array-like
+            Photon energies in keV.
+
+        Returns
+        -------
+        real_pos : RealPosition
+            The real positions, with an array for each axis.
+        """
+        th, z = self.calc_geometry(energy=np.asarray(energies, dtype=float))
+        return self.RealPosition(th1C=th,
+                                 z1C=-z,
+                                 dr=2*th)
+
     @real_position_argument
     def inverse(self, real_pos):
         """
@@ -1344,7 +1558,7 @@ class LODCMEnergyC1(FltMvInterface, PseudoPositioner, GroupDevice):
             return self.PseudoPosition(energy=np.NaN)
         real_pos = self.RealPosition(*real_pos)
         length = (2 * np.sin(np.deg2rad(real_pos.th1C))
-                    * diffraction.d_space('C', reflection))
+                    * get_d_space('C', reflection))
         if length == 0:
             # don't bother transforming this
             # TODO maybe catch error in common.wave.. when send 0
@@ -1451,6 +1665,73 @@ class LODCM(BaseInterface, GroupDevice, LightpathMixin):
 
     lightpath_cpts = ['tower1.h1n_state.state']
 
+    # Aliases, looked up when used
+    # first tower
+    z1 = ComponentAlias('tower1.z1')
+    x1 = ComponentAlias('tower1.x1')
+    y1 = ComponentAlias('tower1.y1')
+    th1 = ComponentAlias('tower1.th1')
+    chi1 = ComponentAlias('tower1.chi1')
+    h1n = ComponentAlias('tower1.h1n')
+    h1p = ComponentAlias('tower1.h1p')
+    # second tower
+    z2 = ComponentAlias('tower2.z2')
+    x2 = ComponentAlias('tower2.x2')
+    y2 = ComponentAlias('tower2.y2')
+    th2 = ComponentAlias('tower2.th2')
+    chi2 = ComponentAlias('tower2.chi2')
+    h2n = ComponentAlias('tower2.h2n')
+    diode2 = ComponentAlias('tower2.diode2')
+    # diagnostic tower
+    dh = ComponentAlias('diag_tower.dh')
+    dv = ComponentAlias('diag_tower.dv')
+    dr = ComponentAlias('diag_tower.dr')
+    df = ComponentAlias('diag_tower.df')
+    dd = ComponentAlias('diag_tower.dd')
+    yag_zoom = ComponentAlias('diag_tower.yag_zoom')
+    # states
+    h1n_state = ComponentAlias('tower1.h1n_state')
+    y1_state = ComponentAlias('tower1.y1_state')
+    chi1_state = ComponentAlias('tower1.chi1_state')
+    h2n_state = ComponentAlias('tower2.h2n_state')
+    y2_state = ComponentAlias('tower2.y2_state')
+    chi2_state = ComponentAlias('tower2.chi2_state')
+    # offset positioners - tower 1
+    th1Si = ComponentAlias('energy_si.th1Si')
+    z1Si = ComponentAlias('energy_si.z1Si')
+    th1C = ComponentAlias('energy_c.th1C')
+    z1C = ComponentAlias('energy_c.z1C')
+
+    x1C = ComponentAlias('tower1.x1C')
+    x1Si = ComponentAlias('tower1.x1Si')
+    y1C = ComponentAlias('tower1.y1C')
+    y1Si = ComponentAlias('tower1.y1Si')
+    chi1C = ComponentAlias('tower1.chi1C')
+    chi1Si = ComponentAlias('tower1.chi1Si')
+    h1nC = ComponentAlias('tower1.h1nC')
+    h1nSi = ComponentAlias('tower1.h1nSi')
+    h1pC = ComponentAlias('tower1.h1pC')
+    h1pSi = ComponentAlias('tower1.h1pSi')
+    # offset positioners - tower 2
+    th2Si = ComponentAlias('energy_si.th2Si')
+    z2Si = ComponentAlias('energy_si.z2Si')
+    th2C = ComponentAlias('energy_c.th2C')
+    z2C = ComponentAlias('energy_c.z2C')
+
+    x2C = ComponentAlias('tower2.x2C')
+    x2Si = ComponentAlias('tower2.x2Si')
+    y2C = ComponentAlias('tower2.y2C')
+    y2Si = ComponentAlias('tower2.y2Si')
+    chi2C = ComponentAlias('tower2.chi2C')
+    chi2Si = ComponentAlias('tower2.chi2Si')
+    h2nC = ComponentAlias('tower2.h2nC')
+    h2nSi = ComponentAlias('tower2.h2nSi')
+
+    # energy aliases
+    EC = ComponentAlias('energy_c')
+    ESi = ComponentAlias('energy_si')
+    E1C = ComponentAlias('energy_c1')
+
     def __init__(self, prefix, *, name, main_line='MAIN', mono_line='MONO',
                  **kwargs):
         self._prefix = prefix
@@ -1463,71 +1744,6 @@ class LODCM(BaseInterface, GroupDevice, LightpathMixin):
         super().__init__(prefix, name=name, **kwargs)
         self.main_line = main_line
         self.mono_line = mono_line
-        # first tower
-        self.z1 = self.tower1.z1
-        self.x1 = self.tower1.x1
-        self.y1 = self.tower1.y1
-        self.th1 = self.tower1.th1
-        self.chi1 = self.tower1.chi1
-        self.h1n = self.tower1.h1n
-        self.h1p = self.tower1.h1p
-        # second tower
-        self.z2 = self.tower2.z2
-        self.x2 = self.tower2.x2
-        self.y2 = self.tower2.y2
-        self.th2 = self.tower2.th2
-        self.chi2 = self.tower2.chi2
-        self.h2n = self.tower2.h2n
-        self.diode2 = self.tower2.diode2
-        # diagnostic tower
-        self.dh = self.diag_tower.dh
-        self.dv = self.diag_tower.dv
-        self.dr = self.diag_tower.dr
-        self.df = self.diag_tower.df
-        self.dd = self.diag_tower.dd
-        self.yag_zoom = self.diag_tower.yag_zoom
-        # states
-        self.h1n_state = self.tower1.h1n_state
-        self.y1_state = self.tower1.y1_state
-        self.chi1_state = self.tower1.chi1_state
-        self.h2n_state = self.tower2.h2n_state
-        self.y2_state = self.tower2.y2_state
-        self.chi2_state = self.tower2.chi2_state
-        # offset positioners - tower 1
-        self.th1Si = self.energy_si.th1Si
-        self.z1Si = self.energy_si.z1Si
-        self.th1C = self.energy_c.th1C
-        self.z1C = self.energy_c.z1C
-
-        self.x1C = self.tower1.x1C
-        self.x1Si = self.tower1.x1Si
-        self.y1C = self.tower1.y1C
-        self.y1Si = self.tower1.y1Si
-        self.chi1C = self.tower1.chi1C
-        self.chi1Si = self.tower1.chi1Si
-        self.h1nC = self.tower1.h1nC
-        self.h1nSi = self.tower1.h1nSi
-        self.h1pC = self.tower1.h1pC
-        self.h1pSi = self.tower1.h1pSi
-        # offset positioners - tower 2
-        self.th2Si = self.energy_si.th2Si
-        self.z2Si = self.energy_si.z2Si
-        self.th2C = self.energy_c.th2C
-        self.z2C = self.energy_c.z2C
-
-        self.x2C = self.tower2.x2C
-        self.x2Si = self.tower2.x2Si
-        self.y2C = self.tower2.y2C
-        self.y2Si = self.tower2.y2Si
-        self.chi2C = self.tower2.chi2C
-        self.chi2Si = self.tower2.chi2Si
-        self.h2nC = self.tower2.h2nC
-        self.h2nSi = self.tower2.h2nSi
-
-        # energy aliases
-        self.EC = self.energy_c
-        self.ESi = self.energy_si
-        self.E1C = self.energy_c1
 
     @property
     def energy(self):
@@ -1753,8 +1969,7 @@ class LODCM(BaseInterface, GroupDevice, LightpathMixin):
         # try to determine the material and reflection:
         material = material or self.get_material()
         reflection = reflection or self.get_reflection()
-        th, z = diffraction.get_lom_geometry(energy * 1e3, material,
-                                             reflection)
+        th, z = calc_lom_geometry(energy, material, reflection)
         if material == 'Si':
             self.th1Si.set_current_position(th)
             self.th2Si.set_current_position(th)
@@ -6,8 +6,9 @@ FEE and XRT. Each offset mirror contains a stepper motor and piezo motor to
 control the pitch, and two pairs of motors to control the horizontal and
 vertical gantries.
 """
+import bisect
 import logging
-from typing import Union
+from typing import Any, Callable, Optional, Union
 
 import numpy as np
 from lightpath import LightpathState
@@ -36,6 +37,103 @@ class MirrorLogicError(Exception):
     """ An error in mirror pointing logic """
 
 
+def _freeze_ranges(ranges):
+    """Nested tuple copy of ``ranges``, to tell if they were edited."""
+    if isinstance(ranges, (list, tuple, np.ndarray)):
+        return tuple(_freeze_ranges(item) for item in ranges)
+    return ranges
+
+
+class _RangeTable:
+    """
+    Sorted lookup table for a list of exclusive (min, max) ranges.
+
+    The range endpoints split the number line into open segments and the
+    endpoints themselves. Which ranges contain each of those is worked out
+    once here, so a lookup is one binary search.
+
+    Parameters
+    ----------
+    ranges : list of (min, max)
+        The ranges. A value matches a range if ``min < value < max``.
+
+    Raises
+    ------
+    MirrorLogicError
+        If ``ranges`` is not a list of (min, max) pairs.
+    """
+
+    def __init__(self, ranges: list[list[numeric]]):
+        try:
+            limits = np.array(ranges, dtype=float)
+        except (TypeError, ValueError):
+            limits = None
+        if limits is None or limits.ndim != 2 or limits.shape[1] != 2:
+            shape = None if limits is None else limits.shape
+            raise MirrorLogicError(
+                "Provided ranges must be a list of ranges (min, max).  "
+                f"Received an array of shape: {shape}"
+            )
+        self.shape = limits.shape
+        bounds = np.unique(limits)
+        # The open segments below, between and above the bounds
+        gaps = np.concatenate(([-np.inf], bounds, [np.inf]))
+        lows, highs = gaps[:-1, None], gaps[1:, None]
+        # A segment is in a range if it lies between the range's endpoints
+        segment_hits = (limits[:, 0] <= lows) & (highs <= limits[:, 1])
+        bound_hits = ((limits[:, 0] < bounds[:, None])
+                      & (bounds[:, None] < limits[:, 1]))
+        # Rows 0..n are the segments, rows n+1..2n the bounds themselves
+        self._hits = np.concatenate((segment_hits, bound_hits))
+        counts = self._hits.sum(axis=1)
+        self._index = np.where(counts == 1, self._hits.argmax(axis=1),
+                               np.where(counts == 0, -1, -2))
+        self._bounds = bounds
+        self._bound_list = bounds.tolist()
+        self._hit_rows = [tuple(row) for row in self._hits.tolist()]
+        self._index_list = self._index.tolist()
+        # Values that match nothing, such as NaN
+        self._no_hits = (False,) * self.shape[0]
+
+    def _row(self, value: numeric) -> Optional[int]:
+        if value != value:
+            return None
+        pos = bisect.bisect_left(self._bound_list, value)
+        if pos < len(self._bound_list) and self._bound_list[pos] == value:
+            return len(self._bound_list) + 1 + pos
+        return pos
+
+    def _rows(self, values: np.ndarray) -> np.ndarray:
+        values = np.asarray(values, dtype=float)
+        pos = np.searchsorted(self._bounds, values, side='left')
+        clipped = np.minimum(pos, max(len(self._bounds) - 1, 0))
+        on_bound = ((pos < len(self._bounds))
+                    & (self._bounds[clipped] == values))
+        return np.where(on_bound, len(self._bounds) + 1 + pos, pos)
+
+    def matches(self, value: numeric) -> tuple[bool, ...]:
+        """Report if ``value`` is in each range."""
+        row = self._row(value)
+        return self._no_hits if row is None else self._hit_rows[row]
+
+    def index(self, value: numeric) -> int:
+        """The one range ``value`` is in, -1 for none or -2 for several."""
+        row = self._row(value)
+        return -1 if row is None else self._index_list[row]
+
+    def matches_many(self, values: np.ndarray) -> np.ndarray:
+        """`matches` for an array of values, one row per value."""
+        values = np.asarray(values, dtype=float)
+        hits = self._hits[self._rows(values)]
+        hits[np.isnan(values)] = False
+        return hits
+
+    def index_many(self, values: np.ndarray) -> np.ndarray:
+        """`index` for an array of values."""
+        values = np.asarray(values, dtype=float)
+        return np.where(np.isnan(values), -1, self._index[self._rows(values)])
+
+
 class OMMotor(FltMvInterface, PVPositioner):
     """Base class for each motor in the LCLS offset mirror system."""
     __doc__ += basic_positioner_init
@@ -417,6 +515,8 @@ class XOffsetMirror(BaseInterface, GroupDevice, LightpathMixin):
         pitch_ranges: list[list[list[int]]] = [],
         **kwargs
     ) -> None:
+        # attr -> (frozen ranges, compiled table) for each set of ranges
+        self._compiled_ranges = {}
         # insertion status, [[min_x_out, max_x_out], [min_x_in, max_x_in]]
         self.x_ranges = x_ranges
         # coating status.  (n_coatings * 2) array
@@ -503,6 +603,123 @@ class XOffsetMirror(BaseInterface, GroupDevice, LightpathMixin):
                 output={self.output_branches[0]: 0}
             )
 
+    @property
+    def x_ranges(self) -> list[list[numeric]]:
+        """Insertion ranges: [[min_x_out, max_x_out], [min_x_in, max_x_in]]"""
+        return self._x_ranges
+
+    @x_ranges.setter
+    def x_ranges(self, ranges: list[list[numeric]]) -> None:
+        self._x_ranges = ranges
+        self._get_compiled('x_ranges', self._compile_x_ranges)
+
+    @property
+    def y_ranges(self) -> list[list[numeric]]:
+        """Coating ranges: one [min_y, max_y] per coating"""
+        return self._y_ranges
+
+    @y_ranges.setter
+    def y_ranges(self, ranges: list[list[numeric]]) -> None:
+        self._y_ranges = ranges
+        self._get_compiled('y_ranges', self._compile_ranges)
+
+    @property
+    def pitch_ranges(self) -> list[list[list[numeric]]]:
+        """Pitch ranges: one [min_p, max_p] per destination, per coating"""
+        return self._pitch_ranges
+
+    @pitch_ranges.setter
+    def pitch_ranges(self, ranges: list[list[list[numeric]]]) -> None:
+        self._pitch_ranges = ranges
+        self._get_compiled('pitch_ranges', self._compile_pitch_ranges)
+
+    @property
+    def _x_table(self) -> Union[_RangeTable, MirrorLogicError, None]:
+        return self._get_compiled('x_ranges', self._compile_x_ranges)
+
+    @property
+    def _y_table(self) -> Union[_RangeTable, MirrorLogicError, None]:
+        return self._get_compiled('y_ranges', self._compile_ranges)
+
+    @property
+    def _pitch_tables(self) -> list[Union[_RangeTable, MirrorLogicError, None]]:
+        return self._get_compiled('pitch_ranges', self._compile_pitch_ranges)
+
+    def _get_compiled(self, attr: str, compile_ranges: Callable) -> Any:
+        """
+        The lookup table(s) compiled from the ranges in ``attr``.
+
+        The ranges are compared with the copy they were last compiled from,
+        so edits made in place, e.g. ``mirror.x_ranges[1][0] = 5``, are
+        compiled again the next time the tables are used.
+        """
+        ranges = getattr(self, attr)
+        source = _freeze_ranges(ranges)
+        compiled = self._compiled_ranges.get(attr)
+        if compiled is None or compiled[0] != source:
+            compiled = (source, compile_ranges(attr, ranges))
+            self._compiled_ranges[attr] = compiled
+        return compiled[1]
+
+    @classmethod
+    def _compile_x_ranges(
+        cls,
+        attr: str,
+        ranges: list[list[numeric]],
+    ) -> Union[_RangeTable, MirrorLogicError, None]:
+        """Compile the insertion ranges, which must be an out and an in."""
+        table = cls._compile_ranges(attr, ranges)
+        if isinstance(table, _RangeTable) and table.shape != (2, 2):
+            # improper ranges for insertion
+            table = MirrorLogicError(
+                'Provided x-ranges are the malformed. '
+                f'got: {table.shape}, expected (2,2)')
+            logger.warning('Invalid x_ranges %s: %s', ranges, table)
+        return table
+
+    @classmethod
+    def _compile_pitch_ranges(
+        cls,
+        attr: str,
+        ranges: list[list[list[numeric]]],
+    ) -> list[Union[_RangeTable, MirrorLogicError, None]]:
+        """Compile the pitch ranges, one table per coating."""
+        try:
+            return [cls._compile_ranges(attr, coating_ranges)
+                    for coating_ranges in ranges]
+        except TypeError:
+            return []
+
+    @staticmethod
+    def _compile_ranges(
+        attr: str,
+        ranges: list[list[numeric]],
+    ) -> Union[_RangeTable, MirrorLogicError, None]:
+        """
+        Compile ranges into a lookup table.
+
+        Returns None for the empty default, and a malformed set of ranges
+        gives back the error, to be raised when the ranges are used.
+        """
+        if isinstance(ranges, list) and ranges == []:
+            return None
+        try:
+            return _RangeTable(ranges)
+        except MirrorLogicError as ex:
+            logger.warning('Invalid %s %s: %s', attr, ranges, ex)
+            return ex
+
+    @staticmethod
+    def _check_table(
+        table: Union[_RangeTable, MirrorLogicError, None]
+    ) -> _RangeTable:
+        """Return a compiled table, or raise the error found compiling it."""
+        if table is None:
+            raise MirrorLogicError('No ranges were provided')
+        if isinstance(table, MirrorLogicError):
+            raise table
+        return table
+
     def _find_matching_range_indices(
         self,
         ranges: list[list[numeric]],
@@ -524,13 +741,7 @@ class XOffsetMirror(BaseInterface, GroupDevice, LightpathMixin):
             A list of booleans, reporting if the value is in each range
             in ``ranges``
         """
-        if len(np.shape(ranges)) < 2:
-            raise MirrorLogicError(
-                "Provided ranges must be a list of ranges (min, max).  "
-                f"Received an array of shape: {np.shape(ranges)}"
-            )
-
-        return [limit[0] < value < limit[1] for limit in ranges]
+        return list(_RangeTable(ranges).matches(value))
 
     def _get_insertion_state(self, x: float) -> tuple[bool, bool]:
         """
@@ -554,18 +765,11 @@ class XOffsetMirror(BaseInterface, GroupDevice, LightpathMixin):
         is_out, is_in : Tuple[bool, bool]
             tuple of booleans describing the inserted and removed status
         """
-        if self.x_ranges == []:
+        if self._x_table is None:
             # default case for always-in mirrors
             return False, True
 
-        if np.shape(self.x_ranges) != (2, 2):
-            # improper ranges for insertion, fail
-            raise MirrorLogicError(
-                'Provided x-ranges are the malformed. '
-                f'got: {np.shape(self.x_ranges)}, expected (2,2)')
-
-        ins_bools = self._find_matching_range_indices(self.x_ranges, x)
-        return ins_bools[0], ins_bools[1]  # out, in
+        return self._check_table(self._x_table).matches(x)  # out, in
 
     def _get_coating_index(self, y: float) -> int:
         """
@@ -586,21 +790,20 @@ class XOffsetMirror(BaseInterface, GroupDevice, LightpathMixin):
         index : int
             The coating state
         """
-        if self.y_ranges == []:
+        if self._y_table is None:
             return 1
 
-        y_idxs = self._find_matching_range_indices(self.y_ranges, y)
-        valid_y_idx = np.where(y_idxs)[0]
-        if len(valid_y_idx) > 1:
+        index = self._check_table(self._y_table).index(y)
+        if index == -2:
             # should only see one valid y-range, coating unknown
             raise MirrorLogicError('only one y-range should be valid')
-        elif len(valid_y_idx) == 0:
+        elif index == -1:
             # coating state is unknown
             raise MirrorLogicError('Coating state is unknown, mirror '
                                    'is not aligned given provided '
                                    'y-ranges')
 
-        return valid_y_idx[0] + 1
+        return index + 1
 
     def _get_output_branch(self, coating_idx: int, pitch: float) -> str:
         """
@@ -627,24 +830,126 @@ class XOffsetMirror(BaseInterface, GroupDevice, LightpathMixin):
         output_branch : str
             the name of the current beam destination
         """
-        if self.pitch_ranges == []:
+        if not self._pitch_tables:
             return self.output_branches[0]
 
         # use coating to pick proper pitch ranges
         # 0 state is unknown, 1 is the first coating.  decrement to get index
-        pitch_limit_list = self.pitch_ranges[coating_idx]
-
-        # find indices ranges where pitch is valid
-        pitch_idxs = self._find_matching_range_indices(pitch_limit_list, pitch)
-        valid_pitch_idx = np.where(pitch_idxs)[0]
+        pitch_table = self._check_table(self._pitch_tables[coating_idx])
 
         # pitch should only be within one valid range
-        if len(valid_pitch_idx) != 1:
+        index = pitch_table.index(pitch)
+        if index < 0:
             raise MirrorLogicError('only one pitch-range should be valid')
 
         # index of valid range = index of output_branch + 1
         # assuming first output_branch is through line
-        return self.output_branches[valid_pitch_idx[0] + 1]
+        return self.output_branches[index + 1]
+
+    def _classify_insertion(
+        self,
+        x: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """`_get_insertion_state` for an array of samples."""
+        if self._x_table is None:
+            return np.zeros(x.shape, dtype=bool), np.ones(x.shape, dtype=bool)
+        hits = self._check_table(self._x_table).matches_many(x)
+        return hits[..., 0], hits[..., 1]
+
+    def _classify_coating(
+        self,
+        y: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        `_get_coating_index` for an array of samples.
+
+        Returns the coating indices and a mask of the valid ones.
+        """
+        if self._y_table is None:
+            return np.ones(y.shape, dtype=int), np.ones(y.shape, dtype=bool)
+        index = self._check_table(self._y_table).index_many(y)
+        return index + 1, index >= 0
+
+    def _classify_output_branch(
+        self,
+        coating_idx: np.ndarray,
+        pitch: np.ndarray,
+        valid: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        `_get_output_branch` for an array of samples.
+
+        Only the samples in the ``valid`` mask are looked up. Returns the
+        output branch indices and a mask of the valid ones.
+        """
+        branch = np.zeros(pitch.shape, dtype=int)
+        if not self._pitch_tables:
+            return branch, valid
+        valid = valid.copy()
+        for coating in np.unique(coating_idx[valid]):
+            mask = valid & (coating_idx == coating)
+            if not 0 <= coating < len(self._pitch_tables):
+                # no pitch ranges for this coating
+                valid[mask] = False
+                continue
+            table = self._check_table(self._pitch_tables[coating])
+            index = table.index_many(pitch[mask])
+            branch[mask] = index + 1
+            valid[mask] = index >= 0
+        return branch, valid
+
+    def classify_positions(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        pitch: np.ndarray,
+    ) -> dict[str, np.ndarray]:
+        """
+        Find the lightpath state for many samples at once.
+
+        This applies the same logic as ``calc_lightpath_state`` to arrays
+        of the lightpath signal values, for example to replay the beam path
+        from archived positions.
+
+        Parameters
+        ----------
+        x, y, pitch : array-like
+            The values of the lightpath signals, in the order of
+            ``lightpath_cpts``. These are broadcast against each other.
+
+        Returns
+        -------
+        states : dict of str to np.ndarray
+            The ``inserted`` and ``removed`` flags, the ``branch`` that
+            gets beam and its ``transmission`` for each sample.
+        """
+        x, y, pitch = np.broadcast_arrays(
+            *(np.asarray(value, dtype=float) for value in (x, y, pitch))
+        )
+        shape = x.shape
+        branches = np.array(self.output_branches, dtype=object)
+        try:
+            x_out, x_in = self._classify_insertion(x)
+            coating_idx, valid = self._classify_coating(y)
+            branch_idx, valid = self._classify_output_branch(
+                coating_idx, pitch, valid)
+        except MirrorLogicError as ex:
+            self.log.debug(ex)
+            return dict(
+                inserted=np.zeros(shape, dtype=bool),
+                removed=np.zeros(shape, dtype=bool),
+                branch=np.full(shape, branches[0], dtype=object),
+                transmission=np.zeros(shape),
+            )
+        # Samples that fail the logic block the beam
+        failed = ~x_out & ~valid
+        return dict(
+            inserted=x_in & ~failed,
+            removed=x_out,
+            branch=np.where(x_out | failed, branches[0],
+                            branches[np.where(valid, branch_idx, 0)]),
+            transmission=np.where(failed, 0.0, 1.0),
+        )
 
     # Tab config: show components
     tab_component_names = True
@@ -880,14 +1185,7 @@ class XOffsetMirrorBend(XOffsetMirror):
             current lightpath state of the device
         """
         try:
-            if np.shape(self.y_ranges) != (2, 2):
-                # improper ranges for insertion, fail
-                raise MirrorLogicError(
-                    'Provided x-ranges are the malformed. '
-                    f'got: {np.shape(self.x_ranges)}, expected (2,2)')
-
-            x_out, x_in = self._find_matching_range_indices(self.y_ranges,
-                                                            y_up)
+            x_out, x_in = self._get_bend_insertion_table().matches(y_up)
 
             if x_in and not x_out:
                 out_branch = self.output_branches[1]
@@ -909,6 +1207,46 @@ class XOffsetMirrorBend(XOffsetMirror):
                 output={self.output_branches[0]: 0}
             )
 
+    def _get_bend_insertion_table(self) -> _RangeTable:
+        """The y-ranges, which determine insertion for this mirror."""
+        table = self._y_table
+        if not isinstance(table, _RangeTable) or table.shape != (2, 2):
+            # improper ranges for insertion, fail
+            raise MirrorLogicError(
+                'Provided x-ranges are the malformed. '
+                f'got: {np.shape(self.x_ranges)}, expected (2,2)')
+        return table
+
+    def classify_positions(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        pitch: np.ndarray,
+    ) -> dict[str, np.ndarray]:
+        x, y, pitch = np.broadcast_arrays(
+            *(np.asarray(value, dtype=float) for value in (x, y, pitch))
+        )
+        branches = np.array(self.output_branches, dtype=object)
+        try:
+            hits = self._get_bend_insertion_table().matches_many(y)
+        except MirrorLogicError as ex:
+            self.log.debug(ex)
+            return dict(
+                inserted=np.zeros(y.shape, dtype=bool),
+                removed=np.zeros(y.shape, dtype=bool),
+                branch=np.full(y.shape, branches[0], dtype=object),
+                transmission=np.zeros(y.shape),
+            )
+        x_out, x_in = hits[..., 0], hits[..., 1]
+        return dict(
+            inserted=x_in,
+            removed=x_out,
+            branch=np.where(x_in & ~x_out, branches[1], branches[0]),
+            transmission=np.ones(y.shape),
+        )
+
+    classify_positions.__doc__ = XOffsetMirror.classify_positions.__doc__
+
 
 # Maintain backward compatibility
 XOffsetMirror2 = XOffsetMirrorBend
@@ -976,6 +1314,22 @@ class XOffsetMirrorSwitch(XOffsetMirror):
             inserted=True, removed=False, output={self.output_branches[0]: 1}
         )
 
+    def classify_positions(
+        self,
+        x: np.ndarray,
+        pitch: np.ndarray,
+    ) -> dict[str, np.ndarray]:
+        shape = np.broadcast_shapes(np.shape(x), np.shape(pitch))
+        # currently always in, no switching
+        return dict(
+            inserted=np.ones(shape, dtype=bool),
+            removed=np.zeros(shape, dtype=bool),
+            branch=np.full(shape, self.output_branches[0], dtype=object),
+            transmission=np.ones(shape),
+        )
+
+    classify_positions.__doc__ = XOffsetMirror.classify_positions.__doc__
+
 
 class KBOMirror(BaseInterface, GroupDevice, LightpathMixin):
     """
@@ -1446,6 +1800,13 @@ class XOffsetMirrorState(XOffsetMirror):
             raise MirrorLogicError('coating state not valid or unknown')
         return y - 1
 
+    def _classify_coating(
+        self,
+        y: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        valid = y >= 1
+        return np.where(valid, y, 1).astype(int) - 1, valid
+
     def calc_lightpath_state(
         self,
         x_up: float,
@@ -1583,6 +1944,21 @@ class XOffsetMirrorXYState(XOffsetMirrorState):
 
         return x_out, x_in
 
+    def _classify_insertion(
+        self,
+        x: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if not self.insertion._state_initialized:
+            return np.ones(x.shape, dtype=bool), np.ones(x.shape, dtype=bool)
+        x_out = np.zeros(x.shape, dtype=bool)
+        x_in = np.zeros(x.shape, dtype=bool)
+        # only a few distinct states, so check each one once
+        for state in np.unique(x[~np.isnan(x)]):
+            mask = x == state
+            x_in[mask] = self.insertion.check_inserted(int(state))
+            x_out[mask] = self.insertion.check_removed(int(state))
+        return x_out, x_in
+
     def calc_lightpath_state(
         self,
         insertion_state: int,
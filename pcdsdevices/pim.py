@@ -18,7 +18,7 @@ from ophyd.signal import EpicsSignal
 from .analog_signals import FDQ
 from .areadetector.detectors import (PCDSAreaDetectorEmbedded,
                                      PCDSAreaDetectorTyphosTrigger)
-from .device import GroupDevice
+from .device import ComponentAlias, GroupDevice
 from .device import UpdateComponent as UpCpt
 from .digital_signals import J120K
 from .epics_motor import IMS, BeckhoffAxisNoOffset
@@ -96,6 +96,7 @@ class PIM(BaseInterface, GroupDevice, LightpathInOutCptMixin):
     zoom = FCpt(IMS, '{self._prefix_zoom}', kind='normal')
     detector = FCpt(PCDSAreaDetectorEmbedded, '{self._prefix_det}',
                     kind='normal')
+    y = ComponentAlias('state.motor')
 
     tab_whitelist = ['y', 'remove', 'insert', 'removed', 'inserted']
     tab_component_names = True
@@ -199,7 +200,6 @@ Y Position: {y_pos} [{y_units}]
             self._prefix_zoom = self.prefix_start+'CLZ:01'
 
         super().__init__(prefix, name=name, **kwargs)
-        self.y = self.state.motor
 
 
 class PIMWithFocus(PIM):
@@ -3,6 +3,7 @@ import enum
 import logging
 import time
 import warnings
+from typing import Optional
 
 import numpy as np
 import ophyd
@@ -469,6 +470,8 @@ class SyncAxis(FltMvInterface, PseudoPositioner):
         self._check_settings()
         self._has_setup = False
         self._real_attrs = [attr for attr, _ in self._get_real_positioners()]
+        self._real_index = {attr: idx for idx, attr in enumerate(self._real_attrs)}
+        self._array_source = None
         self.scales = self._fill_info_dict(
             self.scales, self.default_scale, 'scales')
         super().__init__(*args, **kwargs)
@@ -527,6 +530,29 @@ class SyncAxis(FltMvInterface, PseudoPositioner):
             else:
                 raise ValueError(f'Invalid offset_mode: {self.offset_mode}')
             self._has_setup = True
+        if (self.scales, self.offsets) != self._array_source:
+            self._update_arrays()
+
+    def _update_arrays(self):
+        """
+        Hold the scales and offsets as arrays in real motor order.
+
+        ``scales`` and ``offsets`` stay the source of truth: `_setup_offsets`
+        calls this again whenever either of them has changed.
+        """
+        self._scale_array = np.array(
+            [self.scales[attr] for attr in self._real_attrs], dtype=float)
+        self._offset_array = np.array(
+            [self.offsets[attr] for attr in self._real_attrs], dtype=float)
+        self._array_source = (dict(self.scales), dict(self.offsets))
+
+    def _real_position_array(self, real_pos):
+        """The real positions as an array in real motor order."""
+        return np.array([
+            # Synchronized pseudo motors give tuples, use the first value
+            pos[0] if isinstance(pos, tuple) else pos
+            for pos in real_pos
+        ], dtype=float)
 
     def _handle_static_fixed(self):
         self.offsets = self._fill_info_dict(
@@ -550,10 +576,47 @@ class SyncAxis(FltMvInterface, PseudoPositioner):
         Offsets are defined in the class definition.
         """
         self._setup_offsets()
-        real_pos = {}
-        for attr in self._real_attrs:
-            real_pos[attr] = self.forward_single(attr, pseudo_pos.sync)
-        return self.RealPosition(**real_pos)
+        real_pos = pseudo_pos.sync * self._scale_array + self._offset_array
+        return self.RealPosition(*real_pos.tolist())
+
+    def forward_many(self, sync_positions):
+        """
+        Calculate the real motor trajectories for an array of sync positions.
+
+        Parameters
+        ----------
+        sync_positions : np.ndarray
+            1D array of sync positions.
+
+        Returns
+        -------
+        real_positions : np.ndarray
+            Array of shape ``(len(sync_positions), n_real)``, with one column
+            per real motor in the order of ``RealPosition``.
+        """
+        self._setup_offsets()
+        return (np.multiply.outer(np.ravel(sync_positions), self._scale_array)
+                + self._offset_array)
+
+    def inverse_many(self, real_positions):
+        """
+        Calculate the sync position implied by each real motor position.
+
+        Parameters
+        ----------
+        real_positions : np.ndarray
+            Array of shape ``(n, n_real)``, with one column per real motor in
+            the order of ``RealPosition``.
+
+        Returns
+        -------
+        sync_positions : np.ndarray
+            Array of shape ``(n, n_real)``.  Column 0 is what `inverse`
+            reports; the columns all agree when the motors are in sync.
+        """
+        self._setup_offsets()
+        return ((np.asarray(real_positions, dtype=float) - self._offset_array)
+                / self._scale_array)
 
     def forward_single(self, attr, pos):
         """
@@ -561,7 +624,9 @@ class SyncAxis(FltMvInterface, PseudoPositioner):
 
         This gives us the real motor setpoint value for one axis.
         """
-        return pos * self.scales[attr] + self.offsets[attr]
+        self._setup_offsets()
+        idx = self._real_index[attr]
+        return pos * self._scale_array.item(idx) + self._offset_array.item(idx)
 
     @real_position_argument
     def inverse(self, real_pos):
@@ -588,7 +653,9 @@ class SyncAxis(FltMvInterface, PseudoPositioner):
             # Psuedo position tuple, assume first value is correct
             # This happens if we are synchronizing pseudo motors
             pos = pos[0]
-        return (pos - self.offsets[attr]) / self.scales[attr]
+        self._setup_offsets()
+        idx = self._real_index[attr]
+        return (pos - self._offset_array.item(idx)) / self._scale_array.item(idx)
 
     def is_synced(self, real_pos=None):
         """
@@ -600,16 +667,10 @@ class SyncAxis(FltMvInterface, PseudoPositioner):
         """
         if real_pos is None:
             real_pos = self.real_position
-        pseudo_calcs = []
-        for attr, pos in real_pos._asdict().items():
-            calc = self.inverse_single(attr, pos)
-            pseudo_calcs.append(calc)
-        pick_answer = pseudo_calcs[0]
-        for calc in pseudo_calcs:
-            if not np.isclose(pick_answer, calc,
-                              atol=self.warn_deadband, rtol=0):
-                return False
-        return True
+        self._setup_offsets()
+        pseudo_calcs = self.inverse_many(self._real_position_array(real_pos))
+        return bool(np.all(np.abs(pseudo_calcs - pseudo_calcs[0])
+                           <= self.warn_deadband))
 
     def consistency_warning(self):
         """
@@ -921,12 +982,84 @@ class SimDelayStage(DelayBase):
 delay_classes[FastMotor] = SimDelayStage
 
 
+class _TableInterpolator:
+    """
+    Interpolate lookup table columns ``fp`` as functions of the column ``xp``.
+
+    The direction of ``xp`` is sorted out once here instead of on every
+    conversion.
+
+    Parameters
+    ----------
+    xp : np.ndarray
+        The 1D column to interpolate over.
+    fp : np.ndarray
+        The 2D array of columns to interpolate.
+    kind : {'linear', 'pchip', 'spline'}
+        ``linear`` matches ``np.interp``. ``pchip`` and ``spline`` use
+        scipy's ``PchipInterpolator`` and ``CubicSpline`` respectively.
+    """
+
+    kinds = ('linear', 'pchip', 'spline')
+
+    def __init__(self, xp: np.ndarray, fp: np.ndarray, kind: str = 'linear'):
+        if kind not in self.kinds:
+            raise ValueError(
+                f'Unsupported interpolation {kind!r}, expected one of '
+                f'{self.kinds}'
+            )
+        xp = np.asarray(xp, dtype=float)
+        fp = np.asarray(fp, dtype=float)
+        # xp must be strictly increasing for np.interp
+        self.monotonic = True
+        if not is_strictly_increasing(xp):
+            # Try reverse
+            xp = xp[::-1]
+            fp = fp[::-1]
+            # Check one more time in case neither direction works
+            self.monotonic = is_strictly_increasing(xp)
+        if not self.monotonic and kind != 'linear':
+            raise ValueError(
+                f'{kind} interpolation requires a strictly increasing or '
+                f'decreasing lookup table'
+            )
+        self.xp = xp
+        self.fp = fp
+        self.kind = kind
+        self._spline = None
+        if kind != 'linear':
+            # Only pull in scipy.interpolate when it is asked for
+            from scipy import interpolate
+            if kind == 'pchip':
+                self._spline = interpolate.PchipInterpolator(xp, fp, axis=0)
+            else:
+                self._spline = interpolate.CubicSpline(xp, fp, axis=0)
+
+    def __call__(self, x) -> np.ndarray:
+        """
+        Interpolate at ``x``, a value or an array of values.
+
+        Returns an array with the shape of ``x`` plus one trailing axis for
+        the columns of ``fp``.  As with ``np.interp``, values outside of the
+        table are clamped to its ends.
+        """
+        x = np.asarray(x, dtype=float)
+        if self._spline is not None:
+            return self._spline(np.clip(x, self.xp[0], self.xp[-1]))
+        return np.stack(
+            [np.interp(x, self.xp, column) for column in self.fp.T],
+            axis=-1,
+        )
+
+
 class LookupTablePositioner(PseudoPositioner):
     """
     A pseudo positioner which uses a look-up table to compute positions.
 
-    Currently supports 1 pseudo positioner and 1 "real" positioner, which
-    should be columns of a 2D numpy.ndarray ``table``.
+    Supports 1 pseudo positioner and 1 or more "real" positioners, which
+    should be columns of a 2D numpy.ndarray ``table``.  The table is
+    prepared for interpolation once, when it is set; assign a new ``table``
+    (or use :meth:`set_table`) to swap it out.
 
     For additional ``__init__`` arguments, see :class:`ophyd.PseudoPositioner`.
 
@@ -945,19 +1078,66 @@ class LookupTablePositioner(PseudoPositioner):
         List of column names, corresponding to the component attribute names.
         That is, if you have a real motor ``mtr = Cpt(EpicsMotor, ...)``,
         ``"mtr"`` should be in the list of column names of the table.
+
+    interpolation : {'linear', 'pchip', 'spline'}, optional
+        How to interpolate between the rows of the table.  Defaults to
+        ``linear``, as in ``np.interp``.
+
+    inverse_axis : str, optional
+        With more than one real positioner, the name of the one used to
+        calculate the pseudo position.  Defaults to the first real
+        positioner with a strictly monotonic column.
     """
 
-    table: np.ndarray
     column_names: tuple[str, ...]
+    interpolation: str
+    _table: np.ndarray
     _table_data_by_name: dict[str, np.ndarray]
+    _forward_interpolator: _TableInterpolator
+    _inverse_interpolator: _TableInterpolator
+    _inverse_axis: str
 
     def __init__(self, *args,
                  table: np.ndarray,
                  column_names: list[str],
+                 interpolation: str = 'linear',
+                 inverse_axis: Optional[str] = None,
                  **kwargs):
         super().__init__(*args, **kwargs)
-        self.table = table
-        self.column_names = tuple(column_names)
+        if len(self._pseudo) != 1:
+            raise ValueError(
+                'LookupTablePositioner supports exactly one pseudo positioner'
+            )
+        self.interpolation = interpolation
+        self._requested_inverse_axis = inverse_axis
+        self.set_table(table, column_names=column_names)
+
+    @property
+    def table(self) -> np.ndarray:
+        """The lookup table.  Setting this prepares the new table for use."""
+        return self._table
+
+    @table.setter
+    def table(self, table: np.ndarray):
+        self.set_table(table)
+
+    def set_table(
+        self, table: np.ndarray, column_names: Optional[list[str]] = None
+    ) -> None:
+        """
+        Set a new lookup table and prepare it for conversions.
+
+        Parameters
+        ----------
+        table : np.ndarray
+            The table of information.
+
+        column_names : list of str, optional
+            List of column names.  Defaults to the current column names.
+        """
+        table = np.asarray(table)
+        if column_names is None:
+            column_names = self.column_names
         missing = set()
         for positioner in self._real + self._pseudo:
             if positioner.attr_name not in column_names:
@@ -966,22 +1146,75 @@ class LookupTablePositioner(PseudoPositioner):
         if missing:
             raise ValueError(f'Positioners {missing} not present in the table')
 
-        if len(column_names) != self.table.shape[-1]:
+        if len(table.shape) != 2:
+            raise ValueError(f'Unsupported table dimensions: {table.shape}')
+
+        if len(column_names) != table.shape[-1]:
             raise ValueError(
                 'Incorrect number of column names for the given table.'
             )
 
-        # For now, no fancy interpolation options
-        if len(table.shape) != 2:
-            raise ValueError(f'Unsupported table dimensions: {table.shape}')
-
-        self._table_data_by_name = {
-            column_name: self.table[:, idx]
+        table_data_by_name = {
+            column_name: table[:, idx]
             for idx, column_name in enumerate(column_names)
         }
 
+        pseudo_field, = self.PseudoPosition._fields
+        real_fields = self.RealPosition._fields
+        forward = _TableInterpolator(
+            table_data_by_name[pseudo_field],
+            np.column_stack([table_data_by_name[fld] for fld in real_fields]),
+            kind=self.interpolation,
+        )
+        inverse = None
+        inverse_axis = self._requested_inverse_axis
+        if inverse_axis is not None:
+            if inverse_axis not in real_fields:
+                raise ValueError(
+                    f'Inverse axis {inverse_axis} is not a real positioner'
+                )
+            candidates = (inverse_axis, )
+        else:
+            candidates = real_fields
+        for real_field in candidates:
+            try:
+                interpolator = _TableInterpolator(
+                    table_data_by_name[real_field],
+                    table_data_by_name[pseudo_field][:, np.newaxis],
+                    kind=self.interpolation,
+                )
+            except ValueError:
+                continue
+            if inverse is None or (interpolator.monotonic
+                                   and not inverse.monotonic):
+                inverse = interpolator
+                inverse_axis = real_field
+            if interpolator.monotonic:
+                break
+        if inverse is None:
+            raise ValueError(
+                f'{self.interpolation} interpolation requires a strictly '
+                f'increasing or decreasing column for the inverse calculation'
+            )
+
+        if not (forward.monotonic and inverse.monotonic):
+            self.log.warning(
+                "Lookup table is not strictly increasing or decreasing! "
+                "This will give inconsistent results!"
+            )
+
+        self._table = table
+        self.column_names = tuple(column_names)
+        self._table_data_by_name = table_data_by_name
+        self._forward_interpolator = forward
+        self._inverse_interpolator = inverse
+        self._inverse_axis = inverse_axis
+
         for attr, data in self._table_data_by_name.items():
-            obj = getattr(self, attr)
+            obj = getattr(self, attr, None)
+            if obj is None:
+                # Extra columns are allowed
+                continue
             limits = (np.min(data), np.max(data))
             if isinstance(obj, PseudoSingle):
                 obj._limits = limits
@@ -1006,16 +1239,8 @@ class LookupTablePositioner(PseudoPositioner):
         real_position : RealPosition
             The real position output, a namedtuple.
         '''
-        values = pseudo_pos._asdict()
-        pseudo_field, real_field = self._get_field_names()
-        xp, fp = self._load_table_arrays(x_name=pseudo_field, f_name=real_field)
-
-        real_value = np.interp(
-            values[pseudo_field],
-            xp,
-            fp,
-        )
-        return self.RealPosition(**{real_field: real_value})
+        real_values = self._forward_interpolator(pseudo_pos[0])
+        return self.RealPosition(*(float(value) for value in real_values))
 
     @real_position_argument
     def inverse(self, real_pos: tuple) -> tuple:
@@ -1032,75 +1257,48 @@ class LookupTablePositioner(PseudoPositioner):
         pseudo_pos : PseudoPosition
             The pseudo position output
         '''
-        values = real_pos._asdict()
-        pseudo_field, real_field = self._get_field_names()
-        xp, fp = self._load_table_arrays(x_name=real_field, f_name=pseudo_field)
-
-        pseudo_value = np.interp(
-            values[real_field],
-            xp,
-            fp,
-        )
-        return self.PseudoPosition(**{pseudo_field: pseudo_value})
+        value = getattr(real_pos, self._inverse_axis)
+        pseudo_value, = self._inverse_interpolator(value)
+        return self.PseudoPosition(float(pseudo_value))
 
-    def _get_field_names(self) -> tuple[str, str]:
+    def forward_many(self, pseudo_positions: np.ndarray) -> np.ndarray:
         """
-        Returns the name of the pseudo field and the name of the real field.
+        Calculate real positions for an array of pseudo positions.
+
+        Parameters
+        ----------
+        pseudo_positions : np.ndarray
+            1D array of pseudo positions.
 
         Returns
         -------
-        fields: tuple of str
-            (pseudo_field, real_field)
+        real_positions : np.ndarray
+            Array of shape ``(len(pseudo_positions), n_real)``, with columns
+            in the order of ``RealPosition``.
         """
-        pseudo_field, = self.PseudoPosition._fields
-        real_field, = self.RealPosition._fields
-
-        return pseudo_field, real_field
+        return self._forward_interpolator(np.ravel(pseudo_positions))
 
-    def _load_table_arrays(self, x_name: str, f_name: str) -> tuple[np.ndarray, np.ndarray]:
+    def inverse_many(self, real_positions: np.ndarray) -> np.ndarray:
         """
-        Load array data from the lookup table in a format ready for np.interp.
-
-        This returns the xp and fp arguments that np.interp is expecting.
-        xp is the x-coordinates of the data points, and
-        fp is the y-coordinates of the data points.
-
-        np.interp is expecting xp to be strictly increasing.
-        If xp is not strictly increasing, this function will try reversing
-        the array ordering to make it so, which will work if xp is strictly
-        decreasing.
-
-        If xp is neither strictly increasing nor strictly decreasing
-        and therefore cannot be coerced into a strictly increasing sequence,
-        this will show a warning but continue anyway.
+        Calculate pseudo positions for an array of real positions.
 
         Parameters
         ----------
-        x_name: str
-            The name associated with the x-axis data.
-        f_name: str
-            The name associated with the y-axis data.
+        real_positions : np.ndarray
+            Either a 1D array of positions of the inverse axis, or an array
+            of shape ``(n, n_real)`` with columns in the order of
+            ``RealPosition``.
 
         Returns
-        xp, fp: tuple of np.ndarray
-            The xp and fp arguments needed for np.interp.
+        -------
+        pseudo_positions : np.ndarray
+            1D array of pseudo positions.
         """
-        xp = self._table_data_by_name[x_name]
-        fp = self._table_data_by_name[f_name]
-
-        # xp must be strictly increasing for np.interp
-        if not is_strictly_increasing(xp):
-            # Try reverse
-            xp = xp[::-1]
-            fp = fp[::-1]
-            # Check one more time in case neither direction works
-            if not is_strictly_increasing(xp):
-                self.log.warning(
-                    "Lookup table is not strictly increasing or decreasing! "
-                    "This will give inconsistent results!"
-                )
-
-        return xp, fp
+        real_positions = np.asarray(real_positions, dtype=float)
+        if real_positions.ndim == 2:
+            idx = self.RealPosition._fields.index(self._inverse_axis)
+            real_positions = real_positions[:, idx]
+        return self._inverse_interpolator(real_positions)[..., 0]
 
 
 def is_strictly_increasing(arr: np.ndarray) -> bool:
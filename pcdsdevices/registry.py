@@ -1,3 +1,193 @@
+"""
+Registry of instantiated devices and connection helpers built on top of it.
+"""
+import dataclasses
+import logging
+import time
+from typing import Optional
+
+from ophyd.device import do_not_wait_for_lazy_connection
 from ophyd.ophydobj import register_instances_keyed_on_name
+from prettytable import PrettyTable
+
+logger = logging.getLogger(__name__)
 
 device_registry = register_instances_keyed_on_name()
+
+
+@dataclasses.dataclass
+class ConnectionStatus:
+    """
+    Connection summary for one device, as reported by `warm_up_connections`.
+
+    Attributes
+    ----------
+    name : str
+        The device name.
+    pvs : int
+        The number of EPICS signals found in the device tree.
+    connected : int
+        How many of those signals connected before the deadline.
+    elapsed : float or None
+        Seconds until the last of the signals connected, or None if some
+        did not connect.
+    missing : list of str
+        The PV names of the signals that did not connect.
+    """
+    name: str
+    pvs: int
+    connected: int
+    elapsed: Optional[float]
+    missing: list[str]
+
+
+def _top_level_objects():
+    """All registered devices and EPICS signals that have no parent."""
+    return [obj for obj in list(device_registry.values())
+            if obj.parent is None
+            and (hasattr(obj, 'walk_signals') or _is_epics_signal(obj))]
+
+
+def _is_epics_signal(signal):
+    """True for signals backed by a PV, which carry a ``pvname``."""
+    return getattr(signal, 'pvname', None) is not None
+
+
+def _create_lazy(device):
+    """Create every lazy component in a device tree."""
+    # Lazy signals would otherwise wait for their own connection here
+    with do_not_wait_for_lazy_connection(device):
+        for attr in device.component_names:
+            child = getattr(device, attr)
+            if hasattr(child, 'component_names'):
+                _create_lazy(child)
+
+
+def _epics_signals(obj, include_lazy):
+    """The PV-backed signals in a device tree, or the signal itself."""
+    if not hasattr(obj, 'walk_signals'):
+        return [obj] if _is_epics_signal(obj) else []
+    if include_lazy:
+        _create_lazy(obj)
+    walk = obj.walk_signals(include_lazy=include_lazy)
+    return [item.item for item in walk if _is_epics_signal(item.item)]
+
+
+def _pvnames(signal):
+    """The PV names used by a signal."""
+    names = [signal.pvname]
+    setpoint = getattr(signal, 'setpoint_pvname', None)
+    if setpoint is not None and setpoint != signal.pvname:
+        names.append(setpoint)
+    return names
+
+
+def warm_up_connections(devices=None, timeout=5.0, include_lazy=False,
+                        poll_interval=0.01):
+    """
+    Connect the PVs of many devices at once, under one deadline.
+
+    Each signal starts its channel search when it is created, but the usual
+    ``wait_for_connection`` paths wait on them one device at a time. This
+    collects every PV-backed signal across the device trees first, creating
+    lazy signals too if requested so their searches all go out together, and
+    then waits on all of them until ``timeout`` seconds have passed.
+
+    Parameters
+    ----------
+    devices : iterable of ophyd objects, optional
+        The devices to connect. Defaults to every top-level device and
+        signal in `device_registry`.
+    timeout : float, optional
+        The global deadline in seconds.
+    include_lazy : bool, optional
+        Also create and connect lazy signals that have not been used yet.
+    poll_interval : float, optional
+        Seconds between connection checks.
+
+    Returns
+    -------
+    statuses : list of ConnectionStatus
+        One entry per device, in the order given.
+    """
+    if devices is None:
+        devices = _top_level_objects()
+    start = time.monotonic()
+    deadline = start + timeout
+
+    device_signals = []
+    pending = {}
+    for device in devices:
+        try:
+            signals = _epics_signals(device, include_lazy)
+        except Exception:
+            logger.warning('Could not collect the signals of %s',
+                           device.name)
+            logger.debug('', exc_info=True)
+            signals = []
+        device_signals.append((device, signals))
+        for signal in signals:
+            pending[id(signal)] = signal
+    total = len(pending)
+
+    connected_at = {}
+    while True:
+        now = time.monotonic()
+        for key, signal in list(pending.items()):
+            if signal.connected:
+                connected_at[key] = now - start
+                del pending[key]
+        if not pending or now >= deadline:
+            break
+        time.sleep(min(poll_interval, max(deadline - now, 0)))
+
+    statuses = []
+    for device, signals in device_signals:
+        missing = [name for signal in signals if id(signal) in pending
+                   for name in _pvnames(signal)]
+        times = [connected_at[id(signal)] for signal in signals
+                 if id(signal) in connected_at]
+        complete = len(times) == len(signals)
+        statuses.append(ConnectionStatus(
+            name=device.name,
+            pvs=len(signals),
+            connected=len(times),
+            elapsed=max(times, default=0.0) if complete else None,
+            missing=missing,
+        ))
+    logger.info('Connected %d of %d signals from %d devices in %.2f s',
+                total - len(pending), total, len(statuses),
+                time.monotonic() - start)
+    return statuses
+
+
+def connection_table(statuses):
+    """
+    Tabulate the result of `warm_up_connections`.
+
+    Parameters
+    ----------
+    statuses : list of ConnectionStatus
+        The per-device connection summaries.
+
+    Returns
+    -------
+    table : PrettyTable
+        A table with one row per device, slowest or unconnected first.
+    """
+    table = PrettyTable()
+    table.field_names = ["Device", "Connected", "Time (s)", "Missing PVs"]
+    ordered = sorted(
+        statuses,
+        key=lambda status: (status.elapsed is not None,
+                            -(status.elapsed or 0.0)),
+    )
+    for status in ordered:
+        elapsed = ('-' if status.elapsed is None
+                   else f'{status.elapsed:.3f}')
+        missing = ', '.join(status.missing[:3])
+        if len(status.missing) > 3:
+            missing += f', ... ({len(status.missing)} total)'
+        table.add_row([status.name, f'{status.connected}/{status.pvs}',
+                       elapsed, missing])
+    return table
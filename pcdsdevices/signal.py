@@ -11,6 +11,7 @@ if __name__ != 'pcdsdevices.signal':
                        'inside the pcdsdevices directory and can cause '
                        'extremely confusing bugs. Please run your script '
                        'elsewhere for better results.')
+import collections
 import contextlib
 import dataclasses
 import inspect
@@ -157,17 +158,52 @@ class AggregateSignal(Signal):
 
     This signal type is intended to be used programmatically with a subclass.
     For simple per-device usage, see :class:`MultiDerivedSignal`.
+
+    Optionally, bursts of updates from the underlying signals can be
+    coalesced into a single recalculation and a single ``SUB_VALUE`` event
+    by setting ``coalesce_window``. Updates that arrive within the window,
+    or while a recalculation is already queued, only update the value cache.
+    The number of updates that were absorbed in this way is tracked in
+    ``coalesced_updates``.
+
+    Subclasses may implement ``_update_readback_incremental`` to update the
+    readback from just the signals that changed instead of recalculating
+    from every cached value. If it is not implemented, every update does a
+    full ``_calc_readback``.
+
+    Parameters
+    ----------
+    coalesce_window : float, optional
+        If provided, the time in seconds to wait after an update before
+        recalculating. A window of 0 recalculates as soon as the ophyd
+        dispatcher gets to it. If omitted, the class default is used, which
+        is to recalculate synchronously on every update.
     """
 
     _update_only_on_change: bool = True
+    _coalesce_window: Optional[float] = None
     _has_subscribed: bool
     _signals: dict[Signal, _AggregateSignalState]
+    #: Number of underlying updates absorbed into a queued recalculation
+    coalesced_updates: int
+    #: Number of recalculations run from underlying updates
+    recalculations: int
 
-    def __init__(self, *, name, value=None, **kwargs):
+    def __init__(self, *, name, value=None, coalesce_window=None, **kwargs):
         super().__init__(name=name, value=value, **kwargs)
         self._has_subscribed = False
         self._lock = RLock()
         self._signals = {}
+        # Signals changed since the last calculation, and their old values
+        self._dirty = {}
+        self._incremental_ready = False
+        self._n_missing = 0
+        self._n_disconnected = 0
+        if coalesce_window is not None:
+            self._coalesce_window = coalesce_window
+        self._recalculation_queued = False
+        self.coalesced_updates = 0
+        self.recalculations = 0
 
     def _calc_readback(self):
         """
@@ -184,20 +220,87 @@ class AggregateSignal(Signal):
             'Subclasses must implement _calc_readback'
         )  # pragma nocover
 
+    def _update_readback_incremental(
+        self,
+        signal: Signal,
+        old_value: OphydDataType,
+        new_value: OphydDataType,
+    ) -> OphydDataType:
+        """
+        Optionally override this to update the readback from one change.
+
+        This is called once per changed signal instead of ``_calc_readback``
+        once ``_calc_readback`` has been called at least once. The cache
+        already holds ``new_value`` for ``signal`` when this is called.
+        Any intermediate state used here should be rebuilt from scratch
+        in ``_calc_readback``.
+
+        Parameters
+        ----------
+        signal : Signal
+            The signal whose value changed.
+
+        old_value : OphydDataType
+            The cached value of the signal as of the last calculation.
+
+        new_value : OphydDataType
+            The new cached value of the signal.
+
+        Returns
+        -------
+        readback
+            The result of the calculation.
+        """
+        return self._calc_readback()
+
+    def _cache_value(self, signal: Signal, value: OphydDataType) -> None:
+        """Update the cache with one value and mark it for recalculation."""
+        siginfo = self._signals[signal]
+        old_value = siginfo.value
+        if old_value is None and value is not None:
+            self._n_missing -= 1
+        elif old_value is not None and value is None:
+            self._n_missing += 1
+        if signal not in self._dirty:
+            self._dirty[signal] = old_value
+        siginfo.value = value
+
+    def _cache_connected(self, signal: Signal, connected: bool) -> None:
+        """Update the cached connection status of one signal."""
+        siginfo = self._signals[signal]
+        if siginfo.connected and not connected:
+            self._n_disconnected += 1
+        elif not siginfo.connected and connected:
+            self._n_disconnected -= 1
+        siginfo.connected = connected
+
     def _insert_value(self, signal, value):
         """Update the cache with one value and recalculate."""
         with self._lock:
-            self._signals[signal].value = value
+            self._cache_value(signal, value)
             self._update_readback()
             return self._readback
 
     @property
     def _have_values(self) -> bool:
         """Is the value cache populated?"""
-        return all(
-            siginfo.value is not None for siginfo in self._signals.values()
+        return self._n_missing == 0
+
+    @property
+    def _supports_incremental(self) -> bool:
+        """Does this class implement ``_update_readback_incremental``?"""
+        return (
+            type(self)._update_readback_incremental
+            is not AggregateSignal._update_readback_incremental
         )
 
+    def _recalculate_all(self) -> Optional[OphydDataType]:
+        """Do a full recalculation of the readback from the cache."""
+        self._readback = self._calc_readback()
+        self._dirty.clear()
+        self._incremental_ready = True
+        return self._readback
+
     def _update_readback(self) -> Optional[OphydDataType]:
         """
         Recalculate the readback value.
@@ -215,8 +318,17 @@ class AggregateSignal(Signal):
             ``None``) will be returned.
         """
         with self._lock:
-            if self._have_values:
-                self._readback = self._calc_readback()
+            if not self._have_values:
+                return self._readback
+            if not (self._incremental_ready and self._supports_incremental):
+                return self._recalculate_all()
+            readback = self._readback
+            for signal, old_value in self._dirty.items():
+                readback = self._update_readback_incremental(
+                    signal, old_value, self._signals[signal].value
+                )
+            self._readback = readback
+            self._dirty.clear()
             return self._readback
 
     def get(self, **kwargs):
@@ -229,10 +341,40 @@ class AggregateSignal(Signal):
             Keyword arguments are passed to each ``signal.get(**kwargs)``.
         """
         with self._lock:
-            for signal, siginfo in self._signals.items():
-                siginfo.value = signal.get(**kwargs)
+            for signal in self._signals:
+                self._cache_value(signal, signal.get(**kwargs))
             return self._update_readback()
 
+    def get_cached_values(
+        self,
+        refresh: bool = False,
+    ) -> dict[Signal, OphydDataType]:
+        """
+        Return the latest value of each constituent signal.
+
+        These come from the cache that the subscriptions keep up to date, so
+        no signal is read. The signals are read as in ``.get()`` instead if
+        ``refresh`` is set, or if the cache is not complete yet, such as
+        before the first subscription.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Read every constituent signal rather than use the cache.
+
+        Returns
+        -------
+        values : dict of Signal to OphydDataType
+            The value of each constituent signal.
+        """
+        with self._lock:
+            if refresh or not (self._has_subscribed and self._have_values):
+                self.get()
+            return {
+                signal: siginfo.value
+                for signal, siginfo in self._signals.items()
+            }
+
     def put(self, value, **kwargs):
         raise NotImplementedError(
             'put should be overridden in a subclass'
@@ -285,14 +427,17 @@ class AggregateSignal(Signal):
     ) -> None:
         """This is a SUB_META callback from one of the aggregated signals."""
         with self._check_connectivity():
-            self._signals[obj].connected = connected
+            self._cache_connected(obj, connected)
 
     def _signal_value_callback(self, *, obj: Signal, **kwargs):
         """This is a SUB_VALUE callback from one of the aggregated signals."""
         kwargs.pop('sub_type')
         kwargs.pop('old_value')
         value = kwargs['value']
+        if self._coalesce_window is not None:
+            return self._coalesce_value(obj, value)
         with self._lock:
+            self.recalculations += 1
             old_value = self._readback
             # Update just one value and assume the rest are cached
             # This allows us to run subs without EPICS gets
@@ -307,6 +452,37 @@ class AggregateSignal(Signal):
                 self._run_subs(sub_type=self.SUB_VALUE, obj=self, value=value,
                                old_value=old_value)
 
+    def _coalesce_value(self, obj: Signal, value: OphydDataType) -> None:
+        """Cache one value and queue up a single deferred recalculation."""
+        with self._lock:
+            with self._check_connectivity() as connectivity_info:
+                self._cache_value(obj, value)
+            if connectivity_info["sent_value_callback"]:
+                # The connectivity check recalculated and sent an event
+                return
+            if self._recalculation_queued:
+                self.coalesced_updates += 1
+                return
+            self._recalculation_queued = True
+
+        utils.schedule_task(
+            self._run_coalesced_recalculation,
+            delay=self._coalesce_window or None,
+        )
+
+    def _run_coalesced_recalculation(self) -> None:
+        """Recalculate once for all of the updates that were coalesced."""
+        with self._lock:
+            self._recalculation_queued = False
+            if self._destroyed:
+                return
+            self.recalculations += 1
+            old_value = self._readback
+            value = self._update_readback()
+            if value != old_value or not self._update_only_on_change:
+                self._run_subs(sub_type=self.SUB_VALUE, obj=self, value=value,
+                               old_value=old_value)
+
     @property
     def connected(self) -> bool:
         """Are all relevant signals connected?"""
@@ -314,10 +490,7 @@ class AggregateSignal(Signal):
             return False
 
         if self._has_subscribed:
-            return all(
-                siginfo.connected and siginfo.value is not None
-                for siginfo in self._signals.values()
-            )
+            return self._n_disconnected == 0 and self._n_missing == 0
 
         # Only check connectivity status of the signal; cross fingers that it
         # reflects both being connected and having a not-None value.
@@ -361,7 +534,7 @@ class AggregateSignal(Signal):
             # 2. All underlying signals have a value cached
             with self._lock:
                 old_value = self._readback
-                self._readback = self._calc_readback()
+                self._recalculate_all()
                 self._run_subs(
                     sub_type=self.SUB_VALUE,
                     obj=self,
@@ -410,7 +583,10 @@ class AggregateSignal(Signal):
             sig = getattr(sig, part)
 
         # Add if not yet there; but do not subscribe just yet.
-        self._signals[sig] = _AggregateSignalState(signal=sig)
+        if sig not in self._signals:
+            self._signals[sig] = _AggregateSignalState(signal=sig)
+            self._n_missing += 1
+            self._n_disconnected += 1
         return sig
 
     def destroy(self):
@@ -435,12 +611,23 @@ class SummarySignal(AggregateSignal):
     The calculated readback value is useless, and should not be used
     in any downstream calculations.  Use the signal/PV you actually
     care about instead.
+
+    The hash is a combination of one hash per constituent signal, so a
+    single update can be folded in without visiting every other signal.
     """
+    _hash: int = 0
+
     def _calc_readback(self):
-        values = tuple(sig.get() for sig in self._signals)
-        # We return a hash here, rather than the tuple, to always provide
+        # We return a hash here, rather than the values, to always provide
         # an ophyd-compatible datatype.
-        return hash(values)
+        self._hash = 0
+        for sig, siginfo in self._signals.items():
+            self._hash ^= hash((sig, siginfo.value))
+        return self._hash
+
+    def _update_readback_incremental(self, signal, old_value, new_value):
+        self._hash ^= hash((signal, old_value)) ^ hash((signal, new_value))
+        return self._hash
 
 
 class PVStateSignal(AggregateSignal):
@@ -455,9 +642,15 @@ class PVStateSignal(AggregateSignal):
 
     def __init__(self, *, name, **kwargs):
         super().__init__(name=name, **kwargs)
-        for attr_name in self.parent._state_logic:
-            self.add_signal_by_attr_name(attr_name)
+        self._signal_states = {}
+        for attr_name, states in self.parent._state_logic.items():
+            sig = self.add_signal_by_attr_name(attr_name)
+            self._signal_states[sig] = states
         self._has_setpoint_md = False
+        # Number of signals at each non-deferred state, for 'ALL' mode
+        self._state_counts = collections.Counter()
+        # Number of signals with values that do not map to a state
+        self._n_unmapped = 0
 
     @property
     def enum_strs(self) -> tuple[str, ...]:
@@ -492,6 +685,73 @@ class PVStateSignal(AggregateSignal):
         that everything is ready. Doing it earlier can run into some
         race conditions.
         """
+        self._setup_metadata()
+        if self.parent._state_logic_mode == 'ALL':
+            self._state_counts.clear()
+            self._n_unmapped = 0
+            for sig, sig_info in self._signals.items():
+                self._count_state(sig, sig_info.value, 1)
+            return self._state_from_counts()
+
+        state_value = None
+        for states, sig_info in zip(
+            self.parent._state_logic.values(), self._signals.values()
+        ):
+            # Get state information from last cached value
+            try:
+                signal_state = states[sig_info.value]
+            # Handle unaccounted readbacks
+            except KeyError:
+                state_value = self.parent._unknown
+                break
+            # Associate readback with device state
+            if signal_state != 'defer':
+                # Set state to first non-deferred value
+                state_value = signal_state
+                break
+        # If all states deferred, report as unknown
+        return state_value or self.parent._unknown
+
+    def _update_readback_incremental(
+        self, signal: Signal, old_value: Any, new_value: Any
+    ) -> str:
+        """
+        Update the 'ALL' mode state logic from a single changed signal.
+
+        In 'FIRST' mode the order of the signals matters, so we fall back to
+        the full calculation instead.
+        """
+        if self.parent._state_logic_mode != 'ALL':
+            return self._calc_readback()
+        self._setup_metadata()
+        self._count_state(signal, old_value, -1)
+        self._count_state(signal, new_value, 1)
+        return self._state_from_counts()
+
+    def _count_state(self, signal: Signal, value: Any, delta: int) -> None:
+        """Add or remove one signal's contribution to the state counts."""
+        try:
+            signal_state = self._signal_states[signal][value]
+        # Handle unaccounted readbacks
+        except KeyError:
+            self._n_unmapped += delta
+            return
+        if signal_state != 'defer':
+            self._state_counts[signal_state] += delta
+            if not self._state_counts[signal_state]:
+                del self._state_counts[signal_state]
+
+    def _state_from_counts(self) -> str:
+        """Get the 'ALL' mode state from the state counts."""
+        # Unaccounted or inconsistent readbacks are unknown
+        # If all states deferred, report as unknown
+        if self._n_unmapped or len(self._state_counts) != 1:
+            return self.parent._unknown
+        state_value, = self._state_counts
+        return state_value or self.parent._unknown
+
+    def _setup_metadata(self) -> None:
+        """One-time metadata setup, once the signals are ready."""
         # Do some one-time setup here
         # Convenient because we only hit this block when signals are ready
         if (
@@ -515,34 +775,6 @@ class PVStateSignal(AggregateSignal):
                 )
             self._has_setpoint_md = True
 
-        state_value = None
-        for states, sig_info in zip(
-            self.parent._state_logic.values(), self._signals.values()
-        ):
-            # Get state information from last cached value
-            try:
-                signal_state = states[sig_info.value]
-            # Handle unaccounted readbacks
-            except KeyError:
-                state_value = self.parent._unknown
-                break
-            # Associate readback with device state
-            if signal_state != 'defer':
-                if state_value:
-                    # Handle inconsistent readbacks
-                    if signal_state != state_value:
-                        state_value = self.parent._unknown
-                        break
-                else:
-                    # Set state to first non-deferred value
-                    state_value = signal_state
-                    if self.parent._state_logic_mode == 'ALL':
-                        continue
-                    elif self.parent._state_logic_mode == 'FIRST':
-                        break
-        # If all states deferred, report as unknown
-        return state_value or self.parent._unknown
-
     def _setpoint_md_update(
         self,
         *args,
@@ -782,56 +1014,196 @@ class MultiDerivedSignalRO(SignalRO, MultiDerivedSignal):
     ...
 
 
-class AvgSignal(Signal):
+class _RollingStats:
     """
-    Signal that acts as a rolling average of another signal.
+    Ring buffer of values that keeps running statistics in O(1) per update.
 
-    Optionally, the rolling average can be reset every time the ``trigger`` method
+    Welford's algorithm keeps a running mean and sum of squared deviations
+    for the mean and standard deviation, so a large common offset does not
+    cost precision. Monotonic queues are used for the minimum and maximum.
+    NaN values are treated as empty slots, like ``np.nanmean``.
+
+    The running values are re-normalized from the buffer contents after
+    every ``renormalize`` updates to keep floating point drift from
+    accumulating.
+
+    Parameters
+    ----------
+    size : int
+        The number of values to keep in the buffer.
+
+    renormalize : int, optional
+        The number of updates between re-normalizations. Defaults to the
+        buffer size, which keeps the amortized cost of an update at O(1).
+    """
+
+    def __init__(self, size: int, renormalize: Optional[int] = None):
+        self.size = int(size)
+        self.renormalize_every = renormalize or self.size
+        self.values = np.full(self.size, np.nan)
+        self.index = 0
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._seq = 0
+        self._since_renormalize = 0
+        # Deques of (sequence number, value) for sliding min/max
+        self._min_queue = collections.deque()
+        self._max_queue = collections.deque()
+
+    def add(self, value: float) -> None:
+        """Add a value to the buffer, replacing the oldest value if full."""
+        value = float(value)
+        old = float(self.values[self.index])
+        if old == old:
+            self._remove(old)
+        self.values[self.index] = value
+
+        seq = self._seq
+        self._seq += 1
+        if value == value:
+            self.count += 1
+            delta = value - self._mean
+            self._mean += delta / self.count
+            self._m2 += delta * (value - self._mean)
+            while self._min_queue and self._min_queue[-1][1] >= value:
+                self._min_queue.pop()
+            self._min_queue.append((seq, value))
+            while self._max_queue and self._max_queue[-1][1] <= value:
+                self._max_queue.pop()
+            self._max_queue.append((seq, value))
+        # Drop queued extrema that have left the window
+        oldest = seq - self.size
+        while self._min_queue and self._min_queue[0][0] <= oldest:
+            self._min_queue.popleft()
+        while self._max_queue and self._max_queue[0][0] <= oldest:
+            self._max_queue.popleft()
+
+        self.index = (self.index + 1) % self.size
+        self._since_renormalize += 1
+        if self._since_renormalize >= self.renormalize_every:
+            self.renormalize()
+
+    def _remove(self, value: float) -> None:
+        """Take a value out of the running mean and squared deviations."""
+        self.count -= 1
+        if not self.count:
+            self._mean = 0.0
+            self._m2 = 0.0
+            return
+        delta = value - self._mean
+        self._mean -= delta / self.count
+        self._m2 -= delta * (value - self._mean)
+
+    def renormalize(self) -> None:
+        """Recompute the running values from the buffer contents."""
+        valid = self.values[~np.isnan(self.values)]
+        self.count = len(valid)
+        if self.count:
+            self._mean = float(np.mean(valid))
+            self._m2 = float(np.sum((valid - self._mean) ** 2))
+        else:
+            self._mean = 0.0
+            self._m2 = 0.0
+        self._since_renormalize = 0
+
+    @property
+    def mean(self) -> float:
+        if not self.count:
+            return np.nan
+        return self._mean
+
+    @property
+    def std(self) -> float:
+        if not self.count:
+            return np.nan
+        # Guard against tiny negative values from rounding
+        return float(np.sqrt(max(self._m2 / self.count, 0)))
+
+    @property
+    def min(self) -> float:
+        if not self._min_queue:
+            return np.nan
+        return self._min_queue[0][1]
+
+    @property
+    def max(self) -> float:
+        if not self._max_queue:
+            return np.nan
+        return self._max_queue[0][1]
+
+
+class RollingStatsSignal(Signal):
+    """
+    Signal that reports a rolling statistic of another signal.
+
+    This will subscribe to a signal, and fill an internal ring buffer with
+    values from `SUB_VALUE`. It will update its own value to be the chosen
+    statistic of the last n accumulated values, up to the buffer size. The
+    statistics are kept as running totals so that each update is O(1) no
+    matter how large the buffer is.
+
+    All of the statistics are also available as properties, regardless of
+    which one is reported as the signal value.
+
+    Optionally, the buffer can be reset every time the ``trigger`` method
     is called (e.g. at every point in a bluesky scan).
     This is the behavior if you specific a duration for the ``trigger`` using
     the ``duration`` argument.
 
-    This will subscribe to a signal, and fill an internal buffer with values
-    from `SUB_VALUE`. It will update its own value to be the mean of the last n
-    accumulated values, up to the buffer size. If we haven't filled this
-    buffer, this will still report a mean value composed of all the values
-    we've receieved so far.
-
-    Warning: this means that if we only have recieved ONE value, the mean will
-    just be the mean of a single value!
-
     Parameters
     ----------
     signal : Signal or str
         Any subclass of `ophyd.signal.Signal` that returns a numeric value.
-        This signal will be subscribed to be `AvgSignal` to calculate the mean.
+        This signal will be subscribed to calculate the statistic.
         Parent classes can pass a str instead that matches the attr name
         of one of their component signals.
 
     averages : int
-        The number of ``SUB_VALUE`` updates to include in the average. New values
-        after this number is reached will begin overriding old values.
+        The number of ``SUB_VALUE`` updates to include in the statistics. New
+        values after this number is reached will begin overriding old values.
 
     duration : float, optional
-        The number of seconds to wait before returning trigger complete. Nominally this
-        should be set to averages divided by the expected update rate of the signal.
-        If omitted, we will not reset the buffer or wait for values at scan points.
+        The number of seconds to wait before returning trigger complete.
+        Nominally this should be set to averages divided by the expected
+        update rate of the signal. If omitted, we will not reset the buffer
+        or wait for values at scan points.
+
+    stat : {'mean', 'std', 'min', 'max', 'count'}, optional
+        The statistic to report as this signal's value. Defaults to 'mean'.
+
+    decimation : int, optional
+        Only update this signal's value once for every ``decimation``
+        updates of the source signal. The buffer still receives every
+        update. Defaults to 1, which updates every time.
     """
 
+    stats = ('mean', 'std', 'min', 'max', 'count')
+
     def __init__(
         self,
         signal: Signal | str,
         averages: int,
         duration: float | None = None,
         *,
+        stat: str = 'mean',
+        decimation: int = 1,
         name: str,
         parent: Device | None = None,
         **kwargs,
     ):
         super().__init__(name=name, parent=parent, **kwargs)
+        if stat not in self.stats:
+            raise ValueError(
+                f'Invalid stat {stat!r}, must be one of {self.stats}'
+            )
+        if decimation < 1:
+            raise ValueError('decimation must be at least 1')
         if isinstance(signal, str):
             signal = getattr(parent, signal)
         self.raw_sig = signal
+        self.stat = stat
+        self.decimation = decimation
         self._lock = RLock()
         self.averages = averages
         self.duration = duration
@@ -852,22 +1224,55 @@ class AvgSignal(Signal):
         self._avg = avg
         self.reset_buffer()
 
+    @property
+    def values(self) -> np.ndarray:
+        """The internal ring buffer. Unfilled entries are nan."""
+        return self._stats.values
+
+    @property
+    def index(self) -> int:
+        """The position in the buffer that the next value will be put."""
+        return self._stats.index
+
+    @property
+    def mean(self) -> float:
+        """The mean of the buffered values."""
+        return self._stats.mean
+
+    @property
+    def std(self) -> float:
+        """The population standard deviation of the buffered values."""
+        return self._stats.std
+
+    @property
+    def min(self) -> float:
+        """The minimum of the buffered values."""
+        return self._stats.min
+
+    @property
+    def max(self) -> float:
+        """The maximum of the buffered values."""
+        return self._stats.max
+
+    @property
+    def count(self) -> int:
+        """The number of values in the buffer."""
+        return self._stats.count
+
     def reset_buffer(self) -> None:
-        """Re-initialize the avg signal buffer."""
+        """Re-initialize the buffer."""
         with self._lock:
-            self.index = 0
-            # Allocate uninitalized array
-            self.values = np.empty(self._avg)
-            # Fill with nan
-            self.values.fill(np.nan)
+            self._stats = _RollingStats(self._avg)
+            self._updates = 0
 
     def _update_avg(self, *args, value: float, **kwargs) -> None:
         """Add new value to the buffer, overriding old values if needed."""
         with self._lock:
-            self.values[self.index] = value
-            self.index = (self.index + 1) % len(self.values)
-            # This takes a mean, skipping nan values.
-            self.put(np.nanmean(self.values))
+            self._stats.add(value)
+            self._updates += 1
+            if self._updates >= self.decimation:
+                self._updates = 0
+                self.put(getattr(self._stats, self.stat))
 
     def trigger(self) -> Status:
         if self.duration is None:
@@ -880,6 +1285,72 @@ class AvgSignal(Signal):
         return status
 
 
+class AvgSignal(RollingStatsSignal):
+    """
+    Signal that acts as a rolling average of another signal.
+
+    Optionally, the rolling average can be reset every time the ``trigger`` method
+    is called (e.g. at every point in a bluesky scan).
+    This is the behavior if you specific a duration for the ``trigger`` using
+    the ``duration`` argument.
+
+    This will subscribe to a signal, and fill an internal buffer with values
+    from `SUB_VALUE`. It will update its own value to be the mean of the last n
+    accumulated values, up to the buffer size. If we haven't filled this
+    buffer, this will still report a mean value composed of all the values
+    we've receieved so far.
+
+    Warning: this means that if we only have recieved ONE value, the mean will
+    just be the mean of a single value!
+
+    The other statistics of the buffer (``std``, ``min``, ``max``, ``count``)
+    are available as properties. See `RollingStatsSignal`.
+
+    Parameters
+    ----------
+    signal : Signal or str
+        Any subclass of `ophyd.signal.Signal` that returns a numeric value.
+        This signal will be subscribed to be `AvgSignal` to calculate the mean.
+        Parent classes can pass a str instead that matches the attr name
+        of one of their component signals.
+
+    averages : int
+        The number of ``SUB_VALUE`` updates to include in the average. New values
+        after this number is reached will begin overriding old values.
+
+    duration : float, optional
+        The number of seconds to wait before returning trigger complete. Nominally this
+        should be set to averages divided by the expected update rate of the signal.
+        If omitted, we will not reset the buffer or wait for values at scan points.
+
+    decimation : int, optional
+        Only update the average once for every ``decimation`` updates of the
+        source signal. Defaults to 1, which updates every time.
+    """
+
+    def __init__(
+        self,
+        signal: Signal | str,
+        averages: int,
+        duration: float | None = None,
+        *,
+        decimation: int = 1,
+        name: str,
+        parent: Device | None = None,
+        **kwargs,
+    ):
+        super().__init__(
+            signal,
+            averages,
+            duration,
+            stat='mean',
+            decimation=decimation,
+            name=name,
+            parent=parent,
+            **kwargs,
+        )
+
+
 class NotImplementedSignal(SignalRO):
     """Dummy signal for a not implemented feature."""
 
@@ -28,7 +28,7 @@ from ophyd.status import wait as status_wait
 
 from .analog_signals import FDQ
 from .areadetector.detectors import PCDSAreaDetectorTyphosTrigger
-from .device import GroupDevice
+from .device import ComponentAlias, GroupDevice
 from .device import UpdateComponent as UpCpt
 from .digital_signals import J120K
 from .epics_motor import (BeckhoffAxis, BeckhoffAxisNoOffset, EpicsMotor,
@@ -69,6 +69,11 @@ class SlitsBase(MvInterface, GroupDevice, LightpathMixin):
     xcenter = Cpt(SignalRO)
     ycenter = Cpt(SignalRO)
 
+    hg = ComponentAlias('xwidth')
+    vg = ComponentAlias('ywidth')
+    ho = ComponentAlias('xcenter')
+    vo = ComponentAlias('ycenter')
+
     # The gap opens/closes when we move the slits device
     stage_group = [xwidth, ywidth]
 
@@ -76,10 +81,6 @@ class SlitsBase(MvInterface, GroupDevice, LightpathMixin):
         self._has_subscribed = False
         super().__init__(*args, **kwargs)
         self.nominal_aperture.put(nominal_aperture)
-        self.hg = self.xwidth
-        self.vg = self.ywidth
-        self.ho = self.xcenter
-        self.vo = self.ycenter
         self._pre_stage_gap: tuple[float, float] = None
 
         self._inserted = False
@@ -16,7 +16,7 @@ from ophyd.sim import fake_device_cache, make_fake_device
 from ophyd.status import SubscriptionStatus
 from ophyd.status import wait as status_wait
 
-from .device import GroupDevice
+from .device import GroupDevice, defer_components
 from .doc_stubs import basic_positioner_init
 from .epics_motor import IMS
 from .interface import MvInterface
@@ -290,32 +290,37 @@ class StatePositioner(MvInterface, Device, PositionerBase):
         """
         Create an enum that can be used to keep track of aliases, state names,
         and integer enum values.
+
+        Enums are shared between all instances with the same class name,
+        states and aliases.
         """
-        state_def = {}
-        state_count = 0
-        for i, state in enumerate(self.states_list):
+        aliases = []
+        for state in self.states_list:
             # Skipped None states indicate a missing enum integer
             if state is None:
+                aliases.append(())
                 continue
-            state_count += 1
-            state_def[state] = i
             try:
-                aliases = self._states_alias[state]
+                state_aliases = self._states_alias[state]
             except KeyError:
-                continue
-            if isinstance(aliases, str):
-                state_def[aliases] = i
-            else:
-                for alias in aliases:
-                    state_def[alias] = i
+                state_aliases = ()
+            if isinstance(state_aliases, str):
+                state_aliases = (state_aliases,)
+            # Normalize so that equivalent definitions share an enum
+            aliases.append(tuple(
+                alias for alias in dict.fromkeys(state_aliases)
+                if alias != state
+            ))
         enum_name = self.__class__.__name__ + 'States'
-        enum = HelpfulIntEnum(enum_name, state_def, start=0, module=__name__)
-        if len(enum) != state_count:
+        try:
+            return _build_states_enum(
+                enum_name, tuple(self.states_list), tuple(aliases)
+            )
+        except ValueError:
             raise ValueError(
                 'Bad states definition! Inconsistency in states_list {} or _states_alias {}'
                 ''.format(self.states_list, self._states_alias)
-            )
-        return enum
+            ) from None
 
     @property
     def stop(self):
@@ -397,6 +402,28 @@ class PVStatePositioner(StatePositioner):
         )
 
 
+@functools.lru_cache(maxsize=256)
+def _build_states_enum(
+    enum_name: str,
+    states: tuple[str | None, ...],
+    aliases: tuple[tuple[str, ...], ...],
+) -> HelpfulIntEnum:
+    """Build the enum for a states list and its aliases, once per input."""
+    state_def = {}
+    state_count = 0
+    for i, (state, state_aliases) in enumerate(zip(states, aliases)):
+        if state is None:
+            continue
+        state_count += 1
+        state_def[state] = i
+        for alias in state_aliases:
+            state_def[alias] = i
+    enum = HelpfulIntEnum(enum_name, state_def, start=0, module=__name__)
+    if len(enum) != state_count:
+        raise ValueError('Bad states definition!')
+    return enum
+
+
 class StateRecordPositionerBase(StatePositioner, GroupDevice):
     """
     A `StatePositioner` for an EPICS states record.
@@ -424,12 +451,15 @@ class StateRecordPositionerBase(StatePositioner, GroupDevice):
 
     def get_state(self, value):
         if not self._has_checked_state_enum:
-            # Add the real enum as the first alias
+            # Add the real enum as the first alias, without changing the
+            # class-level aliases shared by other instances
+            states_alias = dict(self._states_alias)
             for enum_val, state in zip(self.state.enum_strs, self.states_list):
-                aliases = self._states_alias.get(state, [])
+                aliases = states_alias.get(state, [])
                 if isinstance(aliases, str):
                     aliases = [aliases]
-                self._states_alias[state] = [enum_val] + aliases
+                states_alias[state] = [enum_val] + aliases
+            self._states_alias = states_alias
             self.states_enum = self._create_states_enum()
             self._has_checked_state_enum = True
         return super().get_state(value)
@@ -497,12 +527,17 @@ class CombinedStateRecordPositioner(StateRecordPositionerBase):
 TWINCAT_MAX_STATES = 15
 
 
+@defer_components
 class TwinCATStateConfigOne(Device):
     """
     Configuration of a single state position in TwinCAT.
 
     Designed to be used with the records from ``lcls-twincat-motion``.
     Corresponds with ``DUT_PositionState``.
+
+    The signals are only created and connected when first used. Note that
+    the state enum of `TwinCATStatePositioner` reads every ``state_name``
+    when it connects.
     """
 
     state_name = Cpt(PytmcSignal, ':NAME', io='i', kind='config', string=True,
@@ -527,9 +562,11 @@ class TwinCATStateConfigDynamic(Device):
     isinstance(cls, TwinCATStateConfigDynamic) check, and two devices with
     the same number of states and motors will use the same class from the
     registry.
+
+    The per-state configuration devices are only created when first used.
     """
     _state_config_registry: ClassVar[
-        dict[tuple[int, int], TwinCATStateConfigDynamic]
+        dict[tuple[int, int], type[TwinCATStateConfigDynamic]]
     ] = {}
     _config_cls: ClassVar[type] = TwinCATStateConfigOne
     _class_prefix: ClassVar[str] = 'StateConfig'
@@ -579,7 +616,9 @@ class TwinCATStateConfigDynamic(Device):
                         for mnum in range(1, motor_count + 1)
                     }
                 )
-            cls._state_config_registry[state_count] = new_cls
+            # The per-state devices are created on first use
+            defer_components(new_cls, kinds=None, include_devices=True)
+            cls._state_config_registry[(state_count, motor_count)] = new_cls
         return super().__new__(new_cls)
 
     def __init__(self, *args, state_count, motor_count, **kwargs):
@@ -596,7 +635,7 @@ class FakeTwinCATStateConfigDynamic(TwinCATStateConfigDynamic):
     Useful in test suites.
     """
     _state_config_registry: ClassVar[
-        dict[int, FakeTwinCATStateConfigDynamic]
+        dict[tuple[int, int], type[FakeTwinCATStateConfigDynamic]]
     ] = {}
     _config_cls: ClassVar[type] = make_fake_device(TwinCATStateConfigOne)
     _class_prefix: ClassVar[str] = 'FakeStateConfig'
@@ -750,6 +789,7 @@ def state_config_dotted_velos(
     )
 
 
+@defer_components
 class TwinCATStatePositioner(StatePositioner):
     """
     A `StatePositioner` from Beckhoff land.
@@ -768,6 +808,11 @@ class TwinCATStatePositioner(StatePositioner):
 
     `states_list` does not have to be provided in a subclass.
 
+    The per-state configuration signals and ``state_velo`` are only created
+    and connected when first used. The ``state`` enum reads each state's
+    ``state_name`` when it connects, so those are created then, but the
+    rest of each state's configuration is not.
+
     Parameters
     ----------
     prefix : str
@@ -5,7 +5,6 @@ import json
 import logging
 import os
 from datetime import datetime
-from itertools import chain
 
 import jsonschema
 import numpy as np
@@ -18,6 +17,10 @@ from .interface import tweak_base
 
 logger = logging.getLogger(__name__)
 
+# Use libyaml for the sample files when available, they can be large
+SampleLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+SampleDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 
 def StageStack(mdict, name):
     """
@@ -271,6 +274,378 @@ class XYTargetGrid():
         self.y.mv(ypos, wait=wait)
 
 
+class SampleStore():
+    """
+    Compact on-disk store of the targets and shot statuses of a sample grid.
+
+    The target positions are kept as a ``(2, count)`` NumPy array and the
+    shot statuses as a bit array in a memory-mapped file, so marking a
+    single target as shot only touches one byte instead of rewriting the
+    sample's yaml file. The store lives in a ``.sample_store`` directory
+    next to the sample yaml files and can be imported from and exported to
+    the yaml format used by `XYGridStage`.
+
+    Parameters
+    ----------
+    directory : str
+        Directory holding the store files.
+    sample_name : str
+        Name of the sample.
+    """
+    directory_name = '.sample_store'
+    # Number of status bytes checked at once when looking for unshot targets
+    _search_chunk = 4096
+
+    def __init__(self, directory, sample_name):
+        self.directory = str(directory)
+        self.sample_name = str(sample_name)
+        with open(self._file('.json')) as meta_file:
+            meta = json.load(meta_file)
+        self.m_points = meta['M']
+        self.n_points = meta['N']
+        self.snake_like = meta['snake_like']
+        self.source_key = meta.get('source_key')
+        self.count = meta['count']
+        self.positions = np.load(self._file('.npy'), mmap_mode='r')
+        n_bytes = (self.count + 7) // 8
+        if n_bytes:
+            self._bits = np.memmap(self._file('.status'), dtype=np.uint8,
+                                   mode='r+', shape=(n_bytes,))
+        else:
+            # Empty files can't be memory-mapped
+            self._bits = np.zeros(0, dtype=np.uint8)
+        # All targets before this index are known to be shot
+        self._first_unshot = 0
+        self._tree = None
+
+    def _file(self, suffix):
+        return os.path.join(self.directory, self.sample_name + suffix)
+
+    @classmethod
+    def create(cls, directory, sample_name, xx, yy, m_points, n_points,
+               statuses=None, snake_like=True, source_key=None):
+        """
+        Create a new store, replacing any existing one for this sample.
+
+        Parameters
+        ----------
+        directory : str
+            Directory to hold the store files.
+        sample_name : str
+            Name of the sample.
+        xx, yy : array
+            The x and y target positions, in target order.
+        m_points, n_points : int
+            The number of rows and columns of the grid.
+        statuses : array of bool, optional
+            `True` for each target that has been shot.
+        snake_like : bool, optional
+            If the targets are in a snake-like order, see `snake_grid_list`.
+        source_key : list, optional
+            Identifies the version of the yaml file this store was imported
+            from.
+
+        Returns
+        -------
+        store : SampleStore
+        """
+        os.makedirs(directory, exist_ok=True)
+        positions = np.array([xx, yy], dtype=float).reshape(2, -1)
+        count = positions.shape[1]
+        if statuses is None:
+            statuses = np.zeros(count, dtype=bool)
+        bits = np.packbits(np.asarray(statuses, dtype=bool),
+                           bitorder='little')
+        meta = {'M': m_points, 'N': n_points, 'snake_like': snake_like,
+                'count': count, 'source_key': source_key}
+        base = os.path.join(str(directory), str(sample_name))
+        # Write everything aside and then move it into place, so that a
+        # reader never sees a half-written store
+        with open(base + '.npy.tmp', 'wb') as pos_file:
+            np.save(pos_file, positions)
+        with open(base + '.status.tmp', 'wb') as status_file:
+            status_file.write(bits.tobytes())
+        with open(base + '.json.tmp', 'w') as meta_file:
+            json.dump(meta, meta_file)
+        for suffix in ('.npy', '.status', '.json'):
+            os.replace(base + suffix + '.tmp', base + suffix)
+        return cls(directory, sample_name)
+
+    @staticmethod
+    def get_source_key(yaml_path):
+        """Identify the current version of a sample yaml file."""
+        stat = os.stat(yaml_path)
+        return [stat.st_mtime_ns, stat.st_size]
+
+    @classmethod
+    def from_yaml(cls, yaml_path, sample_name, directory=None,
+                  snake_like=None):
+        """
+        Import a sample from its yaml file.
+
+        Parameters
+        ----------
+        yaml_path : str
+            Path to the sample yaml file.
+        sample_name : str
+            Name of the sample in the file.
+        directory : str, optional
+            Directory to hold the store files. Defaults to the
+            ``.sample_store`` directory next to the yaml file.
+        snake_like : bool, optional
+            If the targets are in a snake-like order. Defaults to the
+            ``snake_like`` entry of the sample, or `True`.
+
+        Returns
+        -------
+        store : SampleStore
+        """
+        if directory is None:
+            directory = os.path.join(os.path.dirname(yaml_path),
+                                     cls.directory_name)
+        source_key = cls.get_source_key(yaml_path)
+        with open(yaml_path) as sample_file:
+            yaml_dict = yaml.load(sample_file, Loader=SampleLoader) or {}
+        sample = yaml_dict.get(sample_name)
+        if not sample:
+            raise ValueError('Could not find this sample name in the file:'
+                             f' {sample_name}')
+        xx = sample.get('xx') or []
+        yy = sample.get('yy') or []
+        if snake_like is None:
+            snake_like = sample.get('snake_like', True)
+        return cls.create(directory, sample_name,
+                          xx=[d['pos'] for d in xx],
+                          yy=[d['pos'] for d in yy],
+                          m_points=sample.get('M', 0),
+                          n_points=sample.get('N', 0),
+                          statuses=[d['status'] for d in xx],
+                          snake_like=snake_like,
+                          source_key=source_key)
+
+    def update_yaml_data(self, sample):
+        """
+        Update the ``xx`` and ``yy`` statuses of a sample dictionary from the
+        yaml file with the statuses in this store.
+        """
+        statuses = self.shot.tolist()
+        for key in ('xx', 'yy'):
+            for item, status in zip(sample.get(key) or [], statuses):
+                item['status'] = status
+        return sample
+
+    def export_yaml(self, yaml_path):
+        """
+        Write the statuses in this store back to the sample yaml file.
+
+        Parameters
+        ----------
+        yaml_path : str
+            Path to the sample yaml file.
+        """
+        with open(yaml_path) as sample_file:
+            yaml_dict = yaml.load(sample_file, Loader=SampleLoader) or {}
+        sample = yaml_dict.get(self.sample_name)
+        if not sample:
+            raise ValueError('Could not find this sample name in the file:'
+                             f' {self.sample_name}')
+        self.update_yaml_data(sample)
+        with open(yaml_path, 'w') as sample_file:
+            yaml.dump(yaml_dict, sample_file, Dumper=SampleDumper,
+                      sort_keys=False, default_flow_style=False)
+        # The yaml file is now in sync with this store
+        self.source_key = self.get_source_key(yaml_path)
+        meta = {'M': self.m_points, 'N': self.n_points,
+                'snake_like': self.snake_like, 'count': self.count,
+                'source_key': self.source_key}
+        with open(self._file('.json.tmp'), 'w') as meta_file:
+            json.dump(meta, meta_file)
+        os.replace(self._file('.json.tmp'), self._file('.json'))
+
+    @property
+    def xx(self):
+        """The x positions of all targets."""
+        return self.positions[0]
+
+    @property
+    def yy(self):
+        """The y positions of all targets."""
+        return self.positions[1]
+
+    @property
+    def shot(self):
+        """Array with `True` for each target that has been shot."""
+        return np.unpackbits(self._bits, count=self.count,
+                             bitorder='little').astype(bool)
+
+    def index(self, m, n):
+        """
+        Get the target index of row ``m`` and column ``n``, starting at 1.
+        """
+        if not (1 <= m <= self.m_points and 1 <= n <= self.n_points):
+            raise IndexError('Index out of range, make sure the m and n values'
+                             f' are between ({self.m_points, self.n_points})')
+        if self.snake_like and m % 2 == 0:
+            # Every other row goes right to left
+            index = (m - 1) * self.n_points + self.n_points - n
+        else:
+            index = (m - 1) * self.n_points + n - 1
+        if index >= self.count:
+            raise IndexError(f'Target {m, n} has not been mapped.')
+        return index
+
+    def target(self, index):
+        """Get the (m, n) row and column of a target index, starting at 1."""
+        row, column = divmod(int(index), self.n_points)
+        if self.snake_like and row % 2 == 1:
+            column = self.n_points - 1 - column
+        return row + 1, column + 1
+
+    def is_shot(self, index):
+        """Has the target at ``index`` been shot?"""
+        if not 0 <= index < self.count:
+            raise IndexError(f'Target index {index} out of range')
+        return bool(self._bits[index >> 3] & (1 << (index & 7)))
+
+    def set_shot(self, index, shot=True):
+        """
+        Mark the target at ``index`` as shot or not shot.
+
+        Parameters
+        ----------
+        index : int
+            The target index.
+        shot : bool, optional
+            `True` to mark the target as shot.
+        """
+        if not 0 <= index < self.count:
+            raise IndexError(f'Target index {index} out of range')
+        mask = 1 << (index & 7)
+        if shot:
+            self._bits[index >> 3] |= mask
+        else:
+            self._bits[index >> 3] &= ~mask & 0xFF
+            self._first_unshot = min(self._first_unshot, index)
+
+    def reset(self):
+        """Mark all targets as not shot."""
+        self._bits[:] = 0
+        self._first_unshot = 0
+
+    def next_unshot(self, start=0):
+        """
+        Find the first target at or after ``start`` that has not been shot.
+
+        Parameters
+        ----------
+        start : int, optional
+            Target index to start looking from.
+
+        Returns
+        -------
+        index : int or None
+            The target index, or `None` if all remaining targets are shot.
+        """
+        hint = start <= self._first_unshot
+        index = max(start, self._first_unshot)
+        while index < self.count:
+            first_byte = index >> 3
+            chunk = self._bits[first_byte:first_byte + self._search_chunk]
+            # Ignore targets in the first byte that come before ``index``
+            unshot = ~chunk & 0xFF
+            unshot[0] &= (0xFF << (index & 7)) & 0xFF
+            nonzero = np.flatnonzero(unshot)
+            if len(nonzero):
+                byte = first_byte + int(nonzero[0])
+                bits = int(unshot[nonzero[0]])
+                found = byte * 8 + (bits & -bits).bit_length() - 1
+                if found >= self.count:
+                    break
+                if hint:
+                    self._first_unshot = found
+                return found
+            index = (first_byte + len(chunk)) * 8
+        if hint:
+            self._first_unshot = self.count
+        return None
+
+    def _get_tree(self):
+        """KD-tree of the target positions, built on first use."""
+        if self._tree is None:
+            # Only pull in scipy.spatial when it is needed
+            from scipy.spatial import cKDTree
+            self._tree = cKDTree(np.asarray(self.positions).T)
+        return self._tree
+
+    def nearest(self, x, y):
+        """
+        Find the target closest to a position.
+
+        Parameters
+        ----------
+        x, y : float
+            The position.
+
+        Returns
+        -------
+        index, distance : tuple
+            The target index and its distance from ``(x, y)``, or
+            ``(None, inf)`` if there are no targets.
+        """
+        if not self.count:
+            return None, np.inf
+        distance, index = self._get_tree().query((x, y))
+        return int(index), float(distance)
+
+    def nearest_unshot(self, x, y):
+        """
+        Find the unshot target closest to a position.
+
+        Neighbours are looked up from the KD-tree in growing batches until
+        an unshot one turns up, so this stays cheap while there are unshot
+        targets nearby.
+
+        Parameters
+        ----------
+        x, y : float
+            The position.
+
+        Returns
+        -------
+        index, distance : tuple
+            The target index and its distance from ``(x, y)``, or
+            ``(None, inf)`` if all targets have been shot.
+        """
+        tree = None
+        k = 8
+        while self.count:
+            if k >= self.count:
+                # Just check every target
+                shot = self.shot
+                if shot.all():
+                    break
+                deltas = np.asarray(self.positions).T - (x, y)
+                distances = np.hypot(deltas[:, 0], deltas[:, 1])
+                distances[shot] = np.inf
+                index = int(np.argmin(distances))
+                return index, float(distances[index])
+            if tree is None:
+                tree = self._get_tree()
+            distances, indices = tree.query((x, y), k=k)
+            bytes_ = self._bits[indices >> 3]
+            unshot = (bytes_ & (1 << (indices & 7))) == 0
+            if unshot.any():
+                first = int(np.argmax(unshot))
+                return int(indices[first]), float(distances[first])
+            k *= 4
+        return None, np.inf
+
+    def flush(self):
+        """Make sure status updates are written to disk."""
+        if isinstance(self._bits, np.memmap):
+            self._bits.flush()
+
+
 class XYGridStage():
     """
     Class that helps support multiple samples on a mount for an XY Grid setup.
@@ -335,6 +710,9 @@ class XYGridStage():
         self._current_sample = ''
         self._positions_x = []
         self._positions_y = []
+        self._snake_like = True
+        # sample yaml path -> SampleStore
+        self._stores = {}
 
     @property
     def m_n_points(self):
@@ -626,38 +1004,15 @@ class XYGridStage():
         y_index = ''
         x_pos = self.x.position
         y_pos = self.y.position
-        data = self.get_sample_data(self.current_sample)
         try:
-            xx = data['xx']
-            yy = data['yy']
-
-            x_index = next(
-                index for (index, d) in enumerate(xx)
-                if np.isclose(d["pos"], x_pos)
-            )
-            y_index = next(
-                index for (index, d) in enumerate(yy)
-                if np.isclose(d["pos"], y_pos)
-            )
+            m, n = self.find_target(x_pos, y_pos)
+            x, y = self.compute_mapped_point(m_row=m, n_column=n)
+            if np.isclose(x, x_pos) and np.isclose(y, y_pos):
+                y_index, x_index = m, n
+            else:
+                raise ValueError('Not at a target position')
         except Exception:
             logger.warning('Could not determine the m n points from position.')
-        n_points = self.m_n_points[1]
-
-        x_index += 1
-        m = int(np.ceil(x_index / n_points))
-        res = np.mod(x_index, 2 * n_points)
-        if res == 0:
-            n = 1
-        elif res <= n_points:
-            n = res
-        else:
-            n = 2 * n_points - (res + 1)
-
-        if x_index != '':
-            # to start from 1 instead of 0
-            x_index = n
-        if y_index != '':
-            y_index = m
         lines = []
         sample = f'current_sample: {self.current_sample}'
         grid = f'grid M x N: {self.m_n_points}'
@@ -666,6 +1021,64 @@ class XYGridStage():
 
         print('\n'.join(lines))
 
+    def find_target(self, x=None, y=None):
+        """
+        Find the grid point closest to a position on the current sample.
+
+        The position is mapped back onto the unit square with the current
+        `coefficients`, so this does not depend on the number of targets.
+
+        Parameters
+        ----------
+        x, y : float, optional
+            The position, defaults to the current motor positions.
+
+        Returns
+        -------
+        m, n : tuple
+            The row and column of the closest grid point, starting at 1.
+        """
+        if len(self.coefficients) != 8:
+            raise ValueError('No coefficients, please use load() or '
+                             'map_points() first.')
+        x = self.x.position if x is None else x
+        y = self.y.position if y is None else y
+        m_points, n_points = self.m_n_points
+        logic_x, logic_y = convert_to_logical(self.coefficients[:4],
+                                              self.coefficients[4:], x, y)
+        n = int(np.clip(np.rint(logic_x * (n_points - 1)), 0, n_points - 1))
+        m = int(np.clip(np.rint(logic_y * (m_points - 1)), 0, m_points - 1))
+        return m + 1, n + 1
+
+    def nearest_unshot_target(self, x=None, y=None, sample_name=None,
+                              path=None):
+        """
+        Find the unshot target of a sample closest to a position.
+
+        Parameters
+        ----------
+        x, y : float, optional
+            The position, defaults to the current motor positions.
+        sample_name : str, optional
+            The name of the sample. Defaults to the current sample.
+        path : str, optional
+            Path to the `.yml` file. Defaults to the path defined when
+            creating this object.
+
+        Returns
+        -------
+        m, n : tuple or None
+            The row and column of the target, starting at 1, or `None` if
+            all targets have been shot.
+        """
+        x = self.x.position if x is None else x
+        y = self.y.position if y is None else y
+        store = self.get_store(sample_name, path)
+        index, _ = store.nearest_unshot(x, y)
+        if index is None:
+            return None
+        return store.target(index)
+
     @property
     def current_sample_path(self):
         """
@@ -749,7 +1162,7 @@ class XYGridStage():
         data = None
         with open(path) as sample_file:
             try:
-                data = yaml.safe_load(sample_file)
+                data = yaml.load(sample_file, Loader=SampleLoader)
             except yaml.YAMLError as err:
                 logger.error('Error when loading the samples yaml file: %s',
                              err)
@@ -760,11 +1173,109 @@ class XYGridStage():
                            'in the file.')
             return {}
         try:
-            return data[str(sample_name)]
+            sample = data[str(sample_name)]
         except Exception:
             logger.error('The sample %s might not exist in the file.',
                          sample_name)
             return {}
+        # Statuses updated since the yaml file was written are in the store
+        store = self._open_store(str(sample_name), path, create=False)
+        if store is not None and isinstance(sample, dict):
+            store.update_yaml_data(sample)
+        return sample
+
+    def _open_store(self, sample_name, path, create=True):
+        """
+        Get the up-to-date `SampleStore` for a sample yaml file.
+
+        If ``create`` is `False`, return `None` instead of importing the yaml
+        file when there is no up-to-date store.
+        """
+        path = os.path.abspath(path)
+        source_key = SampleStore.get_source_key(path)
+        store = self._stores.get(path)
+        if store is not None and store.sample_name == sample_name:
+            if store.source_key == source_key:
+                return store
+        directory = os.path.join(os.path.dirname(path),
+                                 SampleStore.directory_name)
+        try:
+            store = SampleStore(directory, sample_name)
+        except (OSError, ValueError, KeyError):
+            store = None
+        if store is None or store.source_key != source_key:
+            if not create:
+                return None
+            store = SampleStore.from_yaml(path, sample_name,
+                                          directory=directory)
+        self._stores[path] = store
+        return store
+
+    def get_store(self, sample_name=None, path=None):
+        """
+        Get the compact target store for a sample.
+
+        The store is imported from the sample's yaml file the first time, and
+        again whenever the yaml file is replaced, e.g. by `save_grid`.
+
+        Parameters
+        ----------
+        sample_name : str, optional
+            The name of the sample. Defaults to the current sample.
+        path : str, optional
+            Path to the `.yml` file. Defaults to the path defined when
+            creating this object.
+
+        Returns
+        -------
+        store : SampleStore
+        """
+        sample_name = str(sample_name or self.current_sample)
+        path = path or os.path.join(self._path, sample_name + '.yml')
+        return self._open_store(sample_name, path)
+
+    def export_statuses(self, sample_name=None, path=None):
+        """
+        Write the target statuses of a sample back to its yaml file.
+
+        `set_status` only updates the sample's store, call this to bring
+        the yaml file up to date.
+
+        Parameters
+        ----------
+        sample_name : str, optional
+            The name of the sample. Defaults to the current sample.
+        path : str, optional
+            Path to the `.yml` file. Defaults to the path defined when
+            creating this object.
+        """
+        sample_name = str(sample_name or self.current_sample)
+        path = path or os.path.join(self._path, sample_name + '.yml')
+        self.get_store(sample_name, path).export_yaml(path)
+
+    def next_unshot_target(self, sample_name=None, path=None):
+        """
+        Find the first target of a sample that has not been shot yet.
+
+        Parameters
+        ----------
+        sample_name : str, optional
+            The name of the sample. Defaults to the current sample.
+        path : str, optional
+            Path to the `.yml` file. Defaults to the path defined when
+            creating this object.
+
+        Returns
+        -------
+        m, n : tuple or None
+            The row and column of the target, starting at 1, or `None` if
+            all targets have been shot.
+        """
+        store = self.get_store(sample_name, path)
+        index = store.next_unshot()
+        if index is None:
+            return None
+        return store.target(index)
 
     def get_sample_map_info(self, sample_name, path=None):
         """
@@ -850,6 +1361,7 @@ class XYGridStage():
                               "M": m_points,  # number of rows
                               "N": n_points,  # number of columns
                               "coefficients": coefficients,
+                              "snake_like": self._snake_like,
                               "xx": flat_xx,
                               "yy": flat_yy}}
         try:
@@ -860,31 +1372,16 @@ class XYGridStage():
         # entry = os.path.join(path, sample_name + '.yml')
         # if this is an existing file, overrite the info but keep the statuses
         if os.path.isfile(entry):
-            with open(entry) as sample_file:
-                yaml_dict = yaml.safe_load(sample_file)
-                sample = yaml_dict[sample_name]
-                # when overriding the same sample, this is assuming that a
-                # re-calibration was done - so keep the previous statuses.
-                temp_xx = sample['xx']
-                temp_yy = sample['yy']
-                temp_x_status = [i['status'] for i in temp_xx]
-                temp_y_status = [i['status'] for i in temp_yy]
-                # update the current data statuses with previous ones
-                for xd, status in zip(data[sample_name]['xx'], temp_x_status):
-                    xd.update((k, status)
-                              for k, v in xd.items() if k == 'status')
-                for yd, status in zip(data[sample_name]['yy'], temp_y_status):
-                    yd.update((k, status)
-                              for k, v in yd.items() if k == 'status')
-                yaml_dict.update(data)
-            with open(entry, 'w') as sample_file:
-                yaml.safe_dump(data, sample_file,
-                               sort_keys=False, default_flow_style=False)
-        else:
-            # create a new file
-            with open(entry, 'w') as sample_file:
-                yaml.safe_dump(data, sample_file,
-                               sort_keys=False, default_flow_style=False)
+            # when overriding the same sample, this is assuming that a
+            # re-calibration was done - so keep the previous statuses,
+            # including the ones not yet exported to the yaml file.
+            previous = self.get_store(sample_name, entry).shot.tolist()
+            for key in ('xx', 'yy'):
+                for item, status in zip(data[sample_name][key], previous):
+                    item['status'] = status
+        with open(entry, 'w') as sample_file:
+            yaml.dump(data, sample_file, Dumper=SampleDumper,
+                      sort_keys=False, default_flow_style=False)
 
     def reset_statuses(self, sample_name, path=None):
         """
@@ -899,23 +1396,9 @@ class XYGridStage():
             creating this object.
         """
         path = path or os.path.join(self._path, sample_name + '.yml')
-        with open(path) as sample_file:
-            yaml_dict = yaml.safe_load(sample_file) or {}
-            sample = yaml_dict.get(sample_name)
-            if sample:
-                for xd in sample.get('xx'):
-                    xd.update((k, False)
-                              for k, v in xd.items() if k == 'status')
-                for yd in sample.get('yy'):
-                    yd.update((k, False)
-                              for k, v in yd.items() if k == 'status')
-                yaml_dict[sample_name].update(sample)
-            else:
-                raise ValueError('Could not find this sample name in the file:'
-                                 f' {sample}')
-        with open(path, 'w') as sample_file:
-            yaml.safe_dump(yaml_dict, sample_file,
-                           sort_keys=False, default_flow_style=False)
+        store = self.get_store(sample_name, path)
+        store.reset()
+        store.export_yaml(path)
 
     def map_points(self, snake_like=True, top_left=None, top_right=None,
                    bottom_right=None, bottom_left=None, m_rows=None,
@@ -964,23 +1447,17 @@ class XYGridStage():
         a_coeffs, b_coeffs = mesh_interpolation(top_left, top_right,
                                                 bottom_right, bottom_left)
         self.coefficients = a_coeffs.tolist() + b_coeffs.tolist()
-        x_points, y_points = [], []
-
+        self._snake_like = snake_like
         xx, yy = get_unit_meshgrid(m_rows=rows, n_columns=columns)
-
-        # return x_points, y_points
-        for rowx, rowy in zip(xx, yy):
-            for x, y in zip(rowx, rowy):
-                i, j = convert_to_physical(a_coeffs=a_coeffs,
-                                           b_coeffs=b_coeffs,
-                                           logic_x=x, logic_y=y)
-                x_points.append(i)
-                y_points.append(j)
+        x_points, y_points = convert_to_physical(a_coeffs=a_coeffs,
+                                                 b_coeffs=b_coeffs,
+                                                 logic_x=xx, logic_y=yy)
         if snake_like:
-            x_points = snake_grid_list(
-                np.array(x_points).reshape(rows, columns))
-            y_points = snake_grid_list(
-                np.array(y_points).reshape(rows, columns))
+            x_points = snake_grid_list(x_points)
+            y_points = snake_grid_list(y_points)
+        else:
+            x_points = x_points.ravel().tolist()
+            y_points = y_points.ravel().tolist()
         self.positions_x = x_points
         self.positions_y = y_points
         return x_points, y_points
@@ -1007,20 +1484,9 @@ class XYGridStage():
             Indicates is target is shot or not.
         """
         sample = sample or self.current_sample
-        path = path or self.current_sample_path
-        x, y = self.compute_mapped_point(m_row=m,
-                                         n_column=n,
-                                         sample_name=sample, path=path)
-
-        data = self.get_sample_data(sample)
-        xx = data.get('xx')
-        x_status = None
-        # one value should be enough
-        # TODO: this is assuming that none of the points will be the unique.
-        if xx is not None:
-            x_status = next((item['status']
-                             for item in xx if item['pos'] == x), None)
-        return x_status
+        path = path or os.path.join(self._path, sample + '.yml')
+        store = self.get_store(sample, path)
+        return store.is_shot(store.index(m, n))
 
     def compute_mapped_point(self, m_row, n_column, sample_name=None,
                              path=None, compute_all=False):
@@ -1087,15 +1553,11 @@ class XYGridStage():
             return x, y
         else:
             # compute all points
-            x_points, y_points = [], []
-            for rowx, rowy in zip(xx_origin, yy_origin):
-                for x, y in zip(rowx, rowy):
-                    i, j = convert_to_physical(a_coeffs=a_coeffs,
-                                               b_coeffs=b_coeffs,
-                                               logic_x=x, logic_y=y)
-                    x_points.append(i)
-                    y_points.append(j)
-            return x_points, y_points
+            x_points, y_points = convert_to_physical(a_coeffs=a_coeffs,
+                                                     b_coeffs=b_coeffs,
+                                                     logic_x=xx_origin,
+                                                     logic_y=yy_origin)
+            return x_points.ravel().tolist(), y_points.ravel().tolist()
 
     def move_to_sample(self, m, n):
         """
@@ -1140,18 +1602,26 @@ class XYGridStage():
 
     def set_status(self, m, n, status=False, sample_name=None, path=None):
         """
-        TODO not working properly yet
         Set the status for a specific m and n point.
 
-        Parametrs:
-        ---------
+        Only the sample's store is updated, which is cheap enough to do for
+        every shot. Use `export_statuses` to write the statuses to the
+        sample's yaml file.
+
+        Parameters
+        ----------
         m : int
             Indicates the row number starting at 1.
         n : int
             Indicates the column number starting at 1.
         status : bool, optional
-            `False` to indicate that is has been shot, and `True` for
+            `True` to indicate that is has been shot, and `False` for
             available.
+        sample_name : str, optional
+            The name of the sample. Defaults to the current sample.
+        path : str, optional
+            Path to the `.yml` file. Defaults to the path defined when
+            creating this object.
         """
         assert isinstance(status, bool)
         sample_name = sample_name or self.current_sample
@@ -1164,38 +1634,8 @@ class XYGridStage():
         if (m or n) == 0:
             raise IndexError('Please start at 1, 1, as the initial points.')
 
-        with open(path) as sample_file:
-            yaml_dict = yaml.safe_load(sample_file) or {}
-            sample = yaml_dict.get(sample_name)
-            if sample:
-                xx = sample['xx']
-                yy = sample['yy']
-
-                n_pos = next(d['pos'] for (index, d) in enumerate(xx)
-                             if index == n - 1)
-
-                m_pos = next(d['pos'] for (index, d) in enumerate(yy)
-                             if index == m - 1)
-
-                for xd in sample.get('xx'):
-                    for k, v in xd.items():
-                        if k == 'pos' and v == n_pos:
-                            xd.update((st, status)
-                                      for st, vv in xd.items()
-                                      if st == 'status')
-                for yd in sample.get('yy'):
-                    for k, v in yd.items():
-                        if k == 'pos' and v == m_pos:
-                            yd.update((st, status)
-                                      for st, vv in xd.items()
-                                      if st == 'status')
-                yaml_dict[sample_name].update(sample)
-            else:
-                raise ValueError('Could not find this sample name in the file:'
-                                 f' {sample}')
-        with open(path, 'w') as sample_file:
-            yaml.safe_dump(yaml_dict, sample_file,
-                           sort_keys=False, default_flow_style=False)
+        store = self.get_store(sample_name, path)
+        store.set_shot(store.index(m, n), status)
 
 
 def mesh_interpolation(top_left, top_right, bottom_right, bottom_left):
@@ -1294,8 +1734,8 @@ def get_unit_meshgrid(m_rows, n_columns):
     dx = lx / (ni - 1)
     dy = ly / (nj - 1)
 
-    xx = [x0 + (i - 1) * dx for i in range(1, ni + 1)]
-    yy = [y0 + (j - 1) * dy for j in range(1, nj + 1)]
+    xx = x0 + np.arange(ni) * dx
+    yy = y0 + np.arange(nj) * dy
 
     return np.meshgrid(xx, yy)
 
@@ -1310,9 +1750,9 @@ def convert_to_physical(a_coeffs, b_coeffs, logic_x, logic_y):
         Perspective transformation coefficients for alpha.
     b_coeffs : array
         Perspective transformation coefficients for beta.
-    logic_x : float
+    logic_x : float or array
         Logical point in the x direction.
-    logic_y : float
+    logic_y : float or array
         Logical point in the y direction.
 
     Returns
@@ -1329,6 +1769,55 @@ def convert_to_physical(a_coeffs, b_coeffs, logic_x, logic_y):
     return x, y
 
 
+def convert_to_logical(a_coeffs, b_coeffs, x, y):
+    """
+    Convert to logical coordinates from physical coordinates.
+
+    This is the inverse of `convert_to_physical`, found by solving the
+    quadratic equation the bilinear mapping gives for the logical y value.
+
+    Parameters
+    ----------
+    a_coeffs : array
+        Perspective transformation coefficients for alpha.
+    b_coeffs : array
+        Perspective transformation coefficients for beta.
+    x : float or array
+        Physical point in the x direction.
+    y : float or array
+        Physical point in the y direction.
+
+    Returns
+    -------
+    logic_x, logic_y : tuple
+        The logical x and y values, between 0 and 1 inside the grid.
+    """
+    a1, a2, a3, a4 = a_coeffs
+    b1, b2, b3, b4 = b_coeffs
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # aa * m**2 + bb * m + cc = 0 for the logical y value m
+    aa = a3 * b4 - a4 * b3
+    bb = (y - b1) * a4 - b3 * a2 + b2 * a3 - b4 * (x - a1)
+    cc = (y - b1) * a2 - b2 * (x - a1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # numerically stable roots, one of them infinite when aa == 0
+        q = -0.5 * (bb + np.copysign(np.sqrt(bb ** 2 - 4 * aa * cc), bb))
+        root1 = cc / q
+        root2 = q / aa
+        # the root that falls on the grid
+        logic_y = np.where(np.abs(root1 - 0.5) <= np.abs(root2 - 0.5),
+                           root1, root2)
+        denom_x = a2 + a4 * logic_y
+        denom_y = b2 + b4 * logic_y
+        logic_x = np.where(np.abs(denom_x) >= np.abs(denom_y),
+                           (x - a1 - a3 * logic_y) / denom_x,
+                           (y - b1 - b3 * logic_y) / denom_y)
+    if logic_x.ndim == 0:
+        return float(logic_x), float(logic_y)
+    return logic_x, logic_y
+
+
 def snake_grid_list(points):
     """
     Flatten them into lists with snake_like pattern coordinate points.
@@ -1344,16 +1833,9 @@ def snake_grid_list(points):
     flat_points : list
         List of all the grid points folowing a snake-like pattern.
     """
-    temp_points = []
-    for i in range(points.shape[0]):
-        if i % 2 == 0:
-            temp_points.append(points[i])
-        else:
-            t = points[i]
-            tt = t[::-1]
-            temp_points.append(tt)
-    flat_points = list(chain.from_iterable(temp_points))
+    points = np.array(points, dtype=float)
+    # every other row goes right to left
+    points[1::2] = points[1::2, ::-1]
     # convert the numpy.float64 to normal float to be able to easily
     # save them in the yaml file
-    flat_points = [float(v) for v in flat_points]
-    return flat_points
+    return points.ravel().tolist()
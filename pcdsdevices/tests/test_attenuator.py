@@ -1,14 +1,17 @@
+import itertools
 import logging
 import threading
 import time
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 from ophyd.sim import make_fake_device
 from ophyd.status import wait as status_wait
 
 from ..attenuator import (AT1K2, AT1K4, AT2K2, AT2L0, MAX_FILTERS, AttBase,
-                          Attenuator, _att_classes)
+                          Attenuator, AttenuatorSolver, _att_classes,
+                          material_transmission)
 from .conftest import wait_and_assert
 
 logger = logging.getLogger(__name__)
@@ -263,3 +266,151 @@ def test_at2l0_clear_errors(at2l0):
     at2l0.clear_errors()
     for sig in signals:
         wait_and_assert(sig, 1)
+
+
+def brute_force_config(options, transmission, use_floor):
+    """Reference floor/ceiling search over every combination."""
+    results = [
+        (float(np.prod([opts[i] for opts, i in zip(options, config)])), config)
+        for config in itertools.product(*(range(len(o)) for o in options))
+    ]
+    if use_floor:
+        below = [res for res in results if res[0] <= transmission]
+        if below:
+            return max(below)[0]
+        return min(results)[0]
+    above = [res for res in results if res[0] >= transmission]
+    if above:
+        return min(above)[0]
+    return max(results)[0]
+
+
+@pytest.mark.parametrize('use_floor', [True, False])
+def test_attenuator_solver(use_floor):
+    rng = np.random.default_rng(42)
+    # Mix of independent filters, a ladder axis and a fixed axis
+    options = [[1.0, t] for t in rng.uniform(0.05, 0.95, 6)]
+    options.append([1.0, 0.5, 0.25, 0.125])
+    options.append([0.9])
+    solver = AttenuatorSolver(options)
+    desired = np.concatenate([rng.uniform(0, 1, 50), [0.0, 1.0, 1e-9]])
+    for transmission in desired:
+        solution = solver.solve(transmission, 9000, use_floor=use_floor)
+        expected = brute_force_config(options, transmission, use_floor)
+        assert solution.transmission == pytest.approx(expected)
+        product = np.prod(
+            [opts[i] for opts, i in zip(options, solution.config)]
+        )
+        assert solution.transmission == pytest.approx(product)
+        # Cached result
+        assert solver.solve(transmission, 9000.2, use_floor) is solution
+
+    configs, actual = solver.solve_many(desired, 9000, use_floor=use_floor)
+    assert configs.shape == (len(desired), len(options))
+    for transmission, config, trans in zip(desired, configs, actual):
+        solution = solver.solve(transmission, 9000, use_floor=use_floor)
+        assert tuple(config) == solution.config
+        assert trans == solution.transmission
+
+
+def test_attenuator_solver_energy_buckets():
+    calls = []
+
+    def filter_transmissions(energy):
+        calls.append(energy)
+        return [
+            [1.0, material_transmission('Si', thickness, energy)]
+            for thickness in (10, 20, 40, 80)
+        ]
+
+    solver = AttenuatorSolver(
+        filter_transmissions=filter_transmissions,
+        energy_resolution=10.0,
+    )
+    low = solver.solve(0.5, 8001)
+    solver.solve(0.1, 8004)
+    assert calls == [8000.0]
+    high = solver.solve(0.5, 12000)
+    assert calls == [8000.0, 12000.0]
+    assert low.energy == 8000.0
+    # Silicon is more transparent at higher energies
+    assert high.transmission >= low.transmission
+
+    configs, actual = solver.solve_many(
+        [0.5, 0.5, 0.1], [8003, 12002, 8000]
+    )
+    assert calls == [8000.0, 12000.0]
+    assert actual[0] == low.transmission
+    assert actual[1] == high.transmission
+
+
+def test_at2l0_local_solver(at2l0):
+    calc = at2l0.calculator
+    thicknesses = [10 * 2 ** (i % 9) for i in range(len(calc.filters_by_index))]
+    for filt, thickness in zip(calc.filters_by_index.values(), thicknesses):
+        filt.material.sim_put('C' if thickness < 200 else 'Si')
+        filt.thickness.sim_put(thickness)
+        filt.active.sim_put(1)
+        filt.is_stuck.sim_put(0)
+    # One inactive filter and one stuck in
+    calc.filters_by_index[3].active.sim_put(0)
+    calc.filters_by_index[5].is_stuck.sim_put(1)
+    calc.active_config.sim_put([0, 0, 0, 1] + [0] * 14)
+    calc.energy_actual.sim_put(9000.0)
+
+    start = time.monotonic()
+    config, transmission = calc.predict(1e-3)
+    elapsed = time.monotonic() - start
+    logger.info('First prediction over all configurations: %.3fs', elapsed)
+    start = time.monotonic()
+    for desired in np.geomspace(1e-6, 1, 100):
+        calc.predict(desired)
+    logger.info('100 more predictions: %.3fs', time.monotonic() - start)
+
+    assert len(config) == 18
+    assert config[1] == 0
+    assert config[3] == 1
+    expected = 1.0
+    for filt, inserted in zip(calc.filters_by_index.values(), config):
+        if inserted:
+            expected *= material_transmission(
+                filt.material.get(), filt.thickness.get(), 9000.0
+            )
+    assert transmission == pytest.approx(expected)
+    assert transmission <= 1e-3
+
+    ceiling, ceiling_transmission = calc.predict(1e-3, use_floor=False)
+    assert ceiling_transmission >= 1e-3
+    assert ceiling_transmission >= transmission
+
+
+def test_sxr_ladder_local_solver():
+    at1k4 = make_fake_device(AT1K4)(
+        'AT1K4:', calculator_prefix='AT1K4:CALC', name='fake_at1k4_solver'
+    )
+    calc = at1k4.calculator
+    for blade_index, blade in calc.filters_by_index.items():
+        blade.is_stuck.sim_put(0)
+        for index, attr in blade._filter_index_to_attr.items():
+            filt = getattr(blade, attr)
+            filt.material.sim_put('Al')
+            filt.thickness.sim_put(blade_index * index * 5.0)
+            filt.active.sim_put(1)
+            filt.is_stuck.sim_put(0)
+    # The last blade is stuck with its second filter inserted
+    calc.blade_04.is_stuck.sim_put(1)
+    calc.blade_04.inserted_filter_index.sim_put(3)
+
+    config, transmission = calc.predict(0.1, energy=1000.0)
+    assert len(config) == 4
+    assert config[3] == 2
+    expected = 1.0
+    for blade, index in zip(calc.filters_by_index.values(), config):
+        assert 0 <= index <= 8
+        if index:
+            filt = getattr(blade, blade._filter_index_to_attr[index])
+            expected *= material_transmission(
+                'Al', filt.thickness.get(), 1000.0
+            )
+    assert transmission == pytest.approx(expected)
+    assert transmission <= 0.1
@@ -1,13 +1,21 @@
+import logging
+import time
 from typing import Optional
 
 import pytest
+from ophyd.sim import make_fake_device
+from ophyd.utils import DisconnectedError
 
-from ..lasers.btms_config import (BtmsDestinationState, BtmsSourceState,
+from ..lasers.btms_config import (BEAM_CROSSINGS, DESTINATION_PATHS,
+                                  BtmsDestinationState, BtmsSourceState,
                                   BtmsState, DestinationInControlError,
                                   DestinationInUseError, DestinationPosition,
                                   MaintenanceModeActiveError,
                                   MovingActiveSource, PathCrossedError,
                                   PositionInvalidError, SourcePosition)
+from ..lasers.btps import BtpsState
+
+logger = logging.getLogger(__name__)
 
 
 @pytest.mark.parametrize(
@@ -449,3 +457,199 @@ def test_destination_acknowledgement():
         # Yield control and try again
         state.destinations[DestinationPosition.ld1].yields_control = True
         state.check_move(source, None, DestinationPosition.ld1)
+
+
+def test_conflict_tables():
+    destinations = list(DestinationPosition)
+    for start in DestinationPosition:
+        for target in DestinationPosition:
+            idx1 = destinations.index(start)
+            idx2 = destinations.index(target)
+            if idx1 < idx2:
+                path = tuple(destinations[idx1 + 1:idx2 + 1])
+            else:
+                path = tuple(destinations[idx2:idx1][::-1])
+            assert DESTINATION_PATHS[(start, target)] == path
+
+    for moving in SourcePosition:
+        for dest in DestinationPosition:
+            for active in SourcePosition:
+                if dest.is_top:
+                    crosses = moving.is_above(active)
+                else:
+                    crosses = active.is_above(moving)
+                assert (active in BEAM_CROSSINGS[(moving, dest)]) is crosses
+
+
+@pytest.fixture(scope='function')
+def fake_btps():
+    FakeBtpsState = make_fake_device(BtpsState)
+    btps = FakeBtpsState("", name="fake_btps")
+    for source in btps.sources.values():
+        source.current_destination.sim_put(0)
+        source.lss.opened_status.sim_put(0)
+    for dest in btps.destinations.values():
+        dest.exit_valve_ready.sim_put(1)
+        dest.yields_control.sim_put(1)
+        for source_to_dest in dest.sources.values():
+            source_to_dest.entry_valve_ready.sim_put(1)
+    btps.config.maintenance_mode.sim_put(0)
+    return btps
+
+
+def test_btps_cached_state(fake_btps: BtpsState):
+    def assert_cache_matches():
+        assert (
+            fake_btps.to_btms_state(use_cache=True)
+            == fake_btps.to_btms_state(use_cache=False)
+        )
+
+    assert_cache_matches()
+
+    ls1 = fake_btps.sources[SourcePosition.ls1]
+    ls1.current_destination.sim_put(1)
+    assert_cache_matches()
+    state = fake_btps.to_btms_state(use_cache=True)
+    assert state.sources[SourcePosition.ls1].destination is DestinationPosition.ld1
+    assert not state.sources[SourcePosition.ls1].beam_status
+
+    ls1.lss.opened_status.sim_put(1)
+    assert_cache_matches()
+    assert fake_btps.to_btms_state(use_cache=True).sources[
+        SourcePosition.ls1
+    ].beam_status
+
+    ld1 = fake_btps.destinations[DestinationPosition.ld1]
+    ld1.exit_valve_ready.sim_put(0)
+    assert_cache_matches()
+    ld1.exit_valve_ready.sim_put(1)
+    ld1.sources[SourcePosition.ls1].entry_valve_ready.sim_put(0)
+    assert_cache_matches()
+    ld1.sources[SourcePosition.ls1].entry_valve_ready.sim_put(1)
+    ld1.yields_control.sim_put(0)
+    fake_btps.config.maintenance_mode.sim_put(1)
+    assert_cache_matches()
+
+    # Copies are handed out: the cached state can't be modified by callers
+    state = fake_btps.to_btms_state(use_cache=True)
+    state.maintenance_mode = False
+    assert fake_btps.to_btms_state(use_cache=True).maintenance_mode
+
+
+def test_btps_uncached_state_reads(fake_btps: BtpsState, monkeypatch):
+    fake_btps.sources[SourcePosition.ls1].current_destination.sim_put(1)
+    fake_btps.sources[SourcePosition.ls1].lss.opened_status.sim_put(1)
+    read = []
+    for sig in fake_btps._get_btms_dependencies():
+        monkeypatch.setattr(
+            sig, 'get',
+            lambda *args, _get=sig.get, _sig=sig, **kwargs: (
+                read.append(_sig) or _get(*args, **kwargs)
+            ),
+        )
+    fake_btps.to_btms_state(use_cache=False)
+    # Only the valves on LS1's path to LD1 are read
+    entry_valves = [
+        sig for sig in read if sig.attr_name == 'entry_valve_ready'
+    ]
+    ld1 = fake_btps.destinations[DestinationPosition.ld1]
+    assert entry_valves == [ld1.sources[SourcePosition.ls1].entry_valve_ready]
+    exit_valves = [sig for sig in read if sig.attr_name == 'exit_valve_ready']
+    assert exit_valves == [ld1.exit_valve_ready]
+    # Each signal is only read once
+    assert len(read) == len(set(read))
+
+
+def test_btps_check_move(fake_btps: BtpsState):
+    # LS1 at LD1 with beam on, LS4 at LD6, LS8 at LD2, and the rest at top
+    # destinations with their beams off.
+    positions = {
+        SourcePosition.ls1: 1,
+        SourcePosition.ls3: 14,
+        SourcePosition.ls4: 6,
+        SourcePosition.ls5: 10,
+        SourcePosition.ls6: 9,
+        SourcePosition.ls8: 2,
+    }
+    for source_pos, dest_index in positions.items():
+        fake_btps.sources[source_pos].current_destination.sim_put(dest_index)
+    fake_btps.sources[SourcePosition.ls1].lss.opened_status.sim_put(1)
+
+    ls4 = fake_btps.sources[SourcePosition.ls4]
+    ls8 = fake_btps.sources[SourcePosition.ls8]
+    # LS4 is below LS1, so it would cross the beam going down to LD1 on the
+    # way to LD8
+    with pytest.raises(PathCrossedError):
+        ls4.check_move(DestinationPosition.ld8)
+    with pytest.raises(PathCrossedError):
+        ls4.check_move(DestinationPosition.ld8, use_cache=False)
+    # LD1 is taken, but LD4 can be reached without passing it
+    with pytest.raises(DestinationInUseError):
+        ls8.check_move(DestinationPosition.ld1)
+    ls8.check_move(DestinationPosition.ld4)
+
+    # Turning off the beam clears the crossing
+    fake_btps.sources[SourcePosition.ls1].lss.opened_status.sim_put(0)
+    ls4.check_move(DestinationPosition.ld8)
+    assert ls4.check_move_all(DestinationPosition.ld8) == []
+
+    # Maintenance mode is picked up from the subscription
+    fake_btps.config.maintenance_mode.sim_put(1)
+    with pytest.raises(MaintenanceModeActiveError):
+        ls4.check_move(DestinationPosition.ld8)
+
+
+def test_btps_cached_state_disconnect(fake_btps: BtpsState, monkeypatch):
+    positions = {
+        SourcePosition.ls1: 1,
+        SourcePosition.ls3: 14,
+        SourcePosition.ls4: 6,
+        SourcePosition.ls5: 10,
+        SourcePosition.ls6: 9,
+        SourcePosition.ls8: 2,
+    }
+    for source_pos, dest_index in positions.items():
+        fake_btps.sources[source_pos].current_destination.sim_put(dest_index)
+    ls8 = fake_btps.sources[SourcePosition.ls8]
+    ls8.check_move(DestinationPosition.ld4)
+
+    # A disconnected dependency must not leave the stale state in use
+    sig = fake_btps.config.maintenance_mode
+
+    def disconnected_get(*args, **kwargs):
+        raise DisconnectedError(f'{sig.name} is disconnected')
+
+    monkeypatch.setattr(sig, 'get', disconnected_get)
+    sig._run_subs(sub_type=sig.SUB_META, connected=False)
+    with pytest.raises(DisconnectedError):
+        ls8.check_move(DestinationPosition.ld4)
+    with pytest.raises(DisconnectedError):
+        fake_btps.to_btms_state(use_cache=True)
+
+    # Reconnecting picks up the current values again
+    monkeypatch.undo()
+    sig.sim_put(1)
+    sig._run_subs(sub_type=sig.SUB_META, connected=True)
+    with pytest.raises(MaintenanceModeActiveError):
+        ls8.check_move(DestinationPosition.ld4)
+
+
+def test_btps_check_move_benchmark(fake_btps: BtpsState):
+    ls1 = fake_btps.sources[SourcePosition.ls1]
+    ls1.current_destination.sim_put(1)
+    n_checks = 200
+
+    start = time.perf_counter()
+    for _ in range(n_checks):
+        ls1.check_move_all(DestinationPosition.ld14, use_cache=False)
+    sweep_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(n_checks):
+        ls1.check_move_all(DestinationPosition.ld14)
+    cached_time = time.perf_counter() - start
+    logger.info(
+        "%d BTPS move checks: PV sweep %.4f s, cached state %.4f s",
+        n_checks, sweep_time, cached_time,
+    )
+    assert cached_time < sweep_time
@@ -1,3 +1,6 @@
+import logging
+import time
+
 import pytest
 from ophyd.device import Component as Cpt
 from ophyd.device import Device
@@ -5,6 +8,7 @@ from ophyd.device import FormattedComponent as FCpt
 from ophyd.device import Kind
 from ophyd.positioner import SoftPositioner
 from ophyd.signal import Signal
+from ophyd.sim import make_fake_device
 
 from ..device import GroupDevice
 from ..device import InterfaceComponent as ICpt
@@ -13,6 +17,13 @@ from ..device import ObjectComponent as OCpt
 from ..device import UnrelatedComponent as UCpt
 from ..device import UpdateComponent as UpCpt
 from ..device import to_interface
+from ..digitizers import Wave8V2
+from ..interface import BaseInterface
+from ..lasers.btps import BtpsState
+from ..lodcm import LODCM
+from ..registry import _create_lazy
+
+logger = logging.getLogger(__name__)
 
 
 class Basic(Device):
@@ -231,3 +242,144 @@ def test_group_device_class_errors():
         class OverrideGroup(BasicGroup):
             one = None
             stage_group = [BasicGroup.one, BasicGroup.two]
+
+
+class NeedsParentGroup(BasicGroup):
+    plain = Cpt(Signal)
+    needy = Cpt(Signal)
+    needs_parent = [Device]
+
+
+def test_group_device_lazy_children():
+    """
+    Children are built on first access and lose their parent then.
+    """
+    group = BasicGroup('GROUP', name='group')
+    assert group._signals == {}
+    one = group.one
+    assert set(group._signals) == {'one'}
+    assert one.parent is None
+    assert one.biological_parent is group
+    assert group.one is one
+    # Walking the group only covers the children in use, unless asked
+    assert {name for name, _ in group.walk_subdevices()} == {'one'}
+    assert set(group._signals) == {'one'}
+    assert {name for name, _ in group.walk_subdevices(include_lazy=True)} == {
+        'one', 'two', 'bad', 'bad.dev'}
+
+
+def test_group_device_needs_parent():
+    group = NeedsParentGroup('GROUP', name='needy_group')
+    assert group.plain.parent is None
+    assert group.one.parent is group
+    assert group.bad.parent is group
+
+
+class WaitRecorder(Device):
+    waits = []
+
+    def wait_for_connection(self, *args, **kwargs):
+        self.waits.append(self.attr_name)
+
+
+class WaitGroup(BaseInterface, GroupDevice):
+    used = Cpt(WaitRecorder, ':USED')
+    later = Cpt(WaitRecorder, ':LATER', kind='omitted')
+    declared = Cpt(WaitRecorder, ':DECLARED', kind='omitted', lazy=True)
+    quiet = Cpt(Signal, kind='omitted')
+    shown = Cpt(Signal, kind='normal')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.used
+
+
+def test_group_device_lazy_wait():
+    """
+    Deferred children do not wait to connect, declared lazy ones do.
+    """
+    WaitRecorder.waits = []
+    group = WaitGroup('WAIT', name='wait_group')
+    assert 'used' in group._signals
+    group.later
+    assert WaitRecorder.waits == []
+    group.declared
+    assert WaitRecorder.waits == ['declared']
+    assert group.lazy_wait_for_connection
+
+
+def test_group_device_status_children():
+    """
+    The status only creates the children it shows.
+    """
+    group = WaitGroup('WAIT', name='wait_group')
+    group.status()
+    assert 'shown' in group._signals
+    assert 'quiet' not in group._signals
+    assert 'later' not in group._signals
+    assert 'declared' not in group._signals
+
+
+def count_signals(device):
+    """Count the signals and sub-devices created so far in a device tree."""
+    count = 0
+    for child in device._signals.values():
+        count += 1
+        if isinstance(child, Device):
+            count += count_signals(child)
+    return count
+
+
+def count_eager_signals(device):
+    """
+    Count the signals a device tree would create up front without deferral.
+
+    This is everything but the components that were declared lazy, and must
+    be called after the whole tree has been created.
+    """
+    count = 0
+    for attr, child in device._signals.items():
+        cpt = device._sig_attrs.get(attr)
+        declared_lazy = cpt is not None and cpt.lazy
+        if declared_lazy and not getattr(cpt, '_deferred', False):
+            continue
+        count += 1
+        if isinstance(child, Device):
+            count += count_eager_signals(child)
+    return count
+
+
+@pytest.mark.timeout(120)
+@pytest.mark.parametrize(
+    'cls, prefix',
+    [(LODCM, 'LOD'), (Wave8V2, 'WAVE8'), (BtpsState, 'BTPS')],
+    ids=['LODCM', 'Wave8V2', 'BtpsState'],
+)
+def test_group_device_startup_benchmark(cls, prefix):
+    fake_cls = make_fake_device(cls)
+    start = time.perf_counter()
+    device = fake_cls(prefix, name=f'bench_{cls.__name__.lower()}')
+    created = time.perf_counter() - start
+    initial = count_signals(device)
+    start = time.perf_counter()
+    _create_lazy(device)
+    walked = time.perf_counter() - start
+    # What the device would have created up front without deferral
+    eager = count_eager_signals(device)
+    logger.info('%s: built in %.3fs with %d signals instead of %d, %.3fs '
+                'to build the rest', cls.__name__, created, initial, eager,
+                walked)
+    assert initial <= eager
+    if issubclass(cls, GroupDevice):
+        # Most of a group's tree waits until it is used
+        assert initial < eager / 2
+
+
+def test_component_alias():
+    fake_cls = make_fake_device(LODCM)
+    lodcm = fake_cls('LOD', name='alias_lodcm')
+    assert 'tower1' not in lodcm._signals
+    assert lodcm.z1 is lodcm.tower1.z1
+    assert lodcm.EC is lodcm.energy_c
+    assert 'tower2' not in lodcm._signals
+    assert LODCM.z1.dotted_name == 'tower1.z1'
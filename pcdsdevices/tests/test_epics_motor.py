@@ -1,6 +1,11 @@
 import itertools
 import logging
+import threading
+import time
+import tracemalloc
+from types import SimpleNamespace
 
+import ophyd
 import pytest
 from bluesky import RunEngine
 from bluesky.plan_stubs import close_run, open_run, stage, unstage
@@ -14,8 +19,9 @@ from ophyd.utils.errors import LimitError
 
 from ..epics_motor import (IMS, MMC100, PMC100, BeckhoffAxis, EpicsMotor,
                            EpicsMotorInterface, Motor, MotorDisabledError,
-                           Newport, OffsetIMSWithPreset, OffsetMotor,
-                           PCDSMotorBase)
+                           Motors, Newport, OffsetIMSWithPreset, OffsetMotor,
+                           PCDSMotorBase, _deferred_motor_class,
+                           _GetMotorClass, _motor_types)
 
 logger = logging.getLogger(__name__)
 
@@ -313,6 +319,68 @@ def test_disable(fake_pcds_motor):
     m.move(1, wait=False)
 
 
+def test_health_snapshot(fake_pcds_motor, monkeypatch):
+    logger.debug('test_health_snapshot')
+    m = fake_pcds_motor
+    m.check_value(1)
+    assert m.check_limit_switches() == "Low [] High []"
+    m.msta
+    staleness = m.health_staleness
+    assert set(staleness) == set(m._health_attrs)
+    assert all(age >= 0 for age in staleness.values())
+
+    # Once monitored, validation and status do not issue gets
+    for attr in m._health_attrs:
+        def no_get(*args, attr=attr, **kwargs):
+            raise AssertionError(f'{attr} was read with a get')
+        monkeypatch.setattr(getattr(m, attr), 'get', no_get)
+    m.disabled.sim_put(1)
+    with pytest.raises(MotorDisabledError):
+        m.check_value(1)
+    m.disabled.sim_put(0)
+    m.motor_spg.sim_put(1)
+    with pytest.raises(MotorDisabledError):
+        m.check_value(1)
+    m.motor_spg.sim_put(2)
+    m.check_value(1)
+    m.low_limit_switch.sim_put(1)
+    assert m.check_limit_switches() == "Low [x] High []"
+    m.msta_raw.sim_put(1 << 14)
+    assert m.homed
+    assert m.health_staleness['disabled'] < staleness['disabled'] + 1
+    # A disconnect drops the value until it is read again
+    m._health_meta_changed(obj=m.disabled, connected=False)
+    assert 'disabled' not in m._health
+
+
+def test_health_snapshot_benchmark(fake_pcds_motor, monkeypatch):
+    logger.debug('test_health_snapshot_benchmark')
+    m = fake_pcds_motor
+    m.check_value(1)
+    # Give each get a simulated 1 ms Channel Access round trip
+    for attr in m._health_attrs:
+        signal = getattr(m, attr)
+
+        def slow_get(*args, get=signal.get, **kwargs):
+            time.sleep(0.001)
+            return get(*args, **kwargs)
+        monkeypatch.setattr(signal, 'get', slow_get)
+    count = 100
+    start = time.perf_counter()
+    for _ in range(count):
+        m.disabled.get()
+        m.motor_spg.get()
+        m.motor_spg.get()
+    gets = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(count):
+        m.check_value(1)
+    snapshot = time.perf_counter() - start
+    logger.info('%d move checks: signal gets %.4fs, snapshot %.4fs',
+                count, gets, snapshot)
+    assert snapshot < gets / 2
+
+
 def test_beckhoff_error_clear(fake_beckhoff):
     m = fake_beckhoff
     m.clear_error()
@@ -401,6 +469,76 @@ def test_motor_factory():
     assert isinstance(m, EpicsMotor)
 
 
+def test_motor_class_precedence():
+    # The table order wins over the position in the prefix
+    assert _GetMotorClass('TST:MMN:MMS:01') is IMS
+    assert _GetMotorClass('TST:MCS2:01') is _motor_types['MCS2']
+    assert _GetMotorClass('TST:MMSX:01') is EpicsMotor
+    assert _GetMotorClass('MMS:TST:01') is EpicsMotor
+
+
+def test_motors_bulk_factory():
+    motors = Motors({'mot_b': 'TST:MY:MMB:01', 'mot_a': 'TST:MY:MMS:01',
+                     'mot_c': 'TST:MY:MMS:02'})
+    assert list(motors) == ['mot_b', 'mot_a', 'mot_c']
+    assert isinstance(motors['mot_a'], IMS)
+    assert isinstance(motors['mot_b'], BeckhoffAxis)
+    assert motors['mot_c'].name == 'mot_c'
+    assert motors['mot_c'].prefix == 'TST:MY:MMS:02'
+    # The bulk factory defers the motors' omitted and config signals
+    assert type(motors['mot_a']).velocity_base.lazy
+    assert type(motors['mot_a']) is type(motors['mot_c'])
+    eager = Motors({'mot_d': 'TST:MY:MMS:03'}, defer=False)
+    assert type(eager['mot_d']) is IMS
+
+
+def test_deferred_components():
+    fake_ims = fake_motor(_deferred_motor_class(IMS), name='deferred_ims')
+    cpt = type(fake_ims).velocity_base
+    assert cpt.lazy
+    assert not type(fake_ims).user_readback.lazy
+    # Components with subscription decorators stay eager
+    assert not type(fake_ims).high_limit_travel.lazy
+    assert 'velocity_base' not in fake_ims._signals
+    fake_ims.velocity_base.put(1)
+    assert 'velocity_base' in fake_ims._signals
+    assert fake_ims.velocity_base.get() == 1
+    # Deferred config signals still show up when read
+    assert f'{fake_ims.name}_velocity_max' in fake_ims.read_configuration()
+    # The motor classes themselves are untouched
+    assert not IMS.velocity_base.lazy
+    assert not ophyd.EpicsMotor.acceleration.lazy
+
+
+@pytest.mark.timeout(120)
+def test_motor_instantiation_benchmark():
+    count = 1000
+    classes = dict.fromkeys(list(_motor_types.values()) + [EpicsMotor])
+    for cls, deferred in itertools.product(classes, (False, True)):
+        if deferred:
+            if not issubclass(cls, EpicsMotorInterface):
+                continue
+            cls = _deferred_motor_class(cls)
+        FakeCls = make_fake_device(cls)
+        FakeCls('TST:MTR:WARM', name='warm_up')
+        start = time.perf_counter()
+        motors = [FakeCls(f'TST:MTR:{num}', name=f'mtr_{num}')
+                  for num in range(count)]
+        elapsed = time.perf_counter() - start
+        del motors
+        tracemalloc.start()
+        try:
+            motors = [FakeCls(f'TST:MTR:{num}', name=f'mem_{num}')
+                      for num in range(count // 10)]
+            memory = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        logger.info('%s%s: %.3f ms and %.1f KiB per instance',
+                    cls.__name__, ' (deferred)' if deferred else '',
+                    elapsed / count * 1e3, memory / len(motors) / 1024)
+        del motors
+
+
 def test_fake_offset_ims(fake_offset_ims):
     off_ims = fake_offset_ims
     # with motor position at 1
@@ -633,3 +771,133 @@ def test_limits_setter():
     # Same twice
     mot.limits = (90, 90)
     assert lims() == (0, 0)
+
+
+class FakePmgr:
+    """Stand-in for pmgrAPI that counts database refreshes."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.configs = {}
+        self.updates = 0
+        self.pm = SimpleNamespace(objs=[], getActualConfig=self.configs.get)
+
+    def update_db(self):
+        self.updates += 1
+        time.sleep(0.01)
+
+    def _search(self, objs, field, value):
+        return {'id': value}
+
+    def set_config(self, pv, cfgname):
+        self.update_db()
+        if pv in self.fail:
+            raise ValueError(f'No configuration for {pv}')
+        self.configs[pv] = cfgname
+
+
+@pytest.fixture(scope='function')
+def fake_pmgr(monkeypatch):
+    for attr, value in (('_pm', None), ('_pm_init_error', False),
+                        ('_pm_update_db', None), ('_pm_last_update', None),
+                        ('_pm_sessions', 0),
+                        ('_pm_defer_config', False), ('_pm_pending', {}),
+                        ('_pm_failures', {})):
+        monkeypatch.setattr(IMS, attr, value)
+    pm = FakePmgr(fail={'TST:MTR:03'})
+    IMS._install_pmgr(pm)
+    return pm
+
+
+def ims_md(num, stageidentity='stage'):
+    return SimpleNamespace(extraneous={'_id': f'mtr_{num:02}',
+                                       'pvbase': f'TST:MTR:{num:02}',
+                                       'stageidentity': stageidentity})
+
+
+def test_ims_pmgr_update_ttl(fake_pmgr, monkeypatch):
+    IMS.update_pmgr_db()
+    IMS.update_pmgr_db()
+    assert fake_pmgr.updates == 1
+    IMS.update_pmgr_db(force=True)
+    assert fake_pmgr.updates == 2
+    monkeypatch.setattr(IMS, 'pmgr_update_ttl', 0)
+    IMS.update_pmgr_db()
+    assert fake_pmgr.updates == 3
+
+
+def test_ims_pmgr_update_ttl_session(fake_pmgr):
+    # Outside of a session, pmgr always refreshes
+    fake_pmgr.update_db()
+    fake_pmgr.update_db()
+    assert fake_pmgr.updates == 2
+    with IMS.pmgr_session():
+        fake_pmgr.update_db()
+        fake_pmgr.update_db()
+        assert fake_pmgr.updates == 3
+    fake_pmgr.update_db()
+    assert fake_pmgr.updates == 4
+    assert fake_pmgr.update_db == IMS._pm_update_db
+
+
+def test_ims_pmgr_current_values(fake_pmgr):
+    motor = fake_motor(IMS, name='mtr_01')
+    fake_pmgr.configs[motor.prefix] = 'stage'
+    updates = fake_pmgr.updates
+    # Outside of a session, every read sees a fresh database
+    assert motor.get_current_values() == 'stage'
+    assert motor.get_current_values() == 'stage'
+    assert fake_pmgr.updates == updates + 2
+    with IMS.pmgr_session():
+        motor.get_current_values()
+        motor.get_current_values()
+    assert fake_pmgr.updates == updates + 3
+
+
+def test_ims_pmgr_immediate(fake_pmgr):
+    motor = fake_motor(IMS, name='mtr_01')
+    motor.md = ims_md(1)
+    assert fake_pmgr.configs == {'TST:MTR:01': 'stage'}
+
+
+@pytest.mark.parametrize('background', [False, True])
+def test_ims_pmgr_session(fake_pmgr, background):
+    motors = [fake_motor(IMS, name=f'mtr_{num:02}') for num in range(6)]
+    with IMS.pmgr_session(background=background, batch_size=2):
+        for num, motor in enumerate(motors[:-1]):
+            motor.md = ims_md(num)
+        motors[-1].md = ims_md(5, stageidentity='NEW')
+        assert not fake_pmgr.configs
+        assert fake_pmgr.updates == 0
+    if background:
+        for thread in threading.enumerate():
+            if thread.name == 'ims_pmgr_configs':
+                thread.join(timeout=5)
+    # One database refresh for the whole session
+    assert fake_pmgr.updates == 1
+    assert fake_pmgr.configs == {f'TST:MTR:{num:02}': 'stage'
+                                 for num in (0, 1, 2, 4)}
+    failures = IMS.pmgr_report(display=False)
+    assert set(failures) == {'mtr_03', 'mtr_05'}
+    assert failures['mtr_03'] == ('TST:MTR:03',
+                                  'No configuration for TST:MTR:03')
+    IMS.pmgr_report()
+
+
+def test_ims_pmgr_session_benchmark(fake_pmgr, monkeypatch):
+    fake_pmgr.fail.clear()
+    motors = [fake_motor(IMS, name=f'mtr_{num:02}') for num in range(20)]
+    monkeypatch.setattr(IMS, 'pmgr_update_ttl', 0)
+    start = time.perf_counter()
+    for num, motor in enumerate(motors):
+        motor.md = ims_md(num)
+    serial = time.perf_counter() - start
+    monkeypatch.setattr(IMS, 'pmgr_update_ttl', 10.0)
+    start = time.perf_counter()
+    with IMS.pmgr_session():
+        for num, motor in enumerate(motors):
+            motor.md = ims_md(num)
+    session = time.perf_counter() - start
+    logger.info('pmgr config for %d motors: serial %.3fs, session %.3fs',
+                len(motors), serial, session)
+    assert session < serial / 2
@@ -4,13 +4,20 @@ import sys
 import threading
 import time
 from pathlib import Path
+from unittest.mock import Mock
 
 import ophyd
 import pytest
-
-from ..interface import (BaseInterface, TabCompletionHelperClass,
-                         get_engineering_mode, set_engineering_mode,
+from lightpath import LightpathState
+from ophyd.ophydobj import Kind
+from ophyd.sim import FakeEpicsSignal, make_fake_device
+
+from ..attenuator import AT2L0
+from ..interface import (BaseInterface, LightpathMixin, Presets,
+                         TabCompletionHelperClass, get_engineering_mode,
+                         set_engineering_mode, set_lightpath_engine,
                          setup_preset_paths)
+from ..mirror import XOffsetMirror
 from ..sim import FastMotor, SlowMotor
 from . import conftest
 
@@ -191,6 +198,70 @@ def test_presets(presets, fast_motor: FastMotor):
     assert hasattr(fast_motor, 'mv_sample')
 
 
+def update_presets_from_threads(
+    paths, prefix, n_threads, n_updates, lock_timeout=None
+):
+    """Add presets to one device from many threads at once."""
+    if lock_timeout is not None:
+        Presets._lock_timeout = lock_timeout
+    setup_preset_paths(**paths)
+    motor = FastMotor(name='sim_fast')
+
+    def add_presets(thread):
+        for i in range(n_updates):
+            motor.presets.add_hutch(f'{prefix}_{thread}_{i}', i)
+
+    threads = [
+        threading.Thread(target=add_presets, args=(thread,))
+        for thread in range(n_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.mark.skipif(fcntl is None, reason='Requires fcntl')
+@pytest.mark.timeout(60)
+def test_presets_concurrent_updates(
+    presets, fast_motor: FastMotor, monkeypatch
+):
+    n_procs = 3
+    n_threads = 4
+    n_updates = 5
+    # Leave plenty of time for the lock on a busy test machine
+    lock_timeout = 30.0
+    monkeypatch.setattr(Presets, '_lock_timeout', lock_timeout)
+    fast_motor.presets.add_hutch('start', 0)
+    paths = dict(Presets._paths)
+    procs = [
+        mp.Process(
+            target=update_presets_from_threads,
+            args=(paths, f'proc{proc}', n_threads, n_updates, lock_timeout),
+        )
+        for proc in range(n_procs)
+    ]
+    for proc in procs:
+        proc.start()
+    # Also update from threads in this process, outside of the main thread
+    update_presets_from_threads(paths, 'main', n_threads, n_updates)
+    for proc in procs:
+        proc.join()
+        assert proc.exitcode == 0
+
+    # No update was lost to a lock timeout or an unlocked write
+    fast_motor.presets.sync()
+    names = set(fast_motor.presets.positions.__dict__)
+    expected = {'start'} | {
+        f'{prefix}_{thread}_{i}'
+        for prefix in ['main'] + [f'proc{proc}' for proc in range(n_procs)]
+        for thread in range(n_threads)
+        for i in range(n_updates)
+    }
+    assert names == expected
+    assert fast_motor.presets.positions.main_3_4.pos == 4
+
+
 def test_presets_type(presets, fast_motor: FastMotor):
     logger.debug('test_presets_type')
     # Mess up the input types, fail before opening the file
@@ -222,6 +293,39 @@ def test_presets_desync(presets, fast_motor: FastMotor):
     assert fast_motor2.presets.positions.four.pos == 5
 
 
+def test_presets_file_cache(presets):
+    file_cache = Presets._file_cache
+    motors = [FastMotor(name=f'sim_fast_cache{i}') for i in range(10)]
+    for motor in motors:
+        motor.presets.add_hutch('zero', 0)
+        motor.presets.add_user('one', 1)
+
+    # Startup only parses files that changed since they were last read
+    loads = file_cache.loads
+    setup_preset_paths(**Presets._paths)
+    assert file_cache.loads == loads
+    assert all(motor.presets.positions.one.pos == 1 for motor in motors)
+
+    # Only the changed file is parsed again
+    motors[0].presets.positions.one.update_pos(2)
+    assert file_cache.loads == loads + 1
+    for motor in motors:
+        assert not motor.presets.sync_needed()
+    assert motors[0].presets.positions.one.pos == 2
+
+    # A fresh cache parses every file exactly once
+    file_cache.clear()
+    loads = file_cache.loads
+    start = time.monotonic()
+    setup_preset_paths(**Presets._paths)
+    logger.info(
+        'setup_preset_paths with %d devices took %.3fs',
+        len(motors), time.monotonic() - start,
+    )
+    assert file_cache.loads == loads + 2 * len(motors)
+    assert motors[0].presets.positions.one.pos == 2
+
+
 def test_presets_tab_init(fast_motor: FastMotor, deferred_fast_motor_presets):
     # deferred_fast_motor_preset must come last,
     # to clear cache after motor is created (and sync-ed at init)
@@ -396,3 +500,317 @@ def test_tab_helper_class():
     tab.add('foobar')
     tab.reset()
     assert 'foobar' not in tab.get_filtered_dir_list()
+
+
+@pytest.mark.parametrize('cls_name', ['attenuator.AT2L0', 'lodcm.LODCM'])
+def test_status_info_concurrent_benchmark(monkeypatch, cls_name):
+    import importlib
+
+    from ophyd.sim import FakeEpicsSignal
+
+    from .. import interface
+
+    module_name, name = cls_name.split('.')
+    cls = getattr(importlib.import_module(f'pcdsdevices.{module_name}'), name)
+    instance = conftest.best_effort_instantiation(cls)
+    latency = 0.01
+    orig_get = FakeEpicsSignal.get
+
+    def slow_get(self, *args, **kwargs):
+        time.sleep(latency)
+        return orig_get(self, *args, **kwargs)
+
+    monkeypatch.setattr(FakeEpicsSignal, 'get', slow_get)
+
+    pending = []
+    interface.ophydobj_info(
+        instance,
+        subdevice_filter=lambda info: bool(info['kind'] & Kind.normal),
+        pending=pending,
+    )
+    n_signals = len(pending)
+    assert n_signals > interface.status_info_max_workers
+
+    start = time.monotonic()
+    instance.status()
+    elapsed = time.monotonic() - start
+    logger.info('%s status() with %d gets at %.0f ms latency: %.3f s',
+                name, n_signals, latency * 1000, elapsed)
+    # Serially, this would take at least n_signals * latency
+    assert elapsed < n_signals * latency / 2
+    assert elapsed < interface.status_info_timeout + 1.0
+
+
+def test_status_info_deadline(monkeypatch):
+    from .. import interface
+
+    class SlowSignal(ophyd.Signal):
+        def get(self, **kwargs):
+            time.sleep(1.0)
+            return super().get(**kwargs)
+
+    class Slow(BaseInterface, ophyd.Device):
+        fast = ophyd.Component(ophyd.Signal, value=1)
+        slow = ophyd.Component(SlowSignal, value=2)
+
+    monkeypatch.setattr(interface, 'status_info_timeout', 0.2)
+    dev = Slow(name='dev')
+    start = time.monotonic()
+    info = dev.status_info()
+    assert time.monotonic() - start < 0.9
+    assert info['fast']['value'] == 1
+    assert info['slow']['value'] is None
+
+
+@pytest.fixture(scope='function')
+def status_snapshot():
+    from .. import interface
+    snapshot = interface.set_status_snapshot(max_age=60)
+    yield snapshot
+    interface.set_status_snapshot(None)
+
+
+class CountingSignal(ophyd.Signal):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.get_count = 0
+
+    def get(self, **kwargs):
+        self.get_count += 1
+        return super().get(**kwargs)
+
+
+class SnapshotDevice(BaseInterface, ophyd.Device):
+    sig1 = ophyd.Component(CountingSignal, value=1)
+    sig2 = ophyd.Component(CountingSignal, value=2)
+
+
+def test_status_snapshot_reuses_values(status_snapshot):
+    dev = SnapshotDevice(name='dev')
+    for _ in range(5):
+        info = dev.status_info()
+    assert info['sig1']['value'] == 1
+    assert dev.sig1.get_count == 1
+    assert dev.sig2.get_count == 1
+    assert status_snapshot.misses == 2
+    assert status_snapshot.hits == 8
+    assert status_snapshot.age(dev.sig1) < 60
+
+
+def test_status_snapshot_max_age(status_snapshot):
+    dev = SnapshotDevice(name='dev')
+    dev.status_info()
+    status_snapshot.max_age = 0
+    time.sleep(0.01)
+    dev.sig1.put(3)
+    assert dev.status_info()['sig1']['value'] == 3
+    assert dev.sig1.get_count == 2
+
+
+def test_status_snapshot_monitored(status_snapshot, monkeypatch):
+    from .. import interface
+    dev = SnapshotDevice(name='dev')
+    dev.sig1._fix_type = lambda value: value
+    monkeypatch.setattr(interface, 'signal_is_monitored',
+                        lambda sig: sig is dev.sig1)
+    dev.sig1.put(4)
+    assert dev.status_info()['sig1']['value'] == 4
+    dev.sig1.put(5)
+    assert dev.status_info()['sig1']['value'] == 5
+    assert dev.sig1.get_count == 0
+
+
+def test_status_snapshot_disabled():
+    from .. import interface
+    assert interface.get_status_snapshot() is None
+    dev = SnapshotDevice(name='dev')
+    dev.status_info()
+    dev.status_info()
+    assert dev.sig1.get_count == 2
+
+
+def lightpath_device(cls, prefix):
+    """A fake lightpath device with every lightpath signal populated."""
+    dev = make_fake_device(cls)(prefix, name=f'lp_{cls.__name__.lower()}',
+                                input_branches=['L0'],
+                                output_branches=['L0', 'L1'])
+    for sig in dev.lightpath_summary._signals:
+        sig.sim_put(0)
+    return dev
+
+
+@pytest.mark.parametrize(
+    'cls, prefix',
+    [(XOffsetMirror, 'MR1L0:HOMS'), (AT2L0, 'AT2L0:')],
+    ids=['XOffsetMirror', 'AT2L0'],
+)
+def test_lightpath_gets_per_update(cls, prefix, monkeypatch):
+    dev = lightpath_device(cls, prefix)
+    signals = list(dev.lightpath_summary._signals)
+    gets = []
+    for sig in signals:
+        monkeypatch.setattr(
+            sig, 'get',
+            lambda *args, _get=sig.get, **kwargs: gets.append(1) or _get(
+                *args, **kwargs),
+        )
+    n_updates = 200
+    timings = {}
+    counts = {}
+    for refresh in (True, False):
+        gets.clear()
+        start = time.perf_counter()
+        for num in range(n_updates):
+            # Each update runs the lightpath callback from the cache
+            signals[num % len(signals)].sim_put(num % 2)
+            if refresh:
+                # The fresh read every update used to do
+                dev.get_lightpath_state(use_cache=False, refresh=True)
+        timings[refresh] = time.perf_counter() - start
+        counts[refresh] = len(gets) / n_updates
+    logger.info('%s: %d lightpath signals, %.1f gets per update with refresh '
+                '(%.3fs), %.1f from the cache (%.3fs)', cls.__name__,
+                len(signals), counts[True], timings[True], counts[False],
+                timings[False])
+    assert counts[True] == len(signals)
+    assert counts[False] == 0
+    assert dev.get_lightpath_state(refresh=True) == dev.get_lightpath_state()
+
+
+class LightpathCounter(LightpathMixin):
+    lightpath_cpts = ['insert', 'trans']
+    insert = ophyd.Component(FakeEpicsSignal, ':INSERT')
+    trans = ophyd.Component(FakeEpicsSignal, ':TRANS')
+    calls = 0
+
+    def calc_lightpath_state(self, insert, trans):
+        self.calls += 1
+        return LightpathState(inserted=bool(insert), removed=not insert,
+                              output={'L0': trans})
+
+
+def lightpath_counters(count):
+    devices = [LightpathCounter(f'LP:{num}', name=f'lp_counter_{num}',
+                                input_branches=['L0'], output_branches=['L0'])
+               for num in range(count)]
+    for device in devices:
+        device.insert.sim_put(0)
+        device.trans.sim_put(1.0)
+    return devices
+
+
+@pytest.fixture(scope='function')
+def lightpath_engine():
+    from .. import interface
+
+    # Devices left over from other tests should not join in
+    interface._lightpath_devices.clear()
+    engine = set_lightpath_engine(period=0.05)
+    yield engine
+    set_lightpath_engine(None)
+
+
+def test_lightpath_engine_batches(lightpath_engine):
+    devices = lightpath_counters(3)
+    first = lightpath_engine.flush()
+    assert first.changed == {'lp_counter_0', 'lp_counter_1', 'lp_counter_2'}
+    for device in devices:
+        device.calls = 0
+    for value in range(5):
+        devices[0].insert.sim_put(value % 2)
+        devices[0].trans.sim_put(value / 10)
+    devices[1].insert.sim_put(1)
+    snapshot = lightpath_engine.flush()
+    # One evaluation per changed device, however many updates it had
+    assert [device.calls for device in devices] == [1, 1, 0]
+    assert snapshot.changed == {'lp_counter_0', 'lp_counter_1'}
+    assert snapshot.states['lp_counter_1'].inserted
+    assert lightpath_engine.flush() is snapshot
+
+    devices[2].insert.sim_put(1)
+    new_snapshot = lightpath_engine.flush()
+    assert new_snapshot.version == snapshot.version + 1
+    assert new_snapshot.diff(snapshot) == {'lp_counter_2'}
+    assert new_snapshot.states['lp_counter_0'] is \
+        snapshot.states['lp_counter_0']
+    assert devices[2].get_lightpath_state().inserted
+
+    timing = lightpath_engine.timing
+    # The first evaluation, then the batch
+    assert timing['lp_counter_0'].calls == 2
+    assert timing['lp_counter_0'].mean > 0
+    assert 'lp_counter_2' in lightpath_engine.timing_table().get_string()
+
+
+def test_lightpath_engine_periodic(lightpath_engine):
+    device, = lightpath_counters(1)
+    snapshots = []
+    lightpath_engine.subscribe(
+        lambda snapshot, **kwargs: snapshots.append(snapshot))
+    device.insert.sim_put(1)
+    for _ in range(50):
+        if snapshots:
+            break
+        time.sleep(0.02)
+    assert snapshots[-1].states['lp_counter_0'].inserted
+
+
+def test_lightpath_engine_consumers(lightpath_engine):
+    device, = lightpath_counters(1)
+    lightpath_engine.flush()
+    # Consumers like lightpath read the state from summary callbacks
+    seen = []
+    device.lightpath_summary.subscribe(
+        lambda **kwargs: seen.append(device.get_lightpath_state().inserted),
+        run=False,
+    )
+    device.insert.sim_put(1)
+    assert seen[-1]
+    device.insert.sim_put(0)
+    assert not seen[-1]
+    assert not device.get_lightpath_state().inserted
+    # The batch still publishes the latest state
+    assert not lightpath_engine.flush().states['lp_counter_0'].inserted
+
+
+def test_lightpath_engine_errors(lightpath_engine):
+    device, = lightpath_counters(1)
+    lightpath_engine.flush()
+    device.calc_lightpath_state = Mock(side_effect=RuntimeError)
+    device.insert.sim_put(1)
+    snapshot = lightpath_engine.flush()
+    assert lightpath_engine.timing['lp_counter_0'].errors == 1
+    assert not snapshot.states['lp_counter_0'].inserted
+
+
+def test_lightpath_engine_benchmark():
+    n_devices = 200
+    n_updates = 10
+    from .. import interface
+    interface._lightpath_devices.clear()
+    devices = lightpath_counters(n_devices)
+    results = {}
+    try:
+        for use_engine in (False, True):
+            # Long enough that only the explicit flush runs a batch
+            engine = set_lightpath_engine(5 if use_engine else None)
+            if engine is not None:
+                engine.flush()
+            for device in devices:
+                device.calls = 0
+            start = time.perf_counter()
+            for num in range(n_updates):
+                for device in devices:
+                    device.trans.sim_put(num / n_updates)
+            if engine is not None:
+                engine.flush()
+            elapsed = time.perf_counter() - start
+            results[use_engine] = (
+                sum(device.calls for device in devices), elapsed)
+    finally:
+        set_lightpath_engine(None)
+    logger.info('%d updates on %d devices: %d evaluations in %.3fs per '
+                'update, %d in %.3fs batched', n_updates * n_devices,
+                n_devices, *results[False], *results[True])
+    assert results[False][0] == n_updates * n_devices
+    assert results[True][0] == n_devices
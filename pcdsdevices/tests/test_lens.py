@@ -2,12 +2,16 @@ import logging
 import os
 import os.path
 import sys
+import time
 from unittest.mock import Mock
 
 import numpy as np
 import pytest
+import yaml
 from ophyd.sim import make_fake_device
+from pcdscalc import be_lens_calcs as calcs
 
+from ..interface import Presets
 from ..lens import XFLS, LensStack, LensStackBase, Prefocus, SimLensStack
 
 logger = logging.getLogger(__name__)
@@ -150,6 +154,122 @@ def test_lensstack_align(presets, monkeypatch, fake_lensstack):
     assert lens.z.position == 0
 
 
+def test_lensstack_beam_size_conversion(fake_lensstack):
+    logger.debug('test_lensstack_beam_size_conversion')
+    lens = fake_lensstack
+    z = np.linspace(-100, 100, 11)
+    sizes = lens.z_to_beam_size(z)
+    expected = [
+        calcs.calc_beam_fwhm(sample_E, sample_lens_set,
+                             distance=pos / 1000 * lens.z_dir + lens.z_offset,
+                             printsummary=False)
+        for pos in z
+    ]
+    np.testing.assert_allclose(sizes, expected, rtol=1e-12)
+    assert isinstance(lens.z_to_beam_size(z[0]), float)
+    assert lens.z_to_beam_size(z[0]) == pytest.approx(expected[0], rel=1e-12)
+
+    targets = [400e-6, 500e-6, 600e-6]
+    expected_z = [
+        (calcs.calc_distance_for_size(size, sample_lens_set, sample_E)[0]
+         - lens.z_offset) * lens.z_dir * 1000
+        for size in targets
+    ]
+    np.testing.assert_allclose(lens.beam_size_to_z(targets), expected_z,
+                               rtol=1e-12)
+    np.testing.assert_allclose(lens.z_to_beam_size(expected_z), targets,
+                               rtol=1e-9)
+
+
+def test_lensstack_inverse_cached(monkeypatch, fake_lensstack):
+    logger.debug('test_lensstack_inverse_cached')
+    lens = fake_lensstack
+    first = lens.inverse(lens.RealPosition(x=0, y=0, z=10)).beam_size
+
+    def no_calc(*args, **kwargs):
+        raise AssertionError('Lens optics were recomputed')
+
+    monkeypatch.setattr(calcs, 'calc_focal_length', no_calc)
+    assert lens.inverse(
+        lens.RealPosition(x=0, y=0, z=10)).beam_size == first
+    # A different lens set needs its own optics
+    lens.lens_set = [1, 200e-6]
+    with pytest.raises(AssertionError):
+        lens.inverse(lens.RealPosition(x=0, y=0, z=10))
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Fails on Windows, presets needed and not supported.",
+)
+def test_lensstack_alignment_cache(presets, monkeypatch, fake_lensstack):
+    logger.debug('test_lensstack_alignment_cache')
+    lens = fake_lensstack
+    for motor, one, two in ((lens.x, 1, 3), (lens.y, 2, 6), (lens.z, 0, 10)):
+        motor.presets.add_hutch(value=one, name='align_position_one')
+        motor.presets.add_hutch(value=two, name='align_position_two')
+    pos = lens.forward(lens.PseudoPosition(calib_z=5,
+                                           beam_size=lens.beam_size.position))
+    assert (pos.x, pos.y, pos.z) == (2, 4, 5)
+    line = lens.get_alignment_line()
+    x, y = line(np.array([0, 10]))
+    np.testing.assert_allclose(x, [1, 3])
+    np.testing.assert_allclose(y, [2, 6])
+
+    # Repeated moves do not read the preset positions again
+    def no_sync(self, *args, **kwargs):
+        raise AssertionError('Presets were synced')
+
+    with monkeypatch.context() as m:
+        m.setattr(Presets, 'sync', no_sync)
+        assert lens.get_alignment_line() is line
+        lens.forward(lens.PseudoPosition(calib_z=7,
+                                         beam_size=lens.beam_size.position))
+
+    # Changing a preset invalidates the line
+    lens.x.presets.positions.align_position_two.update_pos(5)
+    assert lens.get_alignment_line() is not line
+    pos = lens.forward(lens.PseudoPosition(calib_z=5,
+                                           beam_size=lens.beam_size.position))
+    assert pos.x == 3
+
+    # So does changing the preset file from another session
+    line = lens.get_alignment_line()
+    path = lens.y.presets._path('hutch')
+    data = yaml.safe_load(path.read_text())
+    data['align_position_two']['value'] = 10
+    time.sleep(0.01)
+    path.write_text(yaml.dump(data))
+    assert lens.get_alignment_line() is not line
+    pos = lens.forward(lens.PseudoPosition(calib_z=5,
+                                           beam_size=lens.beam_size.position))
+    assert pos.y == 6
+
+
+def test_lensstack_inverse_benchmark(fake_lensstack):
+    logger.debug('test_lensstack_inverse_benchmark')
+    lens = fake_lensstack
+    z = np.linspace(-100, 100, 200)
+    start = time.perf_counter()
+    for pos in z:
+        calcs.calc_beam_fwhm(sample_E, sample_lens_set,
+                             distance=pos / 1000 + lens.z_offset,
+                             printsummary=False)
+    uncached = time.perf_counter() - start
+    lens.z_to_beam_size(0)
+    start = time.perf_counter()
+    for pos in z:
+        lens.inverse(lens.RealPosition(x=0, y=0, z=pos))
+    cached = time.perf_counter() - start
+    start = time.perf_counter()
+    lens.z_to_beam_size(z)
+    array = time.perf_counter() - start
+    logger.info('%d z updates: calc_beam_fwhm %.4fs, inverse %.4fs, '
+                'array %.6fs', len(z), uncached, cached, array)
+    assert cached < uncached
+    assert array < uncached
+
+
 def test_move(fake_lensstack):
     logger.debug('test_move')
     lensstack = fake_lensstack
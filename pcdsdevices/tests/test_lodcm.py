@@ -4,11 +4,13 @@ from unittest.mock import Mock, patch
 import numpy as np
 import pytest
 from ophyd.sim import make_fake_device
+from pcdscalc import diffraction
 
 from ..epics_motor import OffsetMotor
 from ..lodcm import (CHI1, CHI2, H1N, H2N, LODCM, Y1, Y2, Dectris, Diode, Foil,
                      LODCMEnergyC, LODCMEnergySi, SimFirstTower, SimLODCM,
-                     SimSecondTower, YagLom)
+                     SimSecondTower, YagLom, calc_lom_energy,
+                     calc_lom_geometry)
 
 logger = logging.getLogger(__name__)
 
@@ -356,6 +358,29 @@ def test_get_reflection_tower1(fake_tower1):
                 tower1.get_reflection()
 
 
+def test_cached_crystal_state_tower1(fake_tower1):
+    tower1 = fake_tower1
+    assert tower1.get_reflection(use_cache=True) == (1, 1, 1)
+    assert tower1.get_material(use_cache=True) == 'C'
+    # Nothing changed, so nothing is checked again
+    with patch('pcdsdevices.lodcm.CrystalTower1.is_diamond') as is_diamond:
+        assert tower1.get_reflection(use_cache=True) == (1, 1, 1)
+        assert tower1.get_material(use_cache=True) == 'C'
+        is_diamond.assert_not_called()
+    # Reflection and state changes come in through the subscriptions
+    tower1.diamond_reflection.sim_put((2, 2, 0))
+    assert tower1.get_reflection(use_cache=True) == (2, 2, 0)
+    tower1.y1_state.move('Si')
+    tower1.chi1_state.move('Si')
+    assert tower1.get_material(use_cache=True) == 'Si'
+    assert tower1.get_reflection(use_cache=True) == (1, 1, 1)
+    tower1.chi1_state.move('C')
+    with pytest.raises(ValueError):
+        tower1.get_material(use_cache=True)
+    with pytest.raises(ValueError):
+        tower1.get_reflection(use_cache=True)
+
+
 def test_get_reflection_tower2(fake_tower2):
     tower2 = fake_tower2
     # defalts to (2, 2, 2), see fake_tower2 setup
@@ -446,6 +471,32 @@ def test_calc_geometry_si(fake_energy_si):
         assert np.isclose(z, 139.21560118646275)
 
 
+def test_calc_lom_geometry():
+    energies = np.linspace(6, 20, 15)
+    for material, reflection in (('Si', (1, 1, 1)), ('C', (2, 2, 0))):
+        th, z = calc_lom_geometry(energies, material, reflection)
+        for energy, th_i, z_i in zip(energies, th, z):
+            expected = diffraction.get_lom_geometry(
+                energy * 1e3, material, reflection
+            )
+            assert np.isclose(th_i, expected[0])
+            assert np.isclose(z_i, expected[1])
+        assert np.allclose(calc_lom_energy(th, material, reflection), energies)
+
+
+def test_forward_many_si(fake_energy_si):
+    energy = fake_energy_si
+    energies = [7, 8.5, 10, 12]
+    with patch("pcdsdevices.lodcm.LODCMEnergySi.get_reflection",
+               return_value=(1, 1, 1)) as get_reflection:
+        real = energy.forward_many(energies)
+        assert get_reflection.call_count == 1
+        for i, energy_i in enumerate(energies):
+            single = energy.forward(energy_i)
+            for axis, values in zip(real._fields, real):
+                assert np.isclose(values[i], getattr(single, axis))
+
+
 def test_get_energy_c(fake_energy_c):
     energy = fake_energy_c
     energy.th1C.user_offset.sim_put(-23)
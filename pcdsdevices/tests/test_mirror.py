@@ -1,13 +1,22 @@
+import logging
 import math
+import time
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 from ophyd.sim import ReadOnlyError, make_fake_device
 
 from pcdsdevices import mirror
 
-from ..mirror import (KBOMirror, OffsetMirror, PointingMirror,
-                      XOffsetMirrorStateCool, XOffsetMirrorXYState)
+from ..mirror import (KBOMirror, MirrorLogicError, OffsetMirror,
+                      PointingMirror, XOffsetMirror, XOffsetMirror2D4PState,
+                      XOffsetMirrorBend, XOffsetMirrorNoBend,
+                      XOffsetMirrorRTDs, XOffsetMirrorState,
+                      XOffsetMirrorStateCool, XOffsetMirrorStateCoolNoBend,
+                      XOffsetMirrorSwitch, XOffsetMirrorXYState, _RangeTable)
+
+logger = logging.getLogger(__name__)
 
 
 @pytest.fixture(scope='function')
@@ -216,3 +225,131 @@ def test_xy_mirror_lightpath(fake_xy_offset_mirror, monkeypatch):
     xym.get_lightpath_state(use_cache=False)
     assert mock_schedule.call_count == 2
     assert xym._retry_lightpath is False
+
+
+def test_range_table():
+    rng = np.random.default_rng(0)
+    values = np.concatenate([np.arange(-7, 7, 0.5),
+                             [np.nan, np.inf, -np.inf, 1e300, -1e300]])
+    # Endpoints include open ends
+    endpoints = np.concatenate([np.arange(-5, 5), [-np.inf, np.inf]])
+    for _ in range(200):
+        ranges = rng.choice(endpoints, (rng.integers(1, 5), 2)).tolist()
+        table = _RangeTable(ranges)
+        many = table.matches_many(values)
+        indices = table.index_many(values)
+        for value, hits, index in zip(values, many, indices):
+            expected = [low < value < high for low, high in ranges]
+            assert list(table.matches(value)) == expected == list(hits)
+            if sum(expected) == 1:
+                assert table.index(value) == index == expected.index(True)
+            else:
+                # -1 for no match, -2 for several
+                missing = -1 if sum(expected) == 0 else -2
+                assert table.index(value) == index == missing
+    table = _RangeTable([[0, np.inf], [-np.inf, 0]])
+    assert table.matches(5.0) == (True, False)
+    assert table.matches(-5.0) == (False, True)
+    assert table.matches(0.0) == (False, False)
+    assert list(table.index_many([5.0, -5.0, 0.0])) == [0, 1, -1]
+    for bad in ([1, 2], [[1, 2], [3]], [[1, 2, 3]]):
+        with pytest.raises(MirrorLogicError):
+            _RangeTable(bad)
+
+
+def test_xoffset_mirror_bad_ranges():
+    mirror = make_fake_device(XOffsetMirror)(
+        'TST:MR1', name='bad_ranges', input_branches=['L0'],
+        output_branches=['L0', 'L1'], x_ranges=[[0, 1]],
+    )
+    state = mirror.calc_lightpath_state(x_up=0.5, y_up=0, pitch=0)
+    assert not state.inserted and not state.removed
+    # Ranges can be fixed after the fact
+    mirror.x_ranges = [[-1, 1], [1, 3]]
+    assert mirror.calc_lightpath_state(x_up=0.5, y_up=0, pitch=0).removed
+
+
+def test_xoffset_mirror_ranges_edited_in_place():
+    mirror = make_fake_device(XOffsetMirror)(
+        'TST:MR1', name='edited_ranges', input_branches=['L0'],
+        output_branches=['L0', 'L1', 'L2'], x_ranges=[[-1, 1], [1, 3]],
+        y_ranges=[[0, 10]], pitch_ranges=[[[0, 1], [1, 2]]],
+    )
+    # Edits made in place are picked up the next time the ranges are used
+    assert mirror._get_insertion_state(2) == (False, True)
+    mirror.x_ranges[1][0] = 5
+    assert mirror._get_insertion_state(2) == (False, False)
+    with pytest.raises(MirrorLogicError):
+        mirror._get_coating_index(15)
+    mirror.y_ranges.append([10, 20])
+    assert mirror._get_coating_index(15) == 2
+    with pytest.raises(MirrorLogicError):
+        mirror._get_output_branch(0, 2.5)
+    mirror.pitch_ranges[0][1][1] = 3
+    assert mirror._get_output_branch(0, 2.5) == 'L2'
+
+
+xoffset_variants = [
+    XOffsetMirror, XOffsetMirrorRTDs, XOffsetMirrorNoBend, XOffsetMirrorBend,
+    XOffsetMirrorSwitch, XOffsetMirrorState, XOffsetMirrorStateCool,
+    XOffsetMirror2D4PState, XOffsetMirrorStateCoolNoBend,
+    XOffsetMirrorXYState,
+]
+
+
+def make_ranged_mirror(cls):
+    mirror = make_fake_device(cls)(
+        'TST:MR1', name=f'ranged_{cls.__name__.lower()}',
+        input_branches=['L0'], output_branches=['L0', 'L1', 'L2'],
+        x_ranges=[[-20, -5], [-5, 20]],
+        y_ranges=[[-10, 0], [-1, 10]],
+        # y-ranges give coating indices from 1, coating states from 0
+        pitch_ranges=[[[0, 100], [100, 200]], [[0, 150], [150, 200]],
+                      [[0, 50], [50, 200]]],
+    )
+    if cls is XOffsetMirrorXYState:
+        mirror.insertion.state.sim_set_enum_strs(['Unknown', 'OUT', 'IN'])
+        mirror.insertion.state.sim_put(1)
+    return mirror
+
+
+def make_samples(cls, count, seed=0):
+    rng = np.random.default_rng(seed)
+    if cls is XOffsetMirrorXYState:
+        x = rng.integers(0, 3, count)
+    else:
+        x = rng.uniform(-25, 25, count)
+    if issubclass(cls, XOffsetMirrorState):
+        # Coating state, including unknown
+        y = rng.integers(0, 4, count)
+    else:
+        y = rng.uniform(-12, 12, count)
+    pitch = rng.uniform(-20, 220, count)
+    if cls is XOffsetMirrorSwitch:
+        return x, pitch
+    return x, y, pitch
+
+
+@pytest.mark.parametrize('cls', xoffset_variants,
+                         ids=[cls.__name__ for cls in xoffset_variants])
+def test_xoffset_mirror_classify_benchmark(cls):
+    mirror = make_ranged_mirror(cls)
+    count = 2000
+    samples = make_samples(cls, count)
+    start = time.perf_counter()
+    states = [mirror.calc_lightpath_state(*sample)
+              for sample in zip(*(values.tolist() for values in samples))]
+    scalar = time.perf_counter() - start
+    start = time.perf_counter()
+    batch = mirror.classify_positions(*samples)
+    vectorised = time.perf_counter() - start
+    logger.info('%s: %d samples, %.1f us per sample one at a time, '
+                '%.3f us per sample in a batch', cls.__name__, count,
+                scalar / count * 1e6, vectorised / count * 1e6)
+    for num, state in enumerate(states):
+        (branch, transmission), = state.output.items()
+        assert batch['inserted'][num] == state.inserted
+        assert batch['removed'][num] == state.removed
+        assert batch['branch'][num] == branch
+        assert batch['transmission'][num] == transmission
+    assert vectorised < scalar
@@ -161,6 +161,76 @@ def test_sync_axis_class_checks():
     BadSync.fix_sync_keep_still = None
 
 
+class SyncAxisSix(SyncAxis):
+    one = Cpt(FastMotor)
+    two = Cpt(FastMotor)
+    three = Cpt(FastMotor)
+    four = Cpt(FastMotor)
+    five = Cpt(FastMotor)
+    six = Cpt(FastMotor)
+
+    offsets = {'two': 1, 'four': -2, 'six': 0.5}
+    scales = {'three': 2, 'five': -0.5, 'six': 3}
+
+
+def test_sync_axis_many():
+    logger.debug('test_sync_axis_many')
+    sync = SyncAxisCrazy('CRAZY', name='sync_crazy')
+    trajectory = sync.forward_many([0, 5, -1])
+    np.testing.assert_allclose(trajectory, [[0, 0, 3],
+                                            [5, -10, 18],
+                                            [-1, 2, 0]])
+    for pos, row in zip([0, 5, -1], trajectory):
+        np.testing.assert_allclose(row, sync.forward(pos))
+    np.testing.assert_allclose(sync.inverse_many(trajectory),
+                               [[0] * 3, [5] * 3, [-1] * 3])
+    sync.move(5)
+    assert sync.is_synced()
+    # Just inside and just outside of the deadband
+    assert sync.is_synced(sync.RealPosition(5, -10, 18 + 0.0009 * 3))
+    assert not sync.is_synced(sync.RealPosition(5, -10 - 0.0011 * 2, 18))
+
+
+def test_sync_axis_changed_settings():
+    logger.debug('test_sync_axis_changed_settings')
+    sync = SyncAxisCrazy('CRAZY', name='sync_crazy')
+    sync.move(5)
+    sync.offsets['two'] = 1
+    sync.scales['three'] = 2
+    real = sync.forward(sync.PseudoPosition(sync=4))
+    assert tuple(real) == (4, -7, 11)
+    assert sync.forward_single('two', 4) == -7
+    assert sync.inverse_single('three', 11) == 4
+    assert sync.inverse(real).sync == 4
+    np.testing.assert_allclose(sync.forward_many([4]), [real])
+    assert sync.is_synced(real)
+
+
+def test_sync_axis_benchmark():
+    logger.debug('test_sync_axis_benchmark')
+    sync = SyncAxisSix('SIX', name='sync_six')
+    positions = np.linspace(-10, 10, 10_000)
+
+    start = time.perf_counter()
+    trajectory = sync.forward_many(positions)
+    many_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for pos in positions[:1000]:
+        sync.forward(pos)
+    single_time = (time.perf_counter() - start) * 10
+
+    start = time.perf_counter()
+    for row in trajectory[:1000]:
+        assert sync.is_synced(sync.RealPosition(*row))
+    synced_time = time.perf_counter() - start
+    logger.info('6-motor SyncAxis, 10000 sync positions: forward_many '
+                '%.4f s, forward ~%.4f s; 1000 is_synced %.4f s',
+                many_time, single_time, synced_time)
+    np.testing.assert_allclose(trajectory[1234], sync.forward(positions[1234]))
+    assert many_time < single_time
+
+
 def test_delay_basic():
     logger.debug('test_delay_basic')
     stage_s = SimDelayStage('prefix', name='name', egu='s', n_bounces=2)
@@ -245,6 +315,120 @@ def test_lut_positioner(real_sign: bool, pseudo_sign: bool):
     assert lut.pseudo.limits == tuple(sorted([40 * ps, 400 * ps]))
 
 
+class LimitSettableSoftPositioner(SoftPositioner):
+    @property
+    def limits(self):
+        return self._limits
+
+    @limits.setter
+    def limits(self, value):
+        self._limits = tuple(value)
+
+
+class LUTMultiPositioner(LookupTablePositioner):
+    pseudo = Cpt(PseudoSingleInterface)
+    gap = Cpt(LimitSettableSoftPositioner)
+    taper = Cpt(LimitSettableSoftPositioner)
+
+
+def test_lut_positioner_multi_axis():
+    logger.debug('test_lut_positioner_multi_axis')
+    pseudo = np.linspace(0, 10, 11)
+    # taper is not monotonic, so gap is used for the inverse
+    table = np.column_stack([pseudo, 100 - pseudo ** 2, np.cos(pseudo)])
+    lut = LUTMultiPositioner('', table=table,
+                             column_names=['pseudo', 'gap', 'taper'],
+                             name='lut')
+    real = lut.forward(2.5)
+    np.testing.assert_allclose(real.gap, np.interp(2.5, pseudo, 100 - pseudo ** 2))
+    np.testing.assert_allclose(real.taper, np.interp(2.5, pseudo, np.cos(pseudo)))
+    np.testing.assert_allclose(lut.inverse(real).pseudo, 2.5, rtol=0.05)
+    np.testing.assert_allclose(lut.inverse(gap=91, taper=0).pseudo, 3)
+
+    positions = np.linspace(-1, 11, 49)
+    many = lut.forward_many(positions)
+    assert many.shape == (49, 2)
+    for pos, row in zip(positions, many):
+        np.testing.assert_allclose(row, lut.forward(pos))
+    np.testing.assert_allclose(lut.inverse_many(many),
+                               [lut.inverse(*row).pseudo for row in many])
+    np.testing.assert_allclose(lut.inverse_many(many[:, 0]),
+                               lut.inverse_many(many))
+
+    # Swapping the table out takes effect right away
+    lut.table = table * [1, 2, 1]
+    np.testing.assert_allclose(lut.forward(3).gap, 2 * 91)
+    assert lut.gap.limits == (2 * 0, 2 * 100)
+    with pytest.raises(ValueError):
+        lut.set_table(table[:, :2])
+
+
+@pytest.mark.parametrize('interpolation', ['pchip', 'spline'])
+def test_lut_positioner_interpolation(interpolation: str):
+    logger.debug('test_lut_positioner_interpolation')
+    energy = np.linspace(1, 10, 10)
+    gap = np.sqrt(energy)
+    lut = LUTMultiPositioner(
+        '', table=np.column_stack([energy, gap, gap]),
+        column_names=['pseudo', 'gap', 'taper'], name='lut',
+        interpolation=interpolation,
+    )
+    # Much closer to the real curve than linear interpolation
+    energies = np.linspace(1, 10, 91)
+    real = lut.forward_many(energies)
+    linear = np.interp(energies, energy, gap)
+    assert (np.abs(real[:, 0] - np.sqrt(energies)).max()
+            < np.abs(linear - np.sqrt(energies)).max() / 2)
+    inverse = lut.inverse_many(np.sqrt(energies))
+    linear = np.interp(np.sqrt(energies), gap, energy)
+    assert (np.abs(inverse - energies).max()
+            < np.abs(linear - energies).max() / 2)
+    np.testing.assert_allclose(lut.inverse_many(gap), energy)
+    # Clamped to the table, like np.interp
+    np.testing.assert_allclose(lut.forward(20).gap, np.sqrt(10))
+
+    with pytest.raises(ValueError):
+        LUTMultiPositioner(
+            '', table=np.column_stack([energy, np.cos(energy), np.cos(energy)]),
+            column_names=['pseudo', 'gap', 'taper'], name='lut',
+            interpolation=interpolation,
+        )
+
+
+def test_lut_positioner_benchmark():
+    logger.debug('test_lut_positioner_benchmark')
+    rows = 50_000
+    energy = np.linspace(1000, 25000, rows)[::-1]
+    table = np.column_stack([energy, np.sqrt(energy), np.sqrt(energy)])
+    lut = LUTMultiPositioner('', table=table,
+                             column_names=['pseudo', 'gap', 'taper'],
+                             name='lut')
+
+    start = time.perf_counter()
+    for pos in np.linspace(2000, 20000, 1000):
+        lut.inverse(lut.forward(pos))
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    lut.inverse_many(lut.forward_many(np.linspace(2000, 20000, 1000)))
+    many_time = time.perf_counter() - start
+
+    # What each conversion used to cost before interpolating
+    start = time.perf_counter()
+    for _ in range(2000):
+        xp = table[:, 0]
+        if not is_strictly_increasing(xp):
+            xp = xp[::-1]
+            is_strictly_increasing(xp)
+    check_time = time.perf_counter() - start
+    logger.info(
+        '%d-row table, 1000 round trips: one at a time %.4f s, batched '
+        '%.4f s (per-conversion monotonic checks alone: %.4f s)',
+        rows, single_time, many_time, check_time,
+    )
+    assert many_time < single_time
+
+
 @pytest.mark.parametrize(
     "input,expected",
     (
@@ -0,0 +1,133 @@
+import logging
+import threading
+import time
+
+import pytest
+from ophyd.device import Component as Cpt
+from ophyd.device import Device
+from ophyd.signal import Signal
+
+from ..registry import connection_table, warm_up_connections
+
+logger = logging.getLogger(__name__)
+
+
+class StandInIOC:
+    """
+    Serve PVs from a background thread, in batches over ``duration``.
+
+    This stands in for a soft IOC: the signals below report themselves
+    connected once their PV has been served.
+    """
+
+    def __init__(self):
+        self.served = set()
+
+    def serve(self, pvnames, duration=0.2, batches=20):
+        pvnames = list(pvnames)
+        size = max(len(pvnames) // batches, 1)
+
+        def run():
+            for index in range(0, len(pvnames), size):
+                self.served.update(pvnames[index:index + size])
+                time.sleep(duration / batches)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+
+ioc = StandInIOC()
+
+
+class StandInSignal(Signal):
+    def __init__(self, pvname, **kwargs):
+        super().__init__(**kwargs)
+        self.pvname = pvname
+
+    @property
+    def connected(self):
+        return self.pvname in ioc.served
+
+
+# Ten PVs per device, plus one lazy signal
+StandInDevice = type(
+    'StandInDevice', (Device,),
+    {**{f'sig{num}': Cpt(StandInSignal, f':SIG{num}') for num in range(10)},
+     'lazy_sig': Cpt(StandInSignal, ':LAZY', lazy=True)},
+)
+
+
+@pytest.fixture(scope='function')
+def stand_in_ioc():
+    ioc.served.clear()
+    yield ioc
+    ioc.served.clear()
+
+
+def make_devices(count, prefix='TST:WARM'):
+    return [StandInDevice(f'{prefix}:{num}', name=f'warm_{num}')
+            for num in range(count)]
+
+
+def test_warm_up_connections(stand_in_ioc):
+    devices = make_devices(3)
+    pvnames = [f'TST:WARM:{num}:SIG{sig}' for num in range(3)
+               for sig in range(10)]
+    stand_in_ioc.serve(pv for pv in pvnames if pv != 'TST:WARM:2:SIG5')
+    statuses = warm_up_connections(devices, timeout=0.5)
+    assert [status.name for status in statuses] == ['warm_0', 'warm_1',
+                                                    'warm_2']
+    assert all(status.pvs == 10 for status in statuses)
+    assert statuses[0].connected == 10
+    assert statuses[0].elapsed is not None
+    assert statuses[0].missing == []
+    assert statuses[2].connected == 9
+    assert statuses[2].elapsed is None
+    assert statuses[2].missing == ['TST:WARM:2:SIG5']
+    # Lazy signals are left alone unless requested
+    assert 'lazy_sig' not in devices[0]._signals
+    table = connection_table(statuses)
+    assert table.rows[0][0] == 'warm_2'
+    assert 'TST:WARM:2:SIG5' in table.get_string()
+
+
+def test_warm_up_include_lazy(stand_in_ioc):
+    device, = make_devices(1)
+    stand_in_ioc.served.update(f'TST:WARM:0:SIG{sig}' for sig in range(10))
+    status, = warm_up_connections([device], timeout=0.1, include_lazy=True)
+    assert 'lazy_sig' in device._signals
+    assert status.pvs == 11
+    assert status.missing == ['TST:WARM:0:LAZY']
+
+
+def test_warm_up_registry(stand_in_ioc):
+    devices = make_devices(2, prefix='TST:REG')
+    stand_in_ioc.served.update(f'TST:REG:{num}:SIG{sig}' for num in range(2)
+                               for sig in range(10))
+    statuses = {status.name: status
+                for status in warm_up_connections(timeout=0.1)}
+    for device in devices:
+        assert statuses[device.name].connected == 10
+    # Only top-level objects get their own row
+    assert devices[0].sig0.name not in statuses
+
+
+@pytest.mark.timeout(60)
+def test_warm_up_benchmark(stand_in_ioc):
+    count = 1000
+    start = time.perf_counter()
+    devices = make_devices(count)
+    created = time.perf_counter() - start
+    pvnames = [f'TST:WARM:{num}:SIG{sig}' for num in range(count)
+               for sig in range(10)]
+    start = time.perf_counter()
+    stand_in_ioc.serve(pvnames, duration=0.5)
+    statuses = warm_up_connections(devices, timeout=10)
+    elapsed = time.perf_counter() - start
+    logger.info('Created %d devices in %.2fs, connected %d PVs in %.2fs',
+                count, created, len(pvnames), elapsed)
+    assert sum(status.connected for status in statuses) == len(pvnames)
+    assert max(status.elapsed for status in statuses) < 10
+    # Waiting adds little on top of the stand-in IOC's serving time
+    assert elapsed < 5
@@ -4,6 +4,7 @@ import time
 from typing import Any
 from unittest.mock import MagicMock, Mock
 
+import numpy as np
 import pytest
 from ophyd import Component as Cpt
 from ophyd import Device
@@ -14,7 +15,8 @@ from ophyd.status import Status
 from .. import signal as signal_module
 from ..signal import (AggregateSignal, AvgSignal, MultiDerivedSignal,
                       MultiDerivedSignalRO, PytmcSignal, ReadOnlyError,
-                      SignalEditMD, UnitConversionDerivedSignal)
+                      RollingStatsSignal, SignalEditMD, SummarySignal,
+                      UnitConversionDerivedSignal)
 from ..type_hints import OphydDataType, SignalToValue
 
 logger = logging.getLogger(__name__)
@@ -88,6 +90,99 @@ def test_avg_signal_with_duration():
     st.wait()
 
 
+def test_rolling_stats_signal():
+    logger.debug('test_rolling_stats_signal')
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=500)
+    data[3::7] = np.nan
+    sig = Signal(name='raw')
+    stats = {
+        stat: RollingStatsSignal(sig, 50, stat=stat, name=stat)
+        for stat in RollingStatsSignal.stats
+    }
+    for i, value in enumerate(data):
+        sig.put(value)
+        window = data[max(0, i - 49):i + 1]
+        assert stats['mean'].get() == pytest.approx(np.nanmean(window))
+        assert stats['std'].get() == pytest.approx(np.nanstd(window))
+        assert stats['min'].get() == np.nanmin(window)
+        assert stats['max'].get() == np.nanmax(window)
+        assert stats['count'].get() == np.count_nonzero(~np.isnan(window))
+    assert stats['mean'].std == stats['std'].get()
+
+    with pytest.raises(ValueError):
+        RollingStatsSignal(sig, 50, stat='median', name='bad')
+
+
+def test_rolling_stats_drift():
+    logger.debug('test_rolling_stats_drift')
+    sig = Signal(name='raw')
+    avg = AvgSignal(sig, 10, name='avg')
+    for value in np.linspace(1e8, 2e8, 10000):
+        sig.put(value + 0.1)
+    assert avg.get() == pytest.approx(np.mean(avg.values), rel=1e-12)
+    avg._stats.renormalize()
+    assert avg.get() == pytest.approx(avg.mean, rel=1e-12)
+
+
+def test_rolling_stats_large_offset():
+    logger.debug('test_rolling_stats_large_offset')
+    rng = np.random.default_rng(0)
+    data = 1e8 + rng.normal(scale=1e-3, size=1000)
+    sig = Signal(name='raw')
+    std = RollingStatsSignal(sig, 100, stat='std', name='std')
+    for value in data:
+        sig.put(value)
+    assert std.get() == pytest.approx(np.std(data[-100:]), rel=1e-3)
+
+
+def test_avg_signal_decimation():
+    logger.debug('test_avg_signal_decimation')
+    sig = Signal(name='raw')
+    avg = AvgSignal(sig, 10, decimation=3, name='avg')
+    cb = Mock()
+    avg.subscribe(cb, run=False)
+    for value in range(9):
+        sig.put(value)
+    assert cb.call_count == 3
+    assert avg.get() == 4
+    assert avg.count == 9
+
+
+@pytest.mark.parametrize('rate', [120, 1000])
+def test_avg_signal_benchmark(rate):
+    logger.debug('test_avg_signal_benchmark')
+    window = 10000
+    sig = Signal(name='raw')
+    avg = AvgSignal(sig, window, name='avg')
+    data = np.random.default_rng(0).normal(size=window + rate)
+    for value in data[:window]:
+        sig.put(value)
+
+    # One second worth of events at the given rate
+    start = time.perf_counter()
+    for value in data[window:]:
+        sig.put(value)
+    elapsed = time.perf_counter() - start
+
+    # Compare with a full np.nanmean on every update
+    buffer = data[:window].copy()
+    start = time.perf_counter()
+    for i, value in enumerate(data[window:]):
+        buffer[i % window] = value
+        np.nanmean(buffer)
+    elapsed_nanmean = time.perf_counter() - start
+
+    logger.info(
+        '%d Hz with %d sample window: %.1f us per update '
+        '(np.nanmean: %.1f us per update)',
+        rate, window, elapsed / rate * 1e6, elapsed_nanmean / rate * 1e6,
+    )
+    assert avg.get() == pytest.approx(np.mean(data[-window:]))
+    # Must keep up with the event rate with plenty of headroom
+    assert elapsed < 0.1
+
+
 class MockCallbackHelper:
     """
     Simple helper for getting a callback, setting an event, and checking args.
@@ -564,6 +659,127 @@ def test_aggregate_signal_bad_instantiation_attrs():
         sig.add_signal_by_attr_name("attr")
 
 
+def test_aggregate_signal_coalesce():
+    class SumDevice(Device):
+        cpt = Cpt(
+            MultiDerivedSignalRO,
+            attrs=["a", "b", "c"],
+            calculate_on_get=lambda mds, items: sum(items.values()),
+            coalesce_window=0.1,
+        )
+        a = Cpt(FakeEpicsSignal, "a")
+        b = Cpt(FakeEpicsSignal, "b")
+        c = Cpt(FakeEpicsSignal, "c")
+
+    dev = SumDevice(name="dev")
+    for sig in (dev.a, dev.b, dev.c):
+        sig.sim_put(0)
+
+    calc = Mock(wraps=dev.cpt.calculate_on_get)
+    dev.cpt.calculate_on_get = calc
+    values = []
+    dev.cpt.subscribe(lambda value, **kwargs: values.append(value), run=False)
+    dev.cpt.wait_for_connection()
+    # Connecting gives one calculation and one event
+    assert values == [0]
+    # Let any recalculation queued during the connection finish
+    time.sleep(0.3)
+    calc.reset_mock()
+    dev.cpt.recalculations = 0
+    dev.cpt.coalesced_updates = 0
+
+    for i in range(1, 11):
+        for sig in (dev.a, dev.b, dev.c):
+            sig.sim_put(i)
+
+    for _ in range(20):
+        if values[-1] == 30:
+            break
+        time.sleep(0.1)
+    assert values == [0, 30]
+    assert calc.call_count == 1
+    assert dev.cpt.recalculations == 1
+    assert dev.cpt.coalesced_updates == 29
+
+
+class FullSummarySignal(SummarySignal):
+    """SummarySignal that always recalculates from every cached value."""
+    _update_readback_incremental = AggregateSignal._update_readback_incremental
+
+
+def summary_device(cls, n_signals):
+    attrs = {f"sig{i}": Cpt(FakeEpicsSignal, f"SIG{i}") for i in range(n_signals)}
+    attrs["summary"] = Cpt(cls, name="summary")
+    dev = type("SummaryDevice", (Device,), attrs)(name="dev")
+    signals = [getattr(dev, f"sig{i}") for i in range(n_signals)]
+    for i, sig in enumerate(signals):
+        sig.sim_put(i)
+        dev.summary.add_signal_by_attr_name(sig.attr_name)
+    return dev, signals
+
+
+def test_aggregate_signal_incremental():
+    dev, signals = summary_device(SummarySignal, 20)
+    values = []
+    dev.summary.subscribe(lambda value, **kwargs: values.append(value), run=False)
+    dev.summary.wait_for_connection()
+    initial = dev.summary.get()
+
+    for i, sig in enumerate(signals):
+        sig.sim_put(i * 10 + 1)
+        # The running hash matches the one calculated from scratch
+        assert values[-1] == dev.summary._readback
+        assert dev.summary._readback == dev.summary._calc_readback()
+    assert len(set(values)) == len(values)
+    # Back to the start gives back the original hash
+    for i, sig in enumerate(signals):
+        sig.sim_put(i)
+    assert dev.summary._readback == initial
+    assert dev.summary.get() == initial
+
+
+def test_aggregate_signal_cached_values():
+    dev, signals = summary_device(SummarySignal, 5)
+    counts = [Mock(wraps=sig.get) for sig in signals]
+    for sig, count in zip(signals, counts):
+        sig.get = count
+    # Nothing is cached before the first subscription
+    values = dev.summary.get_cached_values()
+    assert list(values.values()) == [0, 1, 2, 3, 4]
+    assert all(count.call_count == 1 for count in counts)
+
+    dev.summary.subscribe(lambda **kwargs: None, run=False)
+    signals[2].sim_put(20)
+    values = dev.summary.get_cached_values()
+    assert values[signals[2]] == 20
+    assert all(count.call_count == 1 for count in counts)
+    # Refreshing reads every signal again
+    dev.summary.get_cached_values(refresh=True)
+    assert all(count.call_count == 2 for count in counts)
+
+
+def test_aggregate_signal_incremental_benchmark():
+    n_signals = 200
+    n_updates = 2000
+    timings = {}
+    for cls in (SummarySignal, FullSummarySignal):
+        dev, signals = summary_device(cls, n_signals)
+        dev.summary.subscribe(lambda **kwargs: None, run=False)
+        dev.summary.wait_for_connection()
+        start = time.perf_counter()
+        for i in range(n_updates):
+            signals[i % n_signals].sim_put(i)
+        timings[cls.__name__] = time.perf_counter() - start
+        readback = dev.summary._readback
+        assert dev.summary.get() == readback
+    logger.info(
+        "%d updates over %d signals: incremental %.3fs, full %.3fs",
+        n_updates, n_signals,
+        timings["SummarySignal"], timings["FullSummarySignal"],
+    )
+    assert timings["SummarySignal"] < timings["FullSummarySignal"]
+
+
 @pytest.fixture(
     params=["rw", "ro"]
 )
@@ -1,5 +1,6 @@
 import logging
 import threading
+import time
 from unittest.mock import Mock
 
 import pytest
@@ -9,9 +10,12 @@ from ophyd.signal import Signal
 from ophyd.sim import make_fake_device
 
 from ..device import UpdateComponent as UpCpt
+from ..inout import InOutRecordPositioner
+from ..registry import _create_lazy
 from ..state import (TWINCAT_MAX_STATES, PVStatePositioner, StatePositioner,
                      StateRecordPositioner, StateStatus,
-                     TwinCATStatePositioner, state_config_dotted_names)
+                     TwinCATStatePositioner, _build_states_enum,
+                     state_config_dotted_names)
 
 logger = logging.getLogger(__name__)
 
@@ -105,6 +109,47 @@ def test_pvstate_positioner_logic():
     lim_obj.destroy()
 
 
+def test_pvstate_positioner_incremental():
+    """The incremental 'ALL' mode logic matches the full calculation."""
+    n_signals = 200
+    attrs = {
+        f'lim{i}': Cpt(PrefixSignal, f'lim{i}', value=1)
+        for i in range(n_signals)
+    }
+    attrs['_state_logic'] = {
+        f'lim{i}': {0: 'in' if i % 2 else 'out', 1: 'defer'}
+        for i in range(n_signals)
+    }
+    attrs['_states_alias'] = {'in': 'IN', 'out': 'OUT'}
+    ManyLimCls = type('ManyLimCls', (PVStatePositioner,), attrs)
+    obj = ManyLimCls('BASE', name='many')
+    obj.state.subscribe(lambda **kwargs: None, run=False)
+    obj.state.wait_for_connection()
+    assert obj.position == 'Unknown'
+
+    sigs = [getattr(obj, f'lim{i}') for i in range(n_signals)]
+    # One "in" signal moves in
+    sigs[1].put(0)
+    assert obj.position == 'IN'
+    # More "in" signals agree
+    for sig in sigs[3::2]:
+        sig.put(0)
+    assert obj.position == 'IN'
+    # One "out" signal conflicts
+    sigs[0].put(0)
+    assert obj.position == 'Unknown'
+    # Then moves away again
+    sigs[0].put(1)
+    assert obj.position == 'IN'
+    # Unmapped values are unknown
+    sigs[10].put(5)
+    assert obj.position == 'Unknown'
+    sigs[10].put(1)
+    assert obj.position == 'IN'
+    assert obj.state._readback == obj.state._calc_readback()
+    obj.destroy()
+
+
 def test_pvstate_positioner_describe():
     logger.debug('test_pvstate_positioner_describe')
     lim_obj = LimCls('BASE', name='test')
@@ -377,3 +422,101 @@ def test_twincat_state_config_dynamic():
         fake_states_2d.config.m1_state03
 
     all_states.destroy()
+
+
+class SharedStates(TwinCATStatePositioner):
+    config = UpCpt(state_count=2)
+
+
+class SharedStates2D(TwinCATStatePositioner):
+    config = UpCpt(state_count=2, motor_count=2)
+
+
+FakeSharedStates = make_fake_device(SharedStates)
+FakeSharedStates2D = make_fake_device(SharedStates2D)
+
+
+def test_twincat_state_config_registry():
+    logger.debug('test_twincat_state_config_registry')
+    one = FakeSharedStates('SHARED:1', name='one')
+    two = FakeSharedStates('SHARED:2', name='two')
+    both = FakeSharedStates2D('SHARED:2D', name='both')
+    config_cls = type(one.config)
+    assert type(two.config) is config_cls
+    # The motor count is part of the registry key
+    assert type(both.config) is not config_cls
+    assert config_cls._state_config_registry[(2, 1)] is config_cls
+    assert config_cls._state_config_registry[(2, 2)] is type(both.config)
+
+
+def test_states_enum_shared():
+    logger.debug('test_states_enum_shared')
+    one = LimCls('ENUM:1', name='one')
+    two = LimCls('ENUM:2', name='two')
+    assert one._create_states_enum() is two._create_states_enum()
+    two._states_alias = {'in': 'IN'}
+    assert one._create_states_enum() is not two._create_states_enum()
+    assert two._create_states_enum().IN.name == 'in'
+
+
+class AliasRecordPositioner(InOutRecordPositioner):
+    _states_alias = {'IN': 'I', 'OUT': ['O', 'OUT']}
+
+
+def test_states_enum_cache_bounded():
+    logger.debug('test_states_enum_cache_bounded')
+    FakeAlias = make_fake_device(AliasRecordPositioner)
+    _build_states_enum.cache_clear()
+    enums = set()
+    for num in range(5):
+        states = FakeAlias(f'ALIAS:{num}', name=f'alias_{num}')
+        states.state.sim_set_enum_strs(('Unknown', 'IN', 'OUT'))
+        states.state.sim_put(1)
+        assert states.get_state(1).name == 'IN'
+        enums.add(states.states_enum)
+    # The class aliases are left alone and every instance shares one enum
+    assert AliasRecordPositioner._states_alias == {
+        'IN': 'I', 'OUT': ['O', 'OUT']
+    }
+    assert len(enums) == 1
+    assert _build_states_enum.cache_info().misses <= 2
+
+
+def test_twincat_state_config_lazy():
+    logger.debug('test_twincat_state_config_lazy')
+    states = FakeSharedStates('LAZY:STATES', name='states')
+    assert 'state_velo' not in states._signals
+    assert 'state01' not in states.config._signals
+    state01 = states.config.state01
+    assert 'setpoint' not in state01._signals
+    state01.setpoint.sim_put(1.5)
+    assert state01.setpoint.get() == 1.5
+    # Deferred components are created when walked with include_lazy
+    names = [item.dotted_name
+             for item in states.walk_signals(include_lazy=True)]
+    assert 'config.state02.velo' in names
+    assert 'state_velo' in names
+
+
+@pytest.mark.timeout(120)
+def test_twincat_state_startup_benchmark():
+    count = 500
+    FakeStates = make_fake_device(TwinCATStatePositioner)
+    start = time.perf_counter()
+    devices = [FakeStates(f'BENCH:{num}', name=f'bench_{num}')
+               for num in range(count)]
+    elapsed = time.perf_counter() - start
+    initial = sum(len(list(device.walk_signals())) for device in devices)
+    # What an eager device tree would have built up front
+    start = time.perf_counter()
+    for device in devices:
+        _create_lazy(device)
+    rest = time.perf_counter() - start
+    total = sum(len(list(device.walk_signals())) for device in devices)
+    # A connected state enum also creates every state name
+    connected = initial + count * TWINCAT_MAX_STATES
+    logger.info('Created %d TwinCAT state positioners in %.2fs with %d of '
+                '%d signals (%d once connected), %.2fs to create the rest',
+                count, elapsed, initial, total, connected, rest)
+    assert len({type(device.config) for device in devices}) == 1
+    assert connected < total / 2
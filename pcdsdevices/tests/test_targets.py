@@ -1,12 +1,18 @@
+import logging
+import time
+
 import numpy as np
 import pytest
 import yaml
 from ophyd.sim import make_fake_device
 
 from ..sim import FastMotor
-from ..targets import (XYGridStage, convert_to_physical, get_unit_meshgrid,
+from ..targets import (SampleStore, XYGridStage, convert_to_logical,
+                       convert_to_physical, get_unit_meshgrid,
                        mesh_interpolation, snake_grid_list)
 
+logger = logging.getLogger(__name__)
+
 
 @pytest.fixture(scope='function')
 def sample_file(tmp_path):
@@ -473,3 +479,186 @@ def test_set_status(fake_grid_stage, sample_file):
 
     with pytest.raises(IndexError):
         stage.set_status(1, 5, False, 'test_sample')
+
+
+def test_sample_store(tmp_path):
+    statuses = np.zeros(12, dtype=bool)
+    statuses[:9] = True
+    store = SampleStore.create(tmp_path, 'sample', xx=np.arange(12),
+                               yy=-np.arange(12), m_points=3, n_points=4,
+                               statuses=statuses)
+    assert store.shot.tolist() == statuses.tolist()
+    assert store.next_unshot() == 9
+    store.set_shot(9)
+    assert store.next_unshot() == 10
+    store.set_shot(2, False)
+    assert store.next_unshot() == 2
+    assert store.next_unshot(start=3) == 10
+    # snake-like ordering
+    assert store.index(1, 4) == 3
+    assert store.index(2, 4) == 4
+    assert store.target(4) == (2, 4)
+    assert store.target(11) == (3, 4)
+    for index in range(12):
+        assert store.index(*store.target(index)) == index
+    with pytest.raises(IndexError):
+        store.index(4, 1)
+    # the statuses are on disk
+    reopened = SampleStore(tmp_path, 'sample')
+    assert reopened.shot.tolist() == store.shot.tolist()
+    assert reopened.xx.tolist() == list(range(12))
+    store.reset()
+    assert not reopened.shot.any()
+    assert reopened.next_unshot() == 0
+
+
+def test_sample_store_yaml(fake_grid_stage, sample_file):
+    stage = fake_grid_stage
+    stage.load('test_sample')
+    assert stage.next_unshot_target() == (2, 4)
+    stage.set_status(2, 4, True)
+    assert stage.next_unshot_target() == (2, 3)
+    # the yaml file is only updated on export
+    with open(sample_file) as f:
+        yaml_dict = yaml.safe_load(f)
+    assert yaml_dict['test_sample']['xx'][4]['status'] is False
+    # but get_sample_data already has the new status
+    info = stage.get_sample_data('test_sample')
+    assert info['xx'][4]['status'] is True
+    # a new stage picks up the store on disk
+    other = make_fake_device(XYGridStage)(
+        x_motor=FastMotor(), y_motor=FastMotor(), m_points=5, n_points=5,
+        path=sample_file.parent)
+    other.load('test_sample')
+    assert other.is_target_shot(2, 4)
+
+    stage.export_statuses()
+    with open(sample_file) as f:
+        yaml_dict = yaml.safe_load(f)
+    assert [x['status'] for x in yaml_dict['test_sample']['xx']] == [
+        True, True, True, True, True, False, False, False]
+    assert yaml_dict['test_sample']['yy'][4]['status'] is True
+    # exporting doesn't throw away the store
+    assert stage.get_store() is stage.get_store()
+    # the store files don't show up as samples
+    assert stage.get_samples() == ['test_sample']
+
+
+def test_sample_store_benchmark(fake_grid_stage, tmp_path):
+    stage = fake_grid_stage
+    stage.m_n_points = 100, 100
+    stage.map_points(top_left=(0, 0), top_right=(10, 0),
+                     bottom_right=(10, -10), bottom_left=(0, -10))
+    stage.save_grid('big_sample', path=tmp_path)
+    stage.load('big_sample', path=tmp_path)
+    path = str(tmp_path / 'big_sample.yml')
+
+    start = time.perf_counter()
+    stage.get_store('big_sample', path)
+    import_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for m in range(1, 101):
+        for n in range(1, 101):
+            stage.set_status(m, n, True, 'big_sample', path)
+            stage.next_unshot_target('big_sample', path)
+    shot_time = time.perf_counter() - start
+    logger.info('100x100 grid: import %.3f s, 10000 shots %.3f s '
+                '(%.1f us per shot)', import_time, shot_time,
+                shot_time / 10000 * 1e6)
+    assert stage.next_unshot_target('big_sample', path) is None
+    # well within a 120 Hz budget per shot
+    assert shot_time / 10000 < 1 / 120 / 10
+
+
+@pytest.mark.parametrize(
+    'corners',
+    [((0, 0), (4, 0), (4, 4), (0, 4)),
+     ((0, 0), (4, -1), (5, 3), (1, 4)),
+     ((-20.59, 26.41), (-19.84, 26.40), (-19.43, 51.40), (-20.18, 51.41)),
+     ((0, 0), (10, 1), (9, 8), (-1, 9))],
+)
+def test_convert_to_logical(corners):
+    a_coeffs, b_coeffs = mesh_interpolation(*corners)
+    logic_x, logic_y = get_unit_meshgrid(m_rows=7, n_columns=5)
+    x, y = convert_to_physical(a_coeffs, b_coeffs, logic_x, logic_y)
+    res_x, res_y = convert_to_logical(a_coeffs, b_coeffs, x, y)
+    assert np.allclose(res_x, logic_x)
+    assert np.allclose(res_y, logic_y)
+    # scalars in, scalars out
+    res_x, res_y = convert_to_logical(a_coeffs, b_coeffs, x[1, 2], y[1, 2])
+    assert np.isclose(res_x, logic_x[1, 2])
+    assert np.isclose(res_y, logic_y[1, 2])
+
+
+def test_find_target(fake_grid_stage, tmp_path):
+    stage = fake_grid_stage
+    stage.m_n_points = 4, 3
+    xx, yy = stage.map_points(top_left=(0, 0), top_right=(2, 0.5),
+                              bottom_right=(2.5, -3), bottom_left=(0, -3.5))
+    for index, (x, y) in enumerate(zip(xx, yy)):
+        m, n = stage.find_target(x + 0.1, y - 0.1)
+        assert (m, n) == (index // 3 + 1,
+                          index % 3 + 1 if (index // 3) % 2 == 0
+                          else 3 - index % 3)
+        assert stage.compute_mapped_point(m, n) == pytest.approx((x, y))
+
+    stage.save_grid('sample', path=tmp_path)
+    path = str(tmp_path / 'sample.yml')
+    stage.set_status(1, 1, True, 'sample', path)
+    stage.set_status(2, 1, True, 'sample', path)
+    # closest to (1, 1) is itself, then (2, 1) which is also shot
+    assert stage.nearest_unshot_target(
+        0, 0, sample_name='sample', path=path) == (1, 2)
+    assert stage.nearest_unshot_target(
+        0, -1.2, sample_name='sample', path=path) == (2, 2)
+    for m in range(1, 5):
+        for n in range(1, 4):
+            stage.set_status(m, n, True, 'sample', path)
+    assert stage.nearest_unshot_target(
+        0, 0, sample_name='sample', path=path) is None
+
+
+def test_grid_mapping_benchmark(fake_grid_stage, tmp_path):
+    stage = fake_grid_stage
+    rows = columns = 1000
+    corners = dict(top_left=(0, 0), top_right=(100, 1),
+                   bottom_right=(99, -101), bottom_left=(-1, -100))
+
+    start = time.perf_counter()
+    xx, yy = stage.map_points(m_rows=rows, n_columns=columns, **corners)
+    map_time = time.perf_counter() - start
+    assert len(xx) == len(yy) == rows * columns
+
+    store = SampleStore.create(tmp_path, 'big', xx, yy, rows, columns)
+    stage.m_n_points = rows, columns
+    rng = np.random.default_rng(0)
+    targets = rng.integers(0, rows * columns, 1000)
+
+    start = time.perf_counter()
+    for index in targets:
+        m, n = stage.find_target(xx[index], yy[index])
+        assert store.index(m, n) == index
+    find_time = time.perf_counter() - start
+
+    # mark a 100x100 block of targets as shot around the middle
+    for m in range(451, 551):
+        for n in range(451, 551):
+            store.set_shot(store.index(m, n))
+    start = time.perf_counter()
+    store.nearest(0, 0)
+    tree_time = time.perf_counter() - start
+    x_mid, y_mid = xx[store.index(500, 500)], yy[store.index(500, 500)]
+    start = time.perf_counter()
+    for _ in range(100):
+        index, _ = store.nearest_unshot(x_mid, y_mid)
+    nearest_time = time.perf_counter() - start
+    assert not store.is_shot(index)
+    m, n = store.target(index)
+    assert m in (450, 551) or n in (450, 551)
+
+    logger.info('10^6 targets: map %.3f s, 1000 find_target %.4f s, '
+                'KD-tree build %.3f s, 100 nearest_unshot %.4f s',
+                map_time, find_time, tree_time, nearest_time)
+    assert find_time < 1
+    assert nearest_time < 5
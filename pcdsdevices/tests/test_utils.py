@@ -10,9 +10,10 @@ from ophyd import Device, Signal
 from .. import utils
 from ..device import GroupDevice
 from ..pv_positioner import PVPositionerDone
-from ..utils import (move_subdevices_to_start, post_ophyds_to_elog,
-                     reorder_components, set_many, set_standard_ordering,
-                     sort_components_by_kind, sort_components_by_name)
+from ..utils import (TaskScheduler, move_subdevices_to_start,
+                     post_ophyds_to_elog, reorder_components, schedule_task,
+                     set_many, set_standard_ordering, sort_components_by_kind,
+                     sort_components_by_name)
 
 try:
     import pty
@@ -288,3 +289,109 @@ def test_set_many():
     assert device.done.get() == 1
     assert device.setpoint.get() == 5
     assert device.another_signal.get() == 7
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def test_task_scheduler_order():
+    scheduler = TaskScheduler(name='test_scheduler_order')
+    ran = []
+    for delay in (0.06, 0.02, 0.04):
+        scheduler.schedule(lambda delay=delay: ran.append(delay), delay)
+    assert scheduler.depth == 3
+    assert wait_for(lambda: len(ran) == 3)
+    assert ran == [0.02, 0.04, 0.06]
+    metrics = scheduler.report()
+    assert metrics['depth'] == 0
+    assert metrics['max_depth'] == 3
+    assert metrics['executed'] == 3
+    assert 0 <= metrics['mean_lateness'] <= metrics['max_lateness']
+
+
+def test_task_scheduler_cancel_and_dedupe():
+    scheduler = TaskScheduler(name='test_scheduler_cancel')
+    ran = []
+    task = scheduler.schedule(lambda: ran.append('cancelled'), 0.02)
+    assert task.cancel()
+    assert not task.cancel()
+    first = scheduler.schedule(lambda: ran.append('once'), 0.02, key='once')
+    second = scheduler.schedule(lambda: ran.append('twice'), 0.02, key='once')
+    assert first is second
+    assert scheduler.deduplicated == 1
+    assert wait_for(lambda: first.done)
+    # Once it has run, the key can be used again
+    scheduler.schedule(lambda: ran.append('again'), 0, key='once')
+    assert wait_for(lambda: len(ran) == 2)
+    assert ran == ['once', 'again']
+    assert scheduler.cancelled == 1
+    assert not first.cancel()
+
+
+def test_task_scheduler_dedupe_earlier():
+    scheduler = TaskScheduler(name='test_scheduler_earlier')
+    ran = []
+    start = time.monotonic()
+    retry = scheduler.schedule(lambda: ran.append('retry'), 0.5, key='retry')
+    # A sooner request for the same task moves the pending one up
+    sooner = scheduler.schedule(lambda: ran.append('sooner'), 0.02,
+                                key='retry')
+    assert sooner is retry
+    assert wait_for(lambda: retry.done)
+    assert time.monotonic() - start < 0.4
+    # A later request does not push it back
+    later = scheduler.schedule(lambda: ran.append('later'), 0.02, key='later')
+    scheduler.schedule(lambda: ran.append('late'), 5, key='later')
+    assert wait_for(lambda: later.done)
+    # The entry left behind by moving the task up is skipped
+    time.sleep(max(0, 0.6 - (time.monotonic() - start)))
+    assert ran == ['retry', 'later']
+    assert scheduler.executed == 2
+    assert scheduler.depth == 0
+
+
+def test_schedule_task_dedupe():
+    ran = []
+
+    def task(value):
+        ran.append(value)
+
+    tasks = [schedule_task(task, args=(1,), delay=0.05) for _ in range(5)]
+    assert all(item is tasks[0] for item in tasks)
+    other = schedule_task(task, args=(2,), delay=0.05)
+    unhashable = schedule_task(task, args=([3],), delay=0.05)
+    repeat = schedule_task(task, args=(1,), delay=0.05, dedupe=False)
+    assert len({id(tasks[0]), id(other), id(unhashable), id(repeat)}) == 4
+    assert wait_for(lambda: len(ran) == 4)
+    assert sorted(ran, key=str) == [1, 1, 2, [3]]
+    assert schedule_task(task, args=(4,)) is None
+
+
+def test_schedule_task_benchmark():
+    count = 500
+    results = {}
+    for use_timer in (True, False):
+        ran = []
+        threads = threading.active_count()
+        start = time.perf_counter()
+        for num in range(count):
+            if use_timer:
+                # The previous implementation: one thread per task
+                threading.Timer(0.2, ran.append, args=(num,)).start()
+            else:
+                schedule_task(ran.append, args=(num,), delay=0.2)
+        extra_threads = threading.active_count() - threads
+        elapsed = time.perf_counter() - start
+        assert wait_for(lambda: len(ran) == count, timeout=10)
+        results[use_timer] = (elapsed, extra_threads)
+    logger.info('Scheduling %d delayed tasks: %.3fs and %d threads with '
+                'timers, %.3fs and %d threads with the shared scheduler',
+                count, *results[True], *results[False])
+    assert results[False][1] <= 1
+    assert results[False][0] < results[True][0]
+    report = utils.get_scheduler().report()
+    assert report['scheduled'] >= count
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import enum
+import heapq
 import inspect
+import itertools
 import logging
 import operator
 import select
@@ -232,7 +234,252 @@ def get_component(obj):
     return getattr(type(obj.parent), obj.attr_name, None)
 
 
-def schedule_task(func, args=None, kwargs=None, delay=None):
+class ScheduledTask:
+    """
+    Handle for a task queued on the `TaskScheduler`.
+
+    Parameters
+    ----------
+    callback : callable
+        The function to call, with no arguments.
+    due : float
+        The ``time.monotonic()`` time at which to call it.
+    key : hashable, optional
+        The key used to deduplicate identical pending tasks.
+    """
+
+    def __init__(self, callback: Callable, due: float, key=None):
+        self.callback = callback
+        self.due = due
+        self.key = key
+        self.cancelled = False
+        self.done = False
+        self._scheduler = None
+
+    def cancel(self) -> bool:
+        """
+        Stop the task from running, if it has not run yet.
+
+        Returns
+        -------
+        cancelled : bool
+            True if the task was pending and will no longer run.
+        """
+        if self._scheduler is None:
+            return False
+        return self._scheduler._cancel(self)
+
+    def __repr__(self):
+        state = ('cancelled' if self.cancelled
+                 else 'done' if self.done else 'pending')
+        return f'<ScheduledTask {self.callback!r} ({state})>'
+
+
+class TaskScheduler:
+    """
+    Run delayed tasks from one shared daemon thread.
+
+    Tasks are kept in a heap ordered by due time, so any number of pending
+    tasks costs one thread rather than one `threading.Timer` each. Tasks
+    should be quick, as in `schedule_task` where they only hand the real
+    work over to the ophyd dispatcher.
+
+    Pending tasks given the same ``key`` are deduplicated: scheduling one
+    again returns the handle of the task already queued, which is moved up
+    if the new request is due sooner.
+
+    Parameters
+    ----------
+    name : str, optional
+        The name of the scheduler thread.
+    """
+
+    #: Total number of tasks queued
+    scheduled: int
+    #: Number of tasks run
+    executed: int
+    #: Number of tasks cancelled before running
+    cancelled: int
+    #: Number of requests absorbed by an identical pending task
+    deduplicated: int
+    #: Most tasks pending at once
+    max_depth: int
+    #: Largest delay between a task's due time and its run, in seconds
+    max_lateness: float
+    #: Sum of those delays over all tasks run, in seconds
+    total_lateness: float
+
+    def __init__(self, name: str = 'pcdsdevices_scheduler'):
+        self.name = name
+        self._cond = threading.Condition()
+        self._heap = []
+        self._counter = itertools.count()
+        self._pending = {}
+        self._depth = 0
+        self._thread = None
+        self.scheduled = 0
+        self.executed = 0
+        self.cancelled = 0
+        self.deduplicated = 0
+        self.max_depth = 0
+        self.max_lateness = 0.0
+        self.total_lateness = 0.0
+
+    @property
+    def depth(self) -> int:
+        """The number of tasks waiting to run."""
+        return self._depth
+
+    @property
+    def mean_lateness(self) -> float:
+        """The average delay between a task's due time and its run."""
+        return self.total_lateness / self.executed if self.executed else 0.0
+
+    def schedule(self, callback: Callable, delay: float,
+                 key=None) -> ScheduledTask:
+        """
+        Call ``callback()`` from the scheduler thread after ``delay`` seconds.
+
+        Parameters
+        ----------
+        callback : callable
+            The function to call, with no arguments.
+        delay : float
+            The delay in seconds.
+        key : hashable, optional
+            If a task with the same key is already pending, do not queue
+            another one. The pending task runs at the earlier of the two
+            due times.
+
+        Returns
+        -------
+        task : ScheduledTask
+            The handle of the queued task, or of the matching pending task.
+        """
+        due = time.monotonic() + delay
+        with self._cond:
+            if key is not None:
+                pending = self._pending.get(key)
+                if pending is not None:
+                    self.deduplicated += 1
+                    if due < pending.due:
+                        # Re-queue it earlier, the old entry is skipped
+                        pending.due = due
+                        heapq.heappush(self._heap,
+                                       (due, next(self._counter), pending))
+                        if self._heap[0][2] is pending:
+                            self._cond.notify()
+                    return pending
+            task = ScheduledTask(callback, due, key=key)
+            task._scheduler = self
+            if key is not None:
+                self._pending[key] = task
+            heapq.heappush(self._heap, (task.due, next(self._counter), task))
+            self.scheduled += 1
+            self._depth += 1
+            self.max_depth = max(self.max_depth, self._depth)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run,
+                                                name=self.name, daemon=True)
+                self._thread.start()
+            elif self._heap[0][2] is task:
+                # The thread is waiting on a later task
+                self._cond.notify()
+        return task
+
+    def _cancel(self, task: ScheduledTask) -> bool:
+        with self._cond:
+            if task.cancelled or task.done:
+                return False
+            task.cancelled = True
+            self._release(task)
+            self.cancelled += 1
+            # Left in the heap and skipped when it comes up
+            return True
+
+    def _release(self, task: ScheduledTask) -> None:
+        self._depth -= 1
+        if task.key is not None and self._pending.get(task.key) is task:
+            del self._pending[task.key]
+
+    def _next_task(self) -> ScheduledTask:
+        """Wait for the next task that is due and take it off the heap."""
+        with self._cond:
+            while True:
+                # Skip cancelled tasks and entries left by moving a task up
+                while self._heap and (self._heap[0][2].cancelled
+                                      or self._heap[0][0] != self._heap[0][2].due):
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                timeout = self._heap[0][0] - time.monotonic()
+                if timeout > 0:
+                    self._cond.wait(timeout)
+                    continue
+                _, _, task = heapq.heappop(self._heap)
+                task.done = True
+                self._release(task)
+                lateness = time.monotonic() - task.due
+                self.executed += 1
+                self.total_lateness += lateness
+                self.max_lateness = max(self.max_lateness, lateness)
+                return task
+
+    def _run(self) -> None:
+        while True:
+            task = self._next_task()
+            try:
+                task.callback()
+            except Exception:
+                logger.exception('Error in scheduled task %s', task)
+
+    def report(self) -> dict[str, Number]:
+        """
+        Summarize the scheduler metrics.
+
+        Returns
+        -------
+        metrics : dict
+            Queue depth, task counts and lateness statistics.
+        """
+        with self._cond:
+            return dict(
+                depth=self._depth,
+                max_depth=self.max_depth,
+                scheduled=self.scheduled,
+                executed=self.executed,
+                cancelled=self.cancelled,
+                deduplicated=self.deduplicated,
+                mean_lateness=self.mean_lateness,
+                max_lateness=self.max_lateness,
+            )
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> TaskScheduler:
+    """Get the `TaskScheduler` shared by all calls to `schedule_task`."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = TaskScheduler()
+        return _scheduler
+
+
+def _task_key(func, args, kwargs):
+    """Key identifying identical tasks, or None if it is not hashable."""
+    key = (func, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def schedule_task(func, args=None, kwargs=None, delay=None, dedupe=True):
     """
     Use ophyd's dispatcher to schedule a task for later.
 
@@ -240,6 +487,16 @@ def schedule_task(func, args=None, kwargs=None, delay=None):
     Schedules a task for the utility thread if we're in some arbitrary thread,
     schedules a task for the same thread if we're in one of ophyd's callback
     queues already.
+
+    Delayed tasks wait on the shared `TaskScheduler` from `get_scheduler`.
+    By default, a delayed task is dropped if an identical one (the same
+    function, arguments and keyword arguments) is already waiting. The
+    waiting task runs at whichever due time is sooner.
+
+    Returns
+    -------
+    task : ScheduledTask or None
+        For delayed tasks, a handle that can cancel the task.
     """
     if args is None:
         args = ()
@@ -249,7 +506,7 @@ def schedule_task(func, args=None, kwargs=None, delay=None):
     dispatcher = ophyd.cl.get_dispatcher()
 
     # Check if we're already in an ophyd dispatcher thread
-    current_thread = threading.currentThread()
+    current_thread = threading.current_thread()
     matched_thread = None
     for name, thread in dispatcher.threads.items():
         if thread == current_thread:
@@ -268,10 +525,14 @@ def schedule_task(func, args=None, kwargs=None, delay=None):
     if delay is None:
         # Do it right away
         schedule()
-    else:
-        # Do it later
-        timer = threading.Timer(delay, schedule)
-        timer.start()
+        return None
+    # Do it later
+    key = None
+    if dedupe:
+        key = _task_key(func, tuple(args), kwargs)
+        if key is not None:
+            key = (matched_thread, key)
+    return get_scheduler().schedule(schedule, delay, key=key)
 
 
 def get_status_value(status_info, *keys, default_value="N/A"):